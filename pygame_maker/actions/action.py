@@ -1168,6 +1168,21 @@ class QuestionAction(Action):
     ]
     #: The full list of actions wrapped in this class
     HANDLED_ACTIONS = QUESTION_ACTIONS
+    QUESTION_ACTION_DATA_YAML = """
+actions:
+    if_collision_at_location:
+        apply_to: common_apply_to
+        position.x: common_position
+        position.y: common_position
+        collision_type: common_collision_type
+        relative: common_relative
+    if_object_at_location:
+        apply_to: common_apply_to
+        object: common_object
+        position.x: common_position
+        position.y: common_position
+        relative: common_relative
+"""
 
     def __init__(self, action_name, settings_dict=None, **kwargs):
         """
@@ -1185,7 +1200,7 @@ class QuestionAction(Action):
         if action_name not in self.HANDLED_ACTIONS:
             raise ActionException("QuestionAction: Unknown action '{}'".format(action_name))
         Action.__init__(self, action_name,
-                        "",
+                        self.QUESTION_ACTION_DATA_YAML,
                         settings, **kwargs)
 
 
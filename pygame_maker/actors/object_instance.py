@@ -11,6 +11,7 @@ import random
 import pygame
 import numpy as np
 from pygame_maker.actors.simple_object_instance import SimpleObjectInstance
+from pygame_maker.support.flat_tree import FlatTree
 import pygame_maker.events.event as event
 
 
@@ -31,6 +32,35 @@ def get_vector_xy_from_velocity(speed, direction):
     return np.array(xy_tuple)
 
 
+def find_boundary_hits(instances):
+    """
+    Test many instances against their room boundaries at once, the same way
+    :py:meth:`ObjectInstance._detect_boundary_events` tests one instance.
+
+    :param instances: The instances to test
+    :type instances: list
+    :return: Two boolean arrays, one entry per instance: the instances that
+        intersect a boundary, and the instances outside the room.  An
+        instance touching a boundary is only counted as intersecting it.
+    :rtype: (numpy.ndarray, numpy.ndarray)
+    """
+    if len(instances) == 0:
+        return np.zeros(0, dtype=bool), np.zeros(0, dtype=bool)
+    rects = np.array([tuple(inst.rect) + tuple(inst.screen_dims) for inst in instances])
+    xpos, ypos, width, height, room_width, room_height = rects.T
+    right = xpos + width
+    bottom = ypos + height
+    in_x_bounds = (right >= 0) & (xpos <= room_width)
+    in_y_bounds = (bottom >= 0) & (ypos <= room_height)
+    intersects = (((xpos <= 0) & (right >= 0)) |
+                  ((xpos <= room_width) & (right >= room_width) & in_y_bounds) |
+                  ((ypos <= 0) & (bottom >= 0)) |
+                  ((ypos <= room_height) & (ypos + width >= room_height) & in_x_bounds))
+    outside = (((xpos > room_width) | (right < 0) | (ypos > room_height) | (bottom < 0)) &
+               ~intersects)
+    return intersects, outside
+
+
 def get_velocity_from_xy(xcom, ycom):
     """
     Return speed and direction of motion, given an x, y vector starting from
@@ -130,6 +160,33 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
         "vspeed": 0.0,
         "subimage_number": 0,
     }
+    ACTION_METHODS = dict(SimpleObjectInstance.ACTION_METHODS)
+    ACTION_METHODS.update({
+        'set_velocity_compass': 'set_velocity_compass',
+        'move_toward_point': 'move_toward_point',
+        'set_horizontal_speed': 'set_horizontal_speed',
+        'set_vertical_speed': 'set_vertical_speed',
+        'if_collision_at_location': 'if_collision_at_location',
+        'if_object_at_location': 'if_object_at_location',
+        'destroy_instances_at_location': 'destroy_instances_at_location',
+    })
+    #: Actions whose position parameters name a place to search, instead of
+    #: a new position for the instance
+    LOCATION_ACTIONS = [
+        "if_collision_at_location",
+        "if_object_at_location",
+        "destroy_instances_at_location",
+    ]
+    #: Motion actions that :py:meth:`execute_batch_action` can apply to many
+    #: instances at once, mapped to the methods that calculate them
+    BATCH_ACTION_METHODS = {
+        'set_velocity_compass': '_batch_set_velocity_compass',
+        'move_toward_point': '_batch_move_toward_point',
+        'set_horizontal_speed': '_batch_set_horizontal_speed',
+        'set_vertical_speed': '_batch_set_vertical_speed',
+        'reverse_horizontal_speed': '_batch_reverse_horizontal_speed',
+        'reverse_vertical_speed': '_batch_reverse_vertical_speed',
+    }
 
     def __init__(self, kind, screen_dims, new_id, settings=None, **kwargs):
         """
@@ -178,8 +235,10 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
         self._visible = False
         self.visible = kind.visible
         self.source_rect = pygame.Rect(0, 0, 0, 0)
-        # Get a copy of the selected subimage and its collision mask (and a
-        # radius, if the disk collision mask was selected)
+        # True once this instance has its own copy of the subimage
+        self._own_image = False
+        # Get the selected subimage and its collision mask (and a radius, if
+        # the disk collision mask was selected)
         self.set_subimage()
         self.blendmode = 0
         # use the instance type's 'depth' parameter as the layer for this
@@ -187,14 +246,32 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
         self.layer = kind.depth
 
         self.start_position = tuple(self.position)
-        self.action_name_to_method_map.update({
-            'set_velocity_compass': self.set_velocity_compass,
-            'move_toward_point': self.move_toward_point,
-            'set_horizontal_speed': self.set_horizontal_speed,
-            'set_vertical_speed': self.set_vertical_speed,
-        })
         # print("{}".format(self))
 
+    def reset(self, screen_dims, new_id, settings=None, **kwargs):
+        """
+        Return a destroyed instance to the state of a new one, so its object
+        type can reuse it instead of creating another instance.
+
+        :param screen_dims: Width, height of the surface this instance will be
+            drawn to
+        :type screen_dims: [int, int]
+        :param new_id: A unique integer ID for this instance
+        :type new_id: int
+        :param settings: Attribute settings, as for :py:meth:`__init__`
+        :type settings: None or dict
+        :param kwargs: Attribute settings, as for :py:meth:`__init__`
+        """
+        self._delay_motion_updates = False
+        SimpleObjectInstance.reset(self, screen_dims, new_id, settings, **kwargs)
+        self.dirty = 0
+        self._visible = False
+        self.visible = self.kind.visible
+        self.set_subimage()
+        self.blendmode = 0
+        self.layer = self.kind.depth
+        self.start_position = tuple(self.position)
+
     @property
     def visible(self):
         """Get and set the instance's visibility."""
@@ -233,10 +310,12 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
         """
         Get and set direction of motion in degrees, between 0.0 and 360.0.
         """
+        self._sync_motion()
         return self.symbols['direction']
 
     @direction.setter
     def direction(self, value):
+        self._sync_motion()
         new_value = value
         if new_value >= 360.0:
             new_value %= 360.0
@@ -251,10 +330,12 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
     @property
     def speed(self):
         """Get and set speed of motion in pixels (or fractions) per frame."""
+        self._sync_motion()
         return self.symbols['speed']
 
     @speed.setter
     def speed(self, value):
+        self._sync_motion()
         self.symbols['speed'] = value
         if not self._delay_motion_updates:
             self._change_motion_x_y()
@@ -264,28 +345,34 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
         """
         Get and set magnitude of friction applied against motion each frame.
         """
+        self._sync_motion()
         return self.symbols['friction']
 
     @friction.setter
     def friction(self, value):
+        self._sync_motion()
         self.symbols['friction'] = float(value)
 
     @property
     def gravity(self):
         """Get and set magnitude of gravity applied each frame."""
+        self._sync_motion()
         return self.symbols['gravity']
 
     @gravity.setter
     def gravity(self, value):
+        self._sync_motion()
         self.symbols['gravity'] = float(value)
 
     @property
     def gravity_direction(self):
         """Get and set direction gravity pulls the instance in degrees."""
+        self._sync_motion()
         return self.symbols['gravity_direction']
 
     @gravity_direction.setter
     def gravity_direction(self, value):
+        self._sync_motion()
         new_value = value
         if new_value >= 360.0:
             new_value %= 360.0
@@ -298,10 +385,12 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
     @property
     def hspeed(self):
         """Get and set horizontal speed."""
+        self._sync_motion()
         return self.symbols['hspeed']
 
     @hspeed.setter
     def hspeed(self, value):
+        self._sync_motion()
         # skip setting motion x,y and hspeed, vspeed
         self._delay_motion_updates = True
         self.speed, self.direction = get_velocity_from_xy(value,
@@ -312,10 +401,12 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
     @property
     def vspeed(self):
         """Get and set vertical speed."""
+        self._sync_motion()
         return self.symbols['vspeed']
 
     @vspeed.setter
     def vspeed(self, value):
+        self._sync_motion()
         # skip setting motion x,y and hspeed, vspeed
         self._delay_motion_updates = True
         self.speed, self.direction = get_velocity_from_xy(self.hspeed,
@@ -346,7 +437,7 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
                      self.rect.y + self.rect.height / 2.0)
         return center_xy
 
-    def update(self):
+    def update(self, defer_boundary_events=False):
         """
         Move the instance from its current position.
 
@@ -354,26 +445,36 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
         events for boundary collisions or outside-of-room positions.  Make
         friction and/or gravity changes to speed and/or direction for the next
         update().
+
+        :param defer_boundary_events: If True and this instance has no
+            children, leave boundary and outside-of-room events to the
+            caller, which can test many instances at once
+        :type defer_boundary_events: bool
+        :return: True if the caller should look for boundary events for this
+            instance, False otherwise
+        :rtype: bool
         """
         self.debug("update():")
         event_queued = None
+        moved = False
         if self in self.kind.instance_delete_list:
             # save time detecting events for instances that have already been
             # destroyed this frame
-            return
+            return False
+        defer_boundary_events = (defer_boundary_events and
+                                 len(self.symbols["children"]) == 0)
         # child instances do not use any of the 'speed' parameters, since
         # they are placed relative to their parent instance
         if self.symbols["parent"] is None and self.speed > 0.0:
-            self.position[0] += self.symbols['hspeed']
-            self.position[1] += self.symbols['vspeed']
-            self.rect.x = int(math.floor(self.position[0] + 0.5))
-            self.rect.y = int(math.floor(self.position[1] + 0.5))
-            event_queued = self._detect_boundary_events()
+            self.move_position(self.symbols['hspeed'], self.symbols['vspeed'])
+            moved = True
+            if not defer_boundary_events:
+                event_queued = self._detect_boundary_events()
             self.debug("  {} inst {} new position: {} ({})".
                        format(self.kind.name, self.inst_id, self.position, self.rect))
         # ultimate parent will update all descendants
-        if self.symbols["parent"] is None:
-            event_names_queued = self._update_child_instances(event_queued)
+        if self.symbols["parent"] is None and len(self.symbols["children"]) > 0:
+            event_names_queued = self._update_descendants(moved, event_queued)
             # transmit all events at the end
             sorted_event_name_list = list(event_names_queued)
             sorted_event_name_list.sort()
@@ -390,9 +491,11 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
             self.debug("  {} inst {} transmitting {} event".format(self.kind.name,
                                                                    self.inst_id, event_queued))
             self.game_engine.event_engine.transmit_event(event_queued.name)
+        return moved and defer_boundary_events
 
     def _detect_boundary_events(self):
-        # check for boundary collisions
+        # check for boundary collisions, and return the event to queue for
+        #  them (if any); the caller queues it, after any descendants' events
         # allow boundary collisions for objects completely outside
         #  the other dimension's boundaries to be ignored; this
         #  makes intersect_boundary and outside_room mutually exclusive
@@ -426,58 +529,78 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
             if event_queued is None:
                 event_queued = event.OtherEvent("outside_room", {"type": self.kind,
                                                                  "instance": self})
-        if event_queued is not None:
-            self.game_engine.event_engine.queue_event(event_queued)
         return event_queued
 
-    def _update_child_instances(self, parent_event_queued):
-        # update any child instances' positions based on this one's position
+    def _update_descendants(self, moved, root_event):
+        # Place the descendants of this root instance relative to their
+        #  parents, in one pass over the flattened hierarchy.  Only the
+        #  subtrees below a moved instance are placed: all of them if this
+        #  instance moved by its speed or had its position set, otherwise
+        #  those below descendants whose position was set.  The placed
+        #  descendants are tested against the room boundaries together;
+        #  queue their boundary events, and the parent_* and child_* events
+        #  that go with them.  Return the names of the queued events.
+        if self._flat_tree is None:
+            self._flat_tree = FlatTree(self, lambda inst: inst.symbols["children"])
+            moved = True
+        if self in self._moved_descendants:
+            # this root's position was set, or moved without its speed
+            moved = True
+        tree = self._flat_tree
+        if moved:
+            indices = np.arange(1, len(tree))
+        elif len(self._moved_descendants) > 0:
+            indices = tree.get_subtree_indices(self._moved_descendants)
+        else:
+            return set()
+        self._moved_descendants.clear()
+        items = tree.items
+        parents = tree.parents
+        # parents come before their children, so each parent is already in
+        #  place
+        for idx in indices:
+            child_inst = items[idx]
+            parent_rect = items[parents[idx]].rect
+            position = child_inst.position
+            child_inst.rect.x = parent_rect.x + position[0]
+            child_inst.rect.y = parent_rect.y + position[1]
+        placed = [items[idx] for idx in indices]
+        intersects, outside = find_boundary_hits(placed)
+        # the boundary event name found for each instance in the tree
+        event_names = [None] * len(tree)
+        if root_event is not None:
+            event_names[0] = root_event.name
         event_names_queued = set()
-        new_event = None
-        #pylint: disable=not-an-iterable
-        for child_inst in self.symbols["children"]:
-            #pylint: enable=not-an-iterable
+        event_engine = self.game_engine.event_engine
+        for pos, idx in enumerate(indices):
+            child_inst = items[idx]
+            parent_inst = items[parents[idx]]
             # pass on parent events (if any)
-            if parent_event_queued is not None:
-                new_event = None
-                if parent_event_queued.name == "outside_room":
-                    ev_name = "parent_outside_room"
-                    event_names_queued.add(ev_name)
-                    new_event = event.OtherEvent(ev_name, {"type": child_inst.kind,
-                                                           "instance": child_inst,
-                                                           "parent_type": self.kind})
-                elif parent_event_queued.name == "intersect_boundary":
-                    ev_name = "parent_intersect_boundary"
-                    event_names_queued.add(ev_name)
-                    new_event = event.OtherEvent(ev_name, {"type": child_inst.kind,
-                                                           "instance": child_inst,
-                                                           "parent_type": self.kind})
-                self.game_engine.event_engine.queue_event(new_event)
-            # set child x and y relative to parent x and y
-            child_inst.rect.x = self.rect.x + child_inst.position[0]
-            child_inst.rect.y = self.rect.y + child_inst.position[1]
-            # perform boundary checks on child instance
-            child_event_queued = None
-            if hasattr(child_inst, "_detect_boundary_events"):
-                child_event_queued = child_inst._detect_boundary_events()
-            if child_event_queued is not None:
-                event_names_queued.add(child_event_queued.name)
-                self.debug("bounds {} event in child {}".
-                           format(child_event_queued.name, child_inst))
-                if child_event_queued.name == "outside_room":
-                    ev_name = "child_outside_room"
-                    event_names_queued.add(ev_name)
-                    new_event = event.OtherEvent(ev_name, {"type": self.kind,
-                                                           "instance": self,
-                                                           "child_type": child_inst.kind})
-                elif child_event_queued.name == "intersect_boundary":
-                    ev_name = "child_intersect_boundary"
-                    event_names_queued.add(ev_name)
-                    new_event = event.OtherEvent(ev_name, {"type": self.kind,
-                                                           "instance": self,
-                                                           "child_type": child_inst.kind})
-                self.game_engine.event_engine.queue_event(new_event)
-            event_names_queued |= child_inst._update_child_instances(child_event_queued)
+            parent_event_name = event_names[parents[idx]]
+            if parent_event_name is not None:
+                ev_name = "parent_{}".format(parent_event_name)
+                event_names_queued.add(ev_name)
+                event_engine.queue_event(event.OtherEvent(ev_name, {"type": child_inst.kind,
+                                                                    "instance": child_inst,
+                                                                    "parent_type": parent_inst.kind}))
+            if not isinstance(child_inst, ObjectInstance):
+                continue
+            if intersects[pos]:
+                child_event_name = "intersect_boundary"
+            elif outside[pos]:
+                child_event_name = "outside_room"
+            else:
+                continue
+            self.debug("bounds {} event in child {}".format(child_event_name, child_inst))
+            event_names[idx] = child_event_name
+            event_names_queued.add(child_event_name)
+            event_engine.queue_event(event.OtherEvent(child_event_name, {"type": child_inst.kind,
+                                                                         "instance": child_inst}))
+            ev_name = "child_{}".format(child_event_name)
+            event_names_queued.add(ev_name)
+            event_engine.queue_event(event.OtherEvent(ev_name, {"type": parent_inst.kind,
+                                                                "instance": parent_inst,
+                                                                "child_type": child_inst.kind}))
         return event_names_queued
 
     def _apply_gravity(self):
@@ -500,6 +623,7 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
         """
         subimage_info = self.kind.get_image(self.symbols["subimage_number"])
         self.image, self.mask, self.source_rect, radius = subimage_info
+        self._own_image = False
         if self.image is not None:
             self.debug("Setting subimage {}".format(self.symbols["subimage_number"]))
             image_rect = self.image.get_rect()
@@ -509,6 +633,22 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
                 # disk collision type; get the predefined radius for collisions
                 self.radius = radius
 
+    def get_writable_image(self):
+        """
+        Return an image that can be changed (e.g. recolored or transformed)
+        without affecting other instances.  The subimage is shared by all
+        instances showing it, so it is copied the first time this is called.
+        Changing the subimage number returns to the shared subimage.
+
+        :return: This instance's own copy of its image, or None if the
+            instance has no image
+        :rtype: None | :py:class:`pygame.Surface`
+        """
+        if (self.image is not None) and not self._own_image:
+            self.image = self.image.copy()
+            self._own_image = True
+        return self.image
+
     def aim_toward_point(self, pointxy):
         """
         Change the direction of motion toward a given point.
@@ -613,10 +753,253 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
                 new_vspeed += self.vspeed
             self.vspeed = new_vspeed
 
+    @classmethod
+    def can_batch_action(cls, action):
+        """
+        Report whether :py:meth:`execute_batch_action` can apply an action to
+        many instances at once.  Only the motion actions in
+        :py:attr:`BATCH_ACTION_METHODS` qualify, and only when none of their
+        parameters are expressions, which are calculated for each instance.
+
+        :param action: The action to check
+        :type action: :py:class:`~pygame_maker.actions.action.Action`
+        :return: True if the action can be applied in a batch, False
+            otherwise
+        :rtype: bool
+        """
+        if action.name not in cls.BATCH_ACTION_METHODS:
+            return False
+        for value in action.action_data.values():
+            if isinstance(value, str) and (len(value) > 0) and (value[0] == '='):
+                return False
+        if action.name in ("set_velocity_compass", "move_toward_point"):
+            # relative speeds are added up differently by these actions'
+            #  methods and execute_action()
+            if action.action_data.get("relative", False):
+                return False
+        if action.name == "set_velocity_compass":
+            compass_directions = action.action_data["compass_directions"]
+            if compass_directions != "NONE":
+                for compass_name in compass_directions.split('|'):
+                    if compass_name not in action.COMPASS_DIRECTION_DEGREES:
+                        return False
+        elif action.name == "move_toward_point":
+            if "speed" not in action.action_data:
+                return False
+        return True
+
+    @classmethod
+    def execute_batch_action(cls, instances, action):
+        """
+        Apply a motion action to many instances at once, leaving them in the
+        same state as calling each instance's :py:meth:`execute_action`.
+        The action's parameters are read once, and the instances' new speeds
+        and directions are calculated together in NumPy arrays.  Check the
+        action with :py:meth:`can_batch_action` first.
+
+        :param instances: The instances the action applies to
+        :type instances: list
+        :param action: The Action instance to apply
+        :type action: :py:class:`~pygame_maker.actions.action.Action`
+        """
+        for inst in instances:
+            inst.kind.wake_instance(inst)
+            inst._sync_symbols()
+        motion = np.array([(inst.symbols['speed'], inst.symbols['direction'],
+                            inst.symbols['hspeed'], inst.symbols['vspeed'])
+                           for inst in instances], dtype=float).T
+        speed, direction, hspeed, vspeed = getattr(cls, cls.BATCH_ACTION_METHODS[action.name])(
+            instances, action, motion)
+        # parameters that aren't instance properties are kept as symbols
+        symbol_params = [(param, value) for param, value in action.action_data.items()
+                         if ((param not in ("apply_to", "relative")) and
+                             not hasattr(instances[0], param.split('.')[0]))]
+        if (action.name == "set_velocity_compass") and ("apply_to" in action.action_data):
+            # set_velocity_compass() keeps the apply_to parameter, too
+            symbol_params.append(("apply_to", action.action_data["apply_to"]))
+        for idx, inst in enumerate(instances):
+            symbols = inst.symbols
+            symbols['speed'] = speed[idx]
+            symbols['direction'] = direction[idx]
+            symbols['hspeed'] = hspeed[idx]
+            symbols['vspeed'] = vspeed[idx]
+            for param, value in symbol_params:
+                symbols[param] = value
+
+    @staticmethod
+    def _get_batch_vectors(speed, direction):
+        # The vectorised form of get_vector_xy_from_velocity()
+        radians = direction / 180.0 * math.pi
+        return speed * np.sin(radians), speed * -1 * np.cos(radians)
+
+    @staticmethod
+    def _get_batch_directions(xcom, ycom):
+        # The vectorised form of direction_from_a_to_b(), with the result
+        #  kept between 0 and 360 like the direction property does
+        direction = (np.arctan2(ycom, xcom) * 180) / math.pi
+        return np.where(direction < 0.0, direction + 360.0, direction)
+
+    @classmethod
+    def _batch_set_velocity_compass(cls, instances, action, motion):
+        # Pick a compass direction for each instance, as
+        #  set_velocity_compass() does
+        speed, direction = motion[0], np.zeros(len(instances))
+        if "speed" in action.action_data:
+            speed = np.full(len(instances), float(action.action_data["speed"]))
+        compass_directions = action.action_data["compass_directions"]
+        if compass_directions != "NONE":
+            degrees = np.array([action.COMPASS_DIRECTION_DEGREES[compass_name]
+                                for compass_name in compass_directions.split('|')],
+                               dtype=float)
+            # draw from the random module, in instance order, just as each
+            #  instance's set_velocity_compass() would
+            choices = np.zeros(len(instances), dtype=int)
+            if len(degrees) > 1:
+                choices = np.array([random.randint(0, len(degrees) - 1) for _ in instances])
+            direction = degrees[choices]
+        return (speed, direction) + cls._get_batch_vectors(speed, direction)
+
+    @classmethod
+    def _batch_move_toward_point(cls, instances, action, motion):
+        # Aim each instance at the destination, as move_toward_point() does
+        speed = np.full(len(instances), float(action.action_data["speed"]))
+        direction = motion[1]
+        if "destination" in action.action_data:
+            destination = action.action_data["destination"]
+            centers = np.array([inst.get_center_point() for inst in instances], dtype=float)
+            direction = cls._get_batch_directions(destination[0] - centers[:, 0],
+                                                  destination[1] - centers[:, 1])
+        return (speed, direction) + cls._get_batch_vectors(speed, direction)
+
+    @classmethod
+    def _batch_set_horizontal_speed(cls, instances, action, motion):
+        # Replace the horizontal speed, as set_horizontal_speed() does
+        compass_name = action.action_data["horizontal_direction"]
+        if compass_name not in action.HORIZONTAL_DIRECTIONS:
+            return motion
+        new_hspeed = get_vector_xy_from_velocity(
+            float(action.action_data["horizontal_speed"]),
+            action.COMPASS_DIRECTION_DEGREES[compass_name])[0]
+        hspeed, vspeed = np.full(len(instances), new_hspeed), motion[3]
+        if action.action_data.get("relative", False):
+            hspeed += motion[2]
+        return (np.sqrt(hspeed**2 + vspeed**2), cls._get_batch_directions(hspeed, vspeed),
+                hspeed, vspeed)
+
+    @classmethod
+    def _batch_set_vertical_speed(cls, instances, action, motion):
+        # Replace the vertical speed, as set_vertical_speed() does
+        compass_name = action.action_data["vertical_direction"]
+        if compass_name not in action.VERTICAL_DIRECTIONS:
+            return motion
+        new_vspeed = get_vector_xy_from_velocity(
+            float(action.action_data["vertical_speed"]),
+            action.COMPASS_DIRECTION_DEGREES[compass_name])[1]
+        hspeed, vspeed = motion[2], np.full(len(instances), new_vspeed)
+        if action.action_data.get("relative", False):
+            vspeed += motion[3]
+        return (np.sqrt(hspeed**2 + vspeed**2), cls._get_batch_directions(hspeed, vspeed),
+                hspeed, vspeed)
+
+    @classmethod
+    def _batch_reverse_horizontal_speed(cls, instances, action, motion):
+        # Mirror each direction across the vertical axis
+        speed, direction = motion[0], (360.0 - motion[1]) % 360.0
+        return (speed, direction) + cls._get_batch_vectors(speed, direction)
+
+    @classmethod
+    def _batch_reverse_vertical_speed(cls, instances, action, motion):
+        # Mirror each direction across the horizontal axis
+        speed, direction = motion[0], (540.0 - motion[1]) % 360.0
+        return (speed, direction) + cls._get_batch_vectors(speed, direction)
+
+    def _get_action_location(self, action):
+        # Collect the position.x and position.y parameters from a location
+        #  action, offset by this instance's position if relative is set.
+        location = [0, 0]
+        for idx, param in enumerate(("position.x", "position.y")):
+            if param in action.action_data:
+                location[idx] = action.get_parameter_expression_result(
+                    param, self.symbols, self.game_engine.language_engine)
+        if action.action_data.get("relative", False):
+            #pylint: disable=no-member
+            location[0] += self.position.x
+            location[1] += self.position.y
+            #pylint: enable=no-member
+        return (int(math.floor(location[0] + 0.5)), int(math.floor(location[1] + 0.5)))
+
+    def _get_instances_placed_at(self, location, object_types=None):
+        # Find the other instances this instance would overlap if it were
+        #  moved to location.
+        if self.mask is None:
+            found = self.game_engine.get_instances_at_point(location, object_types)
+        else:
+            found = self.game_engine.get_instances_overlapping_mask(self.mask, location,
+                                                                    object_types)
+        return [inst for inst in found if inst is not self]
+
+    def if_collision_at_location(self, action):
+        """
+        Handle the if_collision_at_location action.
+
+        The action's result is True if this instance would collide with
+        another instance if it were moved to the location.  Set the
+        ``collision_type`` parameter to "any" to include instances of object
+        types that aren't solid.
+
+        :param action: The Action instance that triggered this method
+        :type action: :py:class:`~pygame_maker.actions.action.Action`
+        """
+        self.debug("if_collision_at_location(action={}):".format(action))
+        location = self._get_action_location(action)
+        found = self._get_instances_placed_at(location)
+        if action.action_data["collision_type"] != "any":
+            found = [inst for inst in found if getattr(inst.kind, "solid", False)]
+        action.action_result = (len(found) > 0)
+
+    def if_object_at_location(self, action):
+        """
+        Handle the if_object_at_location action.
+
+        The action's result is True if this instance would overlap an
+        instance of the object type named in the ``object`` parameter if it
+        were moved to the location.
+
+        :param action: The Action instance that triggered this method
+        :type action: :py:class:`~pygame_maker.actions.action.Action`
+        """
+        self.debug("if_object_at_location(action={}):".format(action))
+        location = self._get_action_location(action)
+        object_name = action.get_parameter_expression_result(
+            "object", self.symbols, self.game_engine.language_engine)
+        found = self._get_instances_placed_at(location, [object_name])
+        action.action_result = (len(found) > 0)
+
+    def destroy_instances_at_location(self, action):
+        """
+        Handle the destroy_instances_at_location action.
+
+        Destroy every instance with a collision mask pixel at the location.
+
+        :param action: The Action instance that triggered this method
+        :type action: :py:class:`~pygame_maker.actions.action.Action`
+        """
+        self.debug("destroy_instances_at_location(action={}):".format(action))
+        location = self._get_action_location(action)
+        for inst in self.game_engine.get_instances_at_point(location):
+            # destroying a parent also destroys its children
+            if inst not in inst.kind.instance_delete_list:
+                inst.destroy_object(action)
+
     def execute_action(self, action, an_event):
         """
         Perform an action in an action sequence, in response to an event.
 
+        Action parameters that match instance properties are applied to the
+        instance afterward, except for the :py:attr:`LOCATION_ACTIONS`: their
+        position and relative parameters name the place to search, so they
+        never move the instance.
+
         :param action: The Action instance that triggered this method
         :type action: :py:class:`~pygame_maker.actions.action.Action`
         :param an_event: The Event instance that triggered this method
@@ -659,7 +1042,10 @@ class ObjectInstance(SimpleObjectInstance, pygame.sprite.DirtySprite):
             else:
                 self.debug("  {} inst {} execute_action {} fell through..".
                            format(self.kind.name, self.inst_id, action.name))
-        self._apply_kwargs(action_params)
+        # a location action's position is the place searched, not a new
+        #  position for this instance
+        if action.name not in self.LOCATION_ACTIONS:
+            self._apply_kwargs(action_params)
 
     def __repr__(self):
         return ("<{} {:03d} @ {} dir {} speed {}>".
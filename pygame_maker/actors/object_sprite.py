@@ -8,22 +8,70 @@ implement pygame_maker sprite resource (not the same as a pygame Sprite;
 """
 
 import re
+import os
 import os.path
 import math
+import hashlib
+import tempfile
+import zipfile
+import numpy as np
 import pygame
 import yaml
 
 
+def get_surface_mask_bits(surface, threshold=127):
+    """
+    Find the pixels of a pygame.Surface that belong in its precise mask.
+
+    A pixel belongs in the mask if it has an alpha value greater than
+    threshold (for a surface without a color key), or if it doesn't match
+    the surface's color key.
+
+    :param surface: The drawing surface to examine
+    :type surface: :py:class:`pygame.Surface`
+    :param threshold: The minimum alpha value for a pixel on the Surface to
+        appear in the mask (ignored if the surface has a color key)
+    :type threshold: int
+    :return: An array of booleans indexed by [column, row], True for pixels
+        in the mask
+    :rtype: :py:class:`numpy.ndarray`
+    """
+    key = surface.get_colorkey()
+    alpha = pygame.surfarray.array_alpha(surface)
+    if key:
+        rgb = pygame.surfarray.array3d(surface)
+        return ((rgb[..., 0] != key[0]) | (rgb[..., 1] != key[1]) | (rgb[..., 2] != key[2]) |
+                (alpha != key[3]))
+    return alpha > threshold
+
+def mask_from_bits(mask_bits):
+    """
+    Create a mask from an array of pixels that belong in it.
+
+    :param mask_bits: An array indexed by [column, row], nonzero for pixels
+        in the mask
+    :type mask_bits: :py:class:`numpy.ndarray`
+    :return: The new mask
+    :rtype: :py:class:`pygame.mask.Mask`
+    """
+    if mask_bits.size == 0:
+        return pygame.mask.Mask(mask_bits.shape)
+    # let pygame set the mask bits from an 8-bit surface whose color key is
+    #  pixel value 0
+    bits_surface = pygame.surfarray.make_surface(mask_bits.astype(np.uint8))
+    bits_surface.set_colorkey(0)
+    return pygame.mask.from_surface(bits_surface)
+
 def mask_from_surface(surface, threshold=127):
     """
     Create a precise mask of a pygame.Surface's pixels.
 
     Set a mask pixel if the corresponding surface's pixel has an alpha value
     greater than threshold (for a surface with an alpha channel), or if the
-    pixel doesn't match the surface's color key.  Borrowed from pygame's
-    mask.py demo code. For some reason, this works and
-    :py:func:`pygame.mask.from_surface` doesn't for the sample image used in
-    the unit test for object_type.
+    pixel doesn't match the surface's color key.  The pixels are found by
+    :py:func:`get_surface_mask_bits` and converted into a mask by
+    :py:func:`mask_from_bits`, so a surface's color key and alpha channel are
+    tested by the same rules whatever its pixel format.
 
     :param surface: The drawing surface to create a mask from
     :type surface: :py:class:`pygame.Surface`
@@ -33,19 +81,7 @@ def mask_from_surface(surface, threshold=127):
     :return: The mask created from the surface
     :rtype: :py:class:`pygame.mask.Mask`
     """
-    mask = pygame.mask.Mask(surface.get_size())
-    key = surface.get_colorkey()
-    if key:
-        for row in range(surface.get_height()):
-            for col in range(surface.get_width()):
-                if surface.get_at((col, row)) != key:
-                    mask.set_at((col, row), 1)
-    else:
-        for row in range(surface.get_height()):
-            for col in range(surface.get_width()):
-                if surface.get_at((col, row))[3] > threshold:
-                    mask.set_at((col, row), 1)
-    return mask
+    return mask_from_bits(get_surface_mask_bits(surface, threshold))
 
 def create_rectangle_mask(orig_rect):
     """
@@ -69,23 +105,18 @@ def create_rectangle_mask(orig_rect):
     mask.fill()
     return mask
 
-def create_disk_mask(orig_rect, radius):
+def get_disk_mask_bits(orig_rect, radius):
     """
-    Create a circular mask that covers the opaque pixels of an object.
-
-    Normally, collisions between objects with collision_type "disk" will
-    use the circle collision test, which only needs the radius attribute.
-    The mask is created in the event this object collides with an object
-    that has a different collision_type, in which case the objects fall
-    back to using a mask collision test.  The assumption is that the user
-    wants a simple collision model, so the mask is made from a circle of
-    the right radius, instead of creating an exact mask from the opaque
-    pixels in the image.
+    Find the pixels of a circular mask, as created by
+    :py:func:`create_disk_mask`.
 
     :param orig_rect: The Rect from the image
     :type orig_rect: :py:class:`pygame.Rect`
     :param radius: The radius of the disk mask
     :type radius: int
+    :return: An array of booleans indexed by [column, row], True for pixels
+        in the mask
+    :rtype: :py:class:`numpy.ndarray`
     """
     # create a disk mask with a radius sufficient to cover the
     #  opaque pixels
@@ -102,10 +133,29 @@ def create_disk_mask(orig_rect, radius):
     disk_mask_surface.set_colorkey(pygame.Color("#000000"))
     disk_mask_surface.fill(pygame.Color("#000000"))
     pygame.draw.circle(disk_mask_surface, pygame.Color("#ffffff"), disk_mask_center, radius)
-    mask = mask_from_surface(disk_mask_surface)
-    return mask
+    return get_surface_mask_bits(disk_mask_surface)
+
+def create_disk_mask(orig_rect, radius):
+    """
+    Create a circular mask that covers the opaque pixels of an object.
+
+    Normally, collisions between objects with collision_type "disk" will
+    use the circle collision test, which only needs the radius attribute.
+    The mask is created in the event this object collides with an object
+    that has a different collision_type, in which case the objects fall
+    back to using a mask collision test.  The assumption is that the user
+    wants a simple collision model, so the mask is made from a circle of
+    the right radius, instead of creating an exact mask from the opaque
+    pixels in the image.
+
+    :param orig_rect: The Rect from the image
+    :type orig_rect: :py:class:`pygame.Rect`
+    :param radius: The radius of the disk mask
+    :type radius: int
+    """
+    return mask_from_bits(get_disk_mask_bits(orig_rect, radius))
 
-def get_disk_radius(precise_mask, orig_rect, bound_rect):
+def get_disk_radius(precise_mask, orig_rect, bound_rect, mask_bits=None):
     """
     Calculate the radius of a circle that covers the opaque pixels in
     precise_mask.
@@ -118,6 +168,9 @@ def get_disk_radius(precise_mask, orig_rect, bound_rect):
     :type orig_rect: :py:class:`pygame.Rect`
     :param bound_rect: The bounding Rect for the image
     :type bound_rect: :py:class:`pygame.Rect`
+    :param mask_bits: The pixels set in precise_mask, as returned by
+        :py:func:`get_surface_mask_bits`, if they're already known
+    :type mask_bits: None | :py:class:`numpy.ndarray`
     """
     # find the radius of a circle that contains bound_rect for the worst
     #  case
@@ -129,14 +182,23 @@ def get_disk_radius(precise_mask, orig_rect, bound_rect):
     max_bound_radius = math.sqrt(max(left_center_distance, right_center_distance)**2 +
                                  max(top_center_distance, bottom_center_distance)**2)
     # determine whether a smaller radius could be used (i.e.
-    #  no corner pixels within the bounding rect are set)
+    #  no corner pixels within the bounding rect are set); the pixels
+    #  searched start at the bounding rect's corner, and end at its width
+    #  and height
+    cols = range(bound_rect.x, bound_rect.width)
+    rows = range(bound_rect.y, bound_rect.height)
+    if mask_bits is None:
+        mask_bits = np.zeros(precise_mask.get_size(), dtype=bool)
+        for row in rows:
+            for col in cols:
+                mask_bits[col, row] = precise_mask.get_at((col, row))
     max_r = 0
-    for row in range(bound_rect.y, bound_rect.height):
-        for col in range(bound_rect.x, bound_rect.width):
-            if precise_mask.get_at((col, row)) > 0:
-                rad = math.sqrt((disk_mask_center[0]-col)**2 + (disk_mask_center[1]-row)**2)
-                if rad > max_r:
-                    max_r = rad
+    if len(cols) > 0 and len(rows) > 0:
+        set_cols, set_rows = np.nonzero(mask_bits[cols[0]:cols[-1]+1, rows[0]:rows[-1]+1])
+        if len(set_cols) > 0:
+            distances = ((disk_mask_center[0] - cols[0] - set_cols)**2 +
+                         (disk_mask_center[1] - rows[0] - set_rows)**2)
+            max_r = math.sqrt(float(distances.max()))
     bound_radius = max_bound_radius
     if (max_r > 0) and (max_r < max_bound_radius):
         bound_radius = max_r
@@ -168,6 +230,11 @@ class ObjectSprite(object):
 
     IMAGE_STRIP_FILE_RE = re.compile(r".*_strip(\d+)\.\w+")
     DEFAULT_SPRITE_PREFIX = "spr_"
+    #: Appended to the image file name to name its collision mask cache file
+    MASK_CACHE_SUFFIX = ".masks.npz"
+    #: Change this when the mask cache contents or mask creation change, to
+    #: ignore older cache files
+    MASK_CACHE_VERSION = 1
 
     @staticmethod
     def load_from_yaml(sprite_yaml_stream, game_engine):
@@ -417,6 +484,10 @@ class ObjectSprite(object):
         #: The bounding rect, containing all pixels to be drawn to a surface
         #: from the image (depends on bounding_box_type)
         self.bounding_box_rect = None
+        #: Flag whether to keep the collision masks and bounding rects in a
+        #: cache file next to the image file, see
+        #: :py:meth:`get_mask_cache_filename`
+        self.use_mask_cache = False
 
     @property
     def collision_type(self):
@@ -438,7 +509,9 @@ class ObjectSprite(object):
         if self.preload_texture:
             self.load_graphic()
 
-    def _collect_subimage_data(self):
+    def _collect_subimage_data(self, bbox_rects=None):
+        # Split the image into subimages.  Calculate each subimage's bounding
+        #  rect, unless bbox_rects supplies them.
         sub_cols = self.subimage_info["columns"]
         if len(sub_cols) <= 1:
             # subimage columns weren't passed in, so calculate them
@@ -485,7 +558,9 @@ class ObjectSprite(object):
             new_subimage = self.image.subsurface(subim_rect)
             self.subimages.append(new_subimage)
             bound_rect = None
-            if self.bounding_box_type == "automatic":
+            if bbox_rects is not None:
+                bound_rect = bbox_rects[subim_idx]
+            elif self.bounding_box_type == "automatic":
                 bound_rect = new_subimage.get_bounding_rect()
             elif self.bounding_box_type == "full_image":
                 bound_rect = new_subimage.get_rect()
@@ -504,8 +579,12 @@ class ObjectSprite(object):
             self.subimage_info["bbox_rects"].append(bound_rect)
 
     def _create_subimage_masks(self):
+        # Create each subimage's mask and radius, and return the list of
+        #  pixels set in each mask.
+        all_mask_bits = []
         for subimg_idx, subimg in enumerate(self.subimages):
-            precise_mask = mask_from_surface(subimg)
+            mask_bits = get_surface_mask_bits(subimg)
+            precise_mask = mask_from_bits(mask_bits)
             bound_rect = pygame.Rect(self.subimage_info["bbox_rects"][subimg_idx])
             orig_rect = subimg.get_rect()
             if (orig_rect.width == 0) or (orig_rect.height == 0):
@@ -521,15 +600,94 @@ class ObjectSprite(object):
             if self.collision_type == "precise":
                 self.subimage_info["masks"].append(precise_mask)
                 self.subimage_info["radii"].append(None)
+                all_mask_bits.append(mask_bits)
             elif self.collision_type == "disk":
-                radius = get_disk_radius(precise_mask, orig_rect, bound_rect)
-                self.subimage_info["masks"].append(create_disk_mask(orig_rect, radius))
+                radius = get_disk_radius(precise_mask, orig_rect, bound_rect, mask_bits)
+                disk_mask_bits = get_disk_mask_bits(orig_rect, radius)
+                self.subimage_info["masks"].append(mask_from_bits(disk_mask_bits))
                 self.subimage_info["radii"].append(radius)
+                all_mask_bits.append(disk_mask_bits)
             else:
                 # other collision types are not supported, fall back to
                 #  rectangle
                 self.subimage_info["masks"].append(create_rectangle_mask(orig_rect))
                 self.subimage_info["radii"].append(None)
+                all_mask_bits.append(np.ones(orig_rect.size, dtype=bool))
+        return all_mask_bits
+
+    def get_mask_cache_filename(self):
+        """
+        Return the name of the file that caches the sprite's collision masks
+        and bounding rects, when :py:attr:`use_mask_cache` is set.
+
+        :return: The cache file name
+        :rtype: str
+        """
+        return "{}{}".format(self.filename, self.MASK_CACHE_SUFFIX)
+
+    def _get_mask_cache_key(self):
+        # Summarize everything the masks and bounding rects are made from:
+        #  the image file's contents and name (image strips get their
+        #  subimage count from the name), and the sprite's collision and
+        #  bounding box settings.
+        key_hash = hashlib.sha1()
+        with open(self.filename, "rb") as image_f:
+            key_hash.update(image_f.read())
+        key_hash.update(repr((self.MASK_CACHE_VERSION, os.path.basename(self.filename),
+                              self.collision_type, self.bounding_box_type,
+                              tuple(self.manual_bounding_box_rect),
+                              tuple(self.subimage_info["columns"]))))
+        return key_hash.hexdigest()
+
+    def _read_mask_cache(self, cache_key):
+        # Return the arrays stored in the mask cache file, or None if the
+        #  file is missing, unreadable, or was made from different inputs.
+        try:
+            with np.load(self.get_mask_cache_filename(), allow_pickle=False) as cache:
+                if str(cache["key"]) != cache_key:
+                    return None
+                return dict([(name, cache[name]) for name in cache.files])
+        except (IOError, OSError, ValueError, KeyError, zipfile.BadZipfile):
+            return None
+
+    def _write_mask_cache(self, cache_key, all_mask_bits):
+        # Store the bounding rects, masks and radii in the mask cache file.
+        #  Write a temporary file first and rename it, so readers never see a
+        #  partial file.  Failures only mean the cache won't be used.
+        cache_arrays = {
+            "key": np.array(cache_key),
+            "bounding_box_rect": np.array(tuple(self.bounding_box_rect)),
+            "bbox_rects": np.array([tuple(bbox) for bbox in self.subimage_info["bbox_rects"]]),
+            "radii": np.array([-1 if radius is None else radius
+                               for radius in self.subimage_info["radii"]]),
+        }
+        for idx, mask_bits in enumerate(all_mask_bits):
+            cache_arrays["mask_{:d}".format(idx)] = mask_bits
+        cache_filename = self.get_mask_cache_filename()
+        try:
+            tmp_fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(
+                cache_filename)))
+        except (IOError, OSError):
+            return
+        try:
+            with os.fdopen(tmp_fd, "wb") as tmp_f:
+                np.savez_compressed(tmp_f, **cache_arrays)
+            os.rename(tmp_name, cache_filename)
+        except (IOError, OSError):
+            # don't leave the partial file behind
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+    def _restore_subimage_masks(self, cache):
+        # Create each subimage's mask and radius from the mask cache arrays.
+        for idx in range(len(self.subimages)):
+            self.subimage_info["masks"].append(mask_from_bits(cache["mask_{:d}".format(idx)]))
+            radius = int(cache["radii"][idx])
+            if radius < 0:
+                radius = None
+            self.subimage_info["radii"].append(radius)
 
     def load_graphic(self):
         """
@@ -537,19 +695,28 @@ class ObjectSprite(object):
         Split subimages from image strips, for appropriately-named files.
         Collect information about the graphic in the image_size,
         bounding_box_type, and bounding_box_rect attributes.
-        Generate collision masks based on the collision_type.
+        Generate collision masks based on the collision_type, or restore them
+        from the mask cache file if :py:attr:`use_mask_cache` is set and the
+        file was made from the same image and settings.
         """
         if len(self.filename) <= 0:
             raise ObjectSpriteException(
                 "ObjectSprite error ({}): Attempt to load image from empty filename".
                 format(str(self)))
+        cache_key = None
+        cache = None
         if self.check_filename():
+            if self.use_mask_cache:
+                cache_key = self._get_mask_cache_key()
+                cache = self._read_mask_cache(cache_key)
             name_minfo = self.IMAGE_STRIP_FILE_RE.search(self.filename)
             if name_minfo:
                 self.subimage_info["count"] = int(name_minfo.group(1))
             self.image = pygame.image.load(self.filename).convert_alpha()
             self.image_size = self.image.get_size()
-            if self.bounding_box_type == "automatic":
+            if cache is not None:
+                self.bounding_box_rect = pygame.Rect(cache["bounding_box_rect"].tolist())
+            elif self.bounding_box_type == "automatic":
                 self.bounding_box_rect = self.image.get_bounding_rect()
             elif self.bounding_box_type == "full_image":
                 self.bounding_box_rect = self.image.get_rect()
@@ -567,13 +734,21 @@ class ObjectSprite(object):
                     bound_rect.height = image_rect.bottom - image_rect.top
                 self.bounding_box_rect = bound_rect
             if self.subimage_info["count"] > 1:
-                self._collect_subimage_data()
+                bbox_rects = None
+                if cache is not None:
+                    bbox_rects = [pygame.Rect(bbox) for bbox in cache["bbox_rects"].tolist()]
+                self._collect_subimage_data(bbox_rects)
             else:
                 # subimages[0] is the original image, if not an image strip
                 self.subimages.append(self.image)
                 self.subimage_info["bbox_rects"].append(self.bounding_box_rect)
                 self.subimage_info["sizes"].append(self.image_size)
-        self._create_subimage_masks()
+        if cache is not None:
+            self._restore_subimage_masks(cache)
+        else:
+            all_mask_bits = self._create_subimage_masks()
+            if cache_key is not None:
+                self._write_mask_cache(cache_key, all_mask_bits)
 
     def check_filename(self):
         """
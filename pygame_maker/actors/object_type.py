@@ -8,10 +8,14 @@ Pygame maker object type resource module.
 
 import math
 import re
+import sys
+import types
 import logging
 import pygame
 import yaml
+import numpy as np
 from pygame_maker.support import logging_object
+from pygame_maker.support import motion_arrays
 import pygame_maker.actors.simple_object_instance as simple_object_instance
 import pygame_maker.actors.object_instance as object_instance
 import pygame_maker.actors.object_sprite as object_sprite
@@ -119,6 +123,27 @@ def get_offset_between_instances(instance_a, instance_b):
     return offset
 
 
+def get_collision_bounds(instance):
+    """
+    Return a rectangle enclosing every pixel that could collide with another
+    instance.  This is usually the instance's rect, but a disk collision
+    circle can extend past the corners of the rect.
+
+    :param instance: The ObjectInstance to find the collision bounds for
+    :type instance: :py:class:`~pygame_maker.actors.object_instance.ObjectInstance`
+    :return: The collision bounds
+    :rtype: :py:class:`pygame.Rect`
+    """
+    radius = getattr(instance, "radius", None)
+    if not radius:
+        return instance.rect
+    radius = int(math.ceil(radius))
+    center = instance.rect.center
+    disk_rect = pygame.Rect(center[0] - radius, center[1] - radius,
+                            2 * radius + 1, 2 * radius + 1)
+    return instance.rect.union(disk_rect)
+
+
 def get_mask_overlap(instance_a, instance_b):
     """
     Return the number of pixels that instance_a overlaps instance_b.
@@ -135,6 +160,138 @@ def get_mask_overlap(instance_a, instance_b):
     return overlap
 
 
+def mask_overlaps_instance(mask, position, instance):
+    """
+    Determine whether a mask placed at a position overlaps any of an
+    instance's collision mask pixels.
+
+    :param mask: The mask to test
+    :type mask: :py:class:`pygame.mask.Mask`
+    :param position: The XY coordinate of the mask's upper left corner
+    :type position: (int, int)
+    :param instance: The ObjectInstance to test against
+    :type instance: :py:class:`~pygame_maker.actors.object_instance.ObjectInstance`
+    :return: True if the mask overlaps the instance, or False
+    :rtype: bool
+    """
+    if getattr(instance, "mask", None) is None:
+        return False
+    offset = (int(position[0]) - instance.rect.x, int(position[1]) - instance.rect.y)
+    return instance.mask.overlap(mask, offset) is not None
+
+
+def get_collision_contact(instance_a, instance_b, contact_cache=None):
+    """
+    Return both the number of pixels that instance_a overlaps instance_b, and
+    an approximate collision normal from instance_a's perspective.
+
+    This finds the offset between the instances once, and skips the normal
+    calculation if the instances don't overlap.  If a contact cache is
+    supplied, results are looked up in and added to it.
+
+    :param instance_a: The first ObjectInstance with overlapping pixels
+    :type instance_a: :py:class:`~pygame_maker.actors.object_instance.ObjectInstance`
+    :param instance_b: The second ObjectInstance with overlapping pixels
+    :type instance_b: :py:class:`~pygame_maker.actors.object_instance.ObjectInstance`
+    :param contact_cache: A cache of earlier results
+    :type contact_cache: :py:class:`CollisionContactCache`
+    :return: The number of pixels that overlap, and the normal vector (or
+        None, if no normal can be found)
+    :rtype: (int, None | (int, int))
+    """
+    offset = get_offset_between_instances(instance_a, instance_b)
+    mask_a = instance_a.mask
+    mask_b = instance_b.mask
+    if contact_cache is not None:
+        contact = contact_cache.get(mask_a, mask_b, offset)
+        if contact is not None:
+            return contact
+    overlap = mask_a.overlap_area(mask_b, offset)
+    normal = None
+    if overlap != 0:
+        normx = (mask_a.overlap_area(mask_b, (offset[0] + 1, offset[1])) -
+                 mask_a.overlap_area(mask_b, (offset[0] - 1, offset[1])))
+        normy = (mask_a.overlap_area(mask_b, (offset[0], offset[1] + 1)) -
+                 mask_a.overlap_area(mask_b, (offset[0], offset[1] - 1)))
+        if (normx != 0) or (normy != 0):
+            normal = (normx, normy)
+    if contact_cache is not None:
+        contact_cache.add(mask_a, mask_b, offset, (overlap, normal))
+    return overlap, normal
+
+
+class CollisionContactCache(object):
+    """
+    Remember the overlap and collision normal found for a pair of collision
+    masks at a particular offset, so instances that share masks, or keep
+    still from one frame to the next, don't repeat the calculation.
+
+    Results from the current frame and the frame before it are kept; call
+    :py:meth:`next_frame` once per frame to discard older results.  A result
+    for mask_a and mask_b is also found when looking up mask_b and mask_a at
+    the opposite offset, with the normal negated.
+    """
+    def __init__(self):
+        """Create an empty cache."""
+        self._current = {}
+        self._previous = {}
+
+    def _lookup(self, mask_a, mask_b, offset):
+        key = (id(mask_a), id(mask_b), offset)
+        entry = self._current.get(key)
+        if entry is None:
+            entry = self._previous.get(key)
+            if entry is None:
+                return None
+            # still in use, so keep it for another frame
+            self._current[key] = entry
+        # make sure the masks weren't replaced by new ones with the same ids
+        if (entry[0] is mask_a) and (entry[1] is mask_b):
+            return entry[2]
+        return None
+
+    def get(self, mask_a, mask_b, offset):
+        """
+        Find an earlier result for the given masks and offset.
+
+        :param mask_a: The first collision mask
+        :type mask_a: :py:class:`pygame.mask.Mask`
+        :param mask_b: The second collision mask
+        :type mask_b: :py:class:`pygame.mask.Mask`
+        :param offset: The offset of mask_b from mask_a
+        :type offset: (int, int)
+        :return: The overlap and normal from mask_a's perspective, or None
+            if not found
+        :rtype: None | (int, None | (int, int))
+        """
+        contact = self._lookup(mask_a, mask_b, offset)
+        if contact is None:
+            contact = self._lookup(mask_b, mask_a, (-offset[0], -offset[1]))
+            if contact is not None and contact[1] is not None:
+                contact = (contact[0], (-contact[1][0], -contact[1][1]))
+        return contact
+
+    def add(self, mask_a, mask_b, offset, contact):
+        """
+        Record a result for the given masks and offset.
+
+        :param mask_a: The first collision mask
+        :type mask_a: :py:class:`pygame.mask.Mask`
+        :param mask_b: The second collision mask
+        :type mask_b: :py:class:`pygame.mask.Mask`
+        :param offset: The offset of mask_b from mask_a
+        :type offset: (int, int)
+        :param contact: The overlap and normal from mask_a's perspective
+        :type contact: (int, None | (int, int))
+        """
+        self._current[(id(mask_a), id(mask_b), offset)] = (mask_a, mask_b, contact)
+
+    def next_frame(self):
+        """Forget results that weren't used during the last frame."""
+        self._previous = self._current
+        self._current = {}
+
+
 def dot_product(vec1, vec2):
     """
     Calculate a dot product between 2 vectors.
@@ -149,6 +306,49 @@ def dot_product(vec1, vec2):
     return vec1[0] * vec2[0] + vec1[1] * vec2[1]
 
 
+def get_instance_size(instance):
+    """
+    Return the approximate number of bytes used by an instance.  This counts
+    the instance itself, plus the attributes, containers and symbol values
+    that belong to it alone.  Things shared with other instances aren't
+    counted: object types, the game engine, other instances, images,
+    collision masks, sprite groups, loggers, classes, functions, and the
+    strings used as attribute and symbol names.
+
+    :param instance: The instance to measure
+    :type instance: :py:class:`~pygame_maker.actors.simple_object_instance.SimpleObjectInstance`
+    :return: The instance's size in bytes
+    :rtype: int
+    """
+    shared_types = (ObjectType, simple_object_instance.SimpleObjectInstance,
+                    pygame.Surface, pygame.mask.MaskType, pygame.sprite.AbstractGroup,
+                    logging.Logger, type, types.ModuleType, types.FunctionType)
+    seen = set([id(instance.game_engine)])
+    size = 0
+    pending = [instance]
+    while len(pending) > 0:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if (obj is not instance) and isinstance(obj, shared_types):
+            continue
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            # the keys are attribute and symbol names
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+        elif not isinstance(obj, types.MethodType):
+            # bound methods only refer back to their instance
+            if hasattr(obj, "__dict__"):
+                pending.append(obj.__dict__)
+            for slot in getattr(type(obj), "__slots__", ()):
+                if hasattr(obj, slot):
+                    pending.append(getattr(obj, slot))
+    return size
+
+
 class ObjectType(logging_object.LoggingObject):
     """
     All PyGameMaker objects:
@@ -191,6 +391,9 @@ class ObjectType(logging_object.LoggingObject):
         "draw": event.DrawEvent,
     }
     GLOBAL_MOUSE_RE = re.compile("global")
+    #: Match collision event names; group 1 holds the optional parent_ or
+    #: child_ prefix, and group 2 holds the name of the other object type
+    COLLISION_EVENT_RE = re.compile("^(parent_|child_)?collision_(.*)$")
 
     object_type_registry = []
 
@@ -342,7 +545,7 @@ class ObjectType(logging_object.LoggingObject):
             re.compile(r"^alarm(\d{1,2})$"):    self.handle_alarm_event,
             re.compile("^kb_(.*)$"):            self.handle_keyboard_event,
             re.compile("^mouse_(.*)$"):         self.handle_mouse_event,
-            re.compile("^(parent_|child_)?collision_(.*)$"):     self.handle_collision_event,
+            self.COLLISION_EVENT_RE:            self.handle_collision_event,
             re.compile("^([^_]+)_step$"):       self.handle_step_event,
             re.compile("^outside_room$"):       self.handle_instance_event,
             re.compile("^intersect_boundary$"): self.handle_instance_event,
@@ -350,6 +553,8 @@ class ObjectType(logging_object.LoggingObject):
             re.compile("^destroy$"):            self.handle_destroy_event,
             re.compile("^draw$"):               self.draw,
         }
+        # map event names to the handlers found for them in handler_table
+        self._event_handler_cache = {}
         #: A dict mapping event names to action sequences
         self.event_action_sequences = {}
         if ((kwargs is not None) and ("event_action_sequences" in kwargs.keys()) and
@@ -469,6 +674,98 @@ class ObjectType(logging_object.LoggingObject):
             empty list if none
         """
         return set()
+
+    def collision_check_pair(self, other_obj, check_self=True, check_other=True):
+        """
+        Override this method in subclasses that implement collision detection.
+
+        :param other_obj: The ObjectType to test for collisions with this one
+        :type other_obj: :py:class:`ObjectType`
+        :param check_self: Queue collision events for this type's instances
+        :type check_self: bool
+        :param check_other: Queue collision events for the other type's
+            instances
+        :type check_other: bool
+        :return: A list of collision event names that were queued, or an
+            empty list if none
+        """
+        return set()
+
+    def index_instances(self, spatial_index):
+        """
+        Override this method in subclasses that implement collision detection,
+        to add instances to the game engine's collision grid.
+
+        :param spatial_index: The index that will hold the instances
+        :type spatial_index: :py:class:`~pygame_maker.support.spatial_hash.SpatialHash`
+        """
+        pass
+
+    def index_moved_instances(self, spatial_index):
+        """
+        Override this method in subclasses that implement collision detection,
+        to move the instances that changed position since they were last
+        indexed to their new places in the game engine's collision grid.
+
+        :param spatial_index: The index that holds the instances
+        :type spatial_index: :py:class:`~pygame_maker.support.spatial_hash.SpatialHash`
+        :return: True if any instances were moved in the index, False otherwise
+        :rtype: bool
+        """
+        return False
+
+    def instance_moved(self, instance):
+        """
+        Override this method in subclasses that implement collision detection,
+        to remember that an instance changed position.  Called when an
+        instance is created or its position changes.
+
+        :param instance: The instance that moved
+        :type instance: :py:class:`~pygame_maker.actors.simple_object_instance.SimpleObjectInstance`
+        """
+        pass
+
+    def get_static_instances(self):
+        """
+        Override this method in subclasses that implement collision detection,
+        to return instances that can be placed in the game engine's static
+        collision tree.
+
+        :return: A list of static instances
+        :rtype: list
+        """
+        return []
+
+    def wake_instance(self, instance):
+        """
+        Override this method in subclasses that let idle instances sleep, to
+        wake the instance up.  Called when an instance runs an action, its
+        symbols are changed by code, or it is moved to a new position.
+
+        :param instance: The instance to wake up
+        :type instance: :py:class:`~pygame_maker.actors.simple_object_instance.SimpleObjectInstance`
+        """
+        pass
+
+    def store_previous_positions(self):
+        """
+        Override this method in subclasses that draw instances, to remember
+        where each instance was before a simulation step.  Called at the
+        start of each step when the game interpolates rendering.
+        """
+        pass
+
+    def sync_instance_motion(self, instance):
+        """
+        Override this method in subclasses that move instances in vectorised
+        updates, to copy an instance's newest motion state into its position
+        and symbol table.  Called before a stale instance's motion is read or
+        changed.
+
+        :param instance: The instance to bring up to date
+        :type instance: :py:class:`~pygame_maker.actors.simple_object_instance.SimpleObjectInstance`
+        """
+        pass
     #pylint: enable=unused-argument
     #pylint: enable=no-self-use
 
@@ -555,6 +852,17 @@ class ObjectType(logging_object.LoggingObject):
                         self.game_engine.execute_action(an_action, in_event)
                         continue
                     self.debug("apply {} to targets {}".format(an_action.name, action_targets))
+                    if ((len(action_targets) > 1) and
+                            object_instance.ObjectInstance.can_batch_action(an_action)):
+                        batch = [target for target in action_targets
+                                 if target not in self.instance_delete_list]
+                        if ((len(batch) > 0) and
+                                all(isinstance(target, object_instance.ObjectInstance)
+                                    for target in batch)):
+                            # move all the targets together
+                            object_instance.ObjectInstance.execute_batch_action(batch,
+                                                                                an_action)
+                            continue
                     for target in action_targets:
                         if target in self.instance_delete_list:
                             self.info("Skipping about-to-be-destroyed instance {}".
@@ -676,20 +984,40 @@ class ObjectType(logging_object.LoggingObject):
             self.execute_action_sequence(in_event)
 
     def _select_event_handler(self, event_name):
-        # Return an event type, given the name of the handled event.
+        # Return an event type, given the name of the handled event.  Each
+        #  event name is matched against the handler table only the first
+        #  time it's seen, or when an action sequence is set for it.
 
         # :param event_name: The name of the received event
         # :type event_name: str
         # :return: An event handler
         # :rtype: callable
+        if event_name in self._event_handler_cache:
+            return self._event_handler_cache[event_name]
         self.debug("_select_event_handler(event_name={}):".format(event_name))
         hdlr = None
         for ev_re in self.handler_table.keys():
             minfo = ev_re.match(event_name)
             if minfo:
                 hdlr = self.handler_table[ev_re]
+        self._event_handler_cache[event_name] = hdlr
         return hdlr
 
+    #pylint: disable=unused-argument
+    #pylint: disable=no-self-use
+    def _select_batch_handler(self, event_name):
+        # Return a handler that accepts a list of the named events, to
+        #  register alongside the event handler; None if events should be
+        #  handled one at a time.  Meant to be overridden by subclasses.
+
+        # :param event_name: The name of the received event
+        # :type event_name: str
+        # :return: A batch event handler, or None
+        # :rtype: None | callable
+        return None
+    #pylint: enable=unused-argument
+    #pylint: enable=no-self-use
+
     def keys(self):
         """
         Return the event names handled by this object type, in a list.
@@ -738,11 +1066,20 @@ class ObjectType(logging_object.LoggingObject):
             raise(ValueError("Supplied event action sequence is not an ActionSequence instance",
                              self.error))
         self.event_action_sequences[itemname] = val
-        # register our handler for this event
+        # register our handler for this event, looking it up again in case
+        #  handler_table changed since the event name was last seen
+        self._event_handler_cache.pop(itemname, None)
         new_handler = self._select_event_handler(itemname)
         if new_handler:
             self.info("{}: Register handler for event '{}'".format(self.name, itemname))
-            self.game_engine.event_engine.register_event_handler(itemname, new_handler)
+            batch_handler = self._select_batch_handler(itemname)
+            if batch_handler:
+                self.game_engine.event_engine.register_event_handler(itemname, new_handler,
+                                                                     batch_handler)
+            else:
+                self.game_engine.event_engine.register_event_handler(itemname, new_handler)
+            if self.COLLISION_EVENT_RE.match(itemname):
+                self._collision_interest_changed()
         else:
             raise(ObjectTypeException("ObjectType does not yet handle '{}' events (NYI)".
                                       format(itemname), self.error))
@@ -762,6 +1099,15 @@ class ObjectType(logging_object.LoggingObject):
             self.game_engine.event_engine.unregister_event_handler(itemname, old_handler)
             # remove the event from the table
             del self.event_action_sequences[itemname]
+            if self.COLLISION_EVENT_RE.match(itemname):
+                self._collision_interest_changed()
+
+    def _collision_interest_changed(self):
+        # Tell the game engine that the object type pairs needing collision
+        #  checks may have changed.  Stand-in game engines used for testing
+        #  may not track collision interest.
+        if hasattr(self.game_engine, "invalidate_collision_interest"):
+            self.game_engine.invalidate_collision_interest()
 
 
 class ManagerObjectType(ObjectType):
@@ -792,6 +1138,10 @@ class CollideableObjectType(ManagerObjectType):
             solid: True | False
             depth: <int>
             sprite: <sprite resource name>
+            sleep_when_idle: True | False
+            vectorize_motion: True | False
+            pool_size: <int>
+            inactive_outside_view: <margin in pixels>
             events:
               <event1_name>:
                 <yaml representation for event action sequence>
@@ -812,6 +1162,20 @@ class CollideableObjectType(ManagerObjectType):
     DEFAULT_DEPTH = 0
     #: By default, a new ObjectType doesn't refer to a sprite yet
     DEFAULT_SPRITE_RESOURCE = None
+    #: By default, instances are updated every frame even when idle
+    DEFAULT_SLEEP_WHEN_IDLE = False
+    #: Number of frames an instance must stay still before it can sleep
+    SLEEP_IDLE_FRAMES = 30
+    #: By default, each instance moves itself in its own update()
+    DEFAULT_VECTORIZE_MOTION = False
+    #: By default, destroyed instances aren't kept for reuse
+    DEFAULT_POOL_SIZE = 0
+    #: By default, instances stay active wherever they are
+    DEFAULT_INACTIVE_OUTSIDE_VIEW = None
+    #: Instance events delivered in batches, along with collision events
+    BATCHED_INSTANCE_EVENTS = ("intersect_boundary", "outside_room")
+    #: Actions that read the details of the event that triggered them
+    EVENT_DEPENDENT_ACTIONS = ("bounce_off_collider",)
 
     @classmethod
     def gen_kwargs_from_yaml_obj(cls, obj_name, obj_yaml, game_engine):
@@ -822,6 +1186,10 @@ class CollideableObjectType(ManagerObjectType):
             "solid": CollideableObjectType.DEFAULT_SOLID,
             "depth": CollideableObjectType.DEFAULT_DEPTH,
             "sprite": CollideableObjectType.DEFAULT_SPRITE_RESOURCE,
+            "sleep_when_idle": CollideableObjectType.DEFAULT_SLEEP_WHEN_IDLE,
+            "vectorize_motion": CollideableObjectType.DEFAULT_VECTORIZE_MOTION,
+            "pool_size": CollideableObjectType.DEFAULT_POOL_SIZE,
+            "inactive_outside_view": CollideableObjectType.DEFAULT_INACTIVE_OUTSIDE_VIEW,
         })
         if "visible" in obj_yaml.keys():
             kwargs["visible"] = (obj_yaml["visible"] is True)
@@ -831,6 +1199,14 @@ class CollideableObjectType(ManagerObjectType):
             kwargs["depth"] = int(obj_yaml["depth"])
         if "sprite" in obj_yaml.keys():
             kwargs["sprite"] = str(obj_yaml["sprite"])
+        if "sleep_when_idle" in obj_yaml.keys():
+            kwargs["sleep_when_idle"] = (obj_yaml["sleep_when_idle"] is True)
+        if "vectorize_motion" in obj_yaml.keys():
+            kwargs["vectorize_motion"] = (obj_yaml["vectorize_motion"] is True)
+        if "pool_size" in obj_yaml.keys():
+            kwargs["pool_size"] = int(obj_yaml["pool_size"])
+        if "inactive_outside_view" in obj_yaml.keys():
+            kwargs["inactive_outside_view"] = int(obj_yaml["inactive_outside_view"])
         return kwargs
 
     def __init__(self, object_name, game_engine, **kwargs):
@@ -852,6 +1228,19 @@ class CollideableObjectType(ManagerObjectType):
               (e.g. a platform) [False]
             * depth (int): Which layer object instances will be placed into [0]
             * sprite (str): Name of a sprite resource used as the image [None]
+            * sleep_when_idle (bool): Whether instances that stay still with
+              no speed or gravity stop being updated, and stop looking for
+              collisions, until they are woken up [False]
+            * vectorize_motion (bool): Whether the object type moves all of
+              its instances at once each frame, keeping their motion state
+              in NumPy arrays [False]
+            * pool_size (int): How many destroyed instances are kept to be
+              reused by new instances, instead of creating new ones [0]
+            * inactive_outside_view (int): If set, instances farther than
+              this many pixels outside the room's visible area stop
+              receiving step events and being drawn, until they come back
+              within it.  They keep moving, so they can come back, and keep
+              receiving boundary events such as outside_room [None]
         """
         super(CollideableObjectType, self).__init__(object_name, game_engine, **kwargs)
         self.sprite_resource = self.DEFAULT_SPRITE_RESOURCE
@@ -859,9 +1248,42 @@ class CollideableObjectType(ManagerObjectType):
         self.bounding_box_rect = None
         self.mask = None
         self._visible = self.DEFAULT_VISIBLE
-        self.solid = self.DEFAULT_SOLID
+        self._solid = self.DEFAULT_SOLID
         self.depth = self.DEFAULT_DEPTH
         self.group = pygame.sprite.LayeredDirty()
+        #: Whether idle instances are allowed to sleep
+        self.sleep_when_idle = self.DEFAULT_SLEEP_WHEN_IDLE
+        #: Instances that are skipped by update() and don't look for
+        #: collisions themselves
+        self.sleeping_instances = set()
+        # map awake instances to their last (rect, number of idle frames)
+        self._idle_frames = {}
+        #: Whether instances are moved together in one vectorised step
+        self.vectorize_motion = self.DEFAULT_VECTORIZE_MOTION
+        #: Motion state of the instances moved by vectorised updates
+        self.motion = motion_arrays.MotionArrays()
+        #: The most destroyed instances kept for reuse
+        self.pool_size = self.DEFAULT_POOL_SIZE
+        #: Destroyed instances waiting to be reused
+        self.instance_pool = []
+        #: How far outside the visible area instances stay active; None
+        #: keeps every instance active
+        self.inactive_outside_view = self.DEFAULT_INACTIVE_OUTSIDE_VIEW
+        #: Instances outside the active region, skipped by step events and
+        #: drawing; they still move and get boundary events
+        self.dormant_instances = set()
+        #: Instances created or moved since they were last placed in the game
+        #: engine's collision grid
+        self.moved_instances = set()
+        # instances moved since the grid was last rebuilt, that were already
+        #  moved to their new places in it for region queries
+        self._moved_since_indexed = set()
+        # instances that moved during the frame being checked for
+        #  collisions, which wake the sleeping instances they touch
+        self._frame_moved_instances = set()
+        # map instances to their rect positions before the latest step, for
+        #  drawing them between steps
+        self._previous_positions = {}
         # default draw action sequence draws the object's sprite
         self["draw"] = action_sequence.ActionSequence()
         self["draw"].append_action(action.DrawAction("draw_self"))
@@ -873,6 +1295,14 @@ class CollideableObjectType(ManagerObjectType):
                     self.solid = (kwargs["solid"] is True)
                 if kwarg == "depth":
                     self.depth = int(kwargs["depth"])
+                if kwarg == "sleep_when_idle":
+                    self.sleep_when_idle = (kwargs["sleep_when_idle"] is True)
+                if kwarg == "vectorize_motion":
+                    self.vectorize_motion = (kwargs["vectorize_motion"] is True)
+                if kwarg == "pool_size":
+                    self.pool_size = max(int(kwargs["pool_size"]), 0)
+                if (kwarg == "inactive_outside_view") and (kwargs[kwarg] is not None):
+                    self.inactive_outside_view = int(kwargs["inactive_outside_view"])
                 if (kwarg == "sprite") and kwargs[kwarg]:
                     if kwargs['sprite'] in self.game_engine.resources['sprites'].keys():
                         assigned_sprite = self.game_engine.resources['sprites'][kwargs['sprite']]
@@ -898,6 +1328,21 @@ class CollideableObjectType(ManagerObjectType):
             for instance in self.group:
                 instance.visible = is_visible
 
+    @property
+    def solid(self):
+        """
+        Get and set the flag that determines whether other instances will be
+        pushed out of this ObjectType's instances when they collide.
+        """
+        return self._solid
+
+    @solid.setter
+    def solid(self, is_solid):
+        solid = (is_solid is True)
+        if self._solid != solid:
+            self._solid = solid
+            self._collision_interest_changed()
+
     def to_yaml(self):
         """Return the YAML string representing this object type."""
         yaml_str = "- {}:\n".format(self.name)
@@ -905,6 +1350,14 @@ class CollideableObjectType(ManagerObjectType):
         yaml_str += "    solid: {}\n".format(self.solid)
         yaml_str += "    depth: {:d}\n".format(self.depth)
         yaml_str += "    sprite: {}\n".format(self.sprite_resource.name)
+        if self.sleep_when_idle:
+            yaml_str += "    sleep_when_idle: {}\n".format(self.sleep_when_idle)
+        if self.vectorize_motion:
+            yaml_str += "    vectorize_motion: {}\n".format(self.vectorize_motion)
+        if self.pool_size > 0:
+            yaml_str += "    pool_size: {:d}\n".format(self.pool_size)
+        if self.inactive_outside_view is not None:
+            yaml_str += "    inactive_outside_view: {:d}\n".format(self.inactive_outside_view)
         yaml_str += "    events:\n"
         for event_name in self.event_action_sequences:
             yaml_str += "      {}:\n".format(event_name)
@@ -913,16 +1366,18 @@ class CollideableObjectType(ManagerObjectType):
 
     def get_image(self, subimage_number=0):
         """
-        Called by instances of this ObjectType, to get a new copy of
-        the sprite resource's image.
+        Called by instances of this ObjectType, to get one of the sprite
+        resource's subimages.  The subimage is shared by every instance
+        showing it; an instance that changes its image draws on its own copy,
+        from :py:meth:`~pygame_maker.actors.object_instance.ObjectInstance.get_writable_image`.
 
         Load the image when the first instance using this image is created.
         Also, handle the collision type and create a collision mask.
 
-        :param subimage_number: Which subimage to copy
+        :param subimage_number: Which subimage to get
         :type subimage_number: int
-        :return: A tuple containing a new pygame image (copied from the
-            ObjectSprite resource), a collision mask, a bounding box, and
+        :return: A tuple containing a pygame image (the ObjectSprite
+            resource's subimage), a collision mask, a bounding box, and
             possibly an image radius (for disk collision masks)
         :rtype: tuple(:py:class:`pygame.Surface`, :py:class:`pygame.Mask`,
             :py:class:`pygame.Rect`, None|int)
@@ -939,8 +1394,8 @@ class CollideableObjectType(ManagerObjectType):
                                                                  "sprite": self.sprite_resource})
                 )
                 self.info("  Queued 'image_loaded' event")
-            # return an image (a copy of the subimage), a mask and possibly
-            # radius from the sprite resource
+            # return an image, a mask and possibly radius from the sprite
+            # resource; the image is only copied when an instance changes it
             snum = subimage_number
             if subimage_number > self.sprite_resource.subimage_info["count"]:
                 self.warn("{}: An instance requested a subimage number ({}) out of range (max {})".
@@ -948,7 +1403,7 @@ class CollideableObjectType(ManagerObjectType):
                                  self.sprite_resource.subimage_info["count"]))
                 # select the last subimage (counting from 0)
                 snum = self.sprite_resource.subimage_info["count"] - 1
-            image = self.sprite_resource.subimages[snum].copy()
+            image = self.sprite_resource.subimages[snum]
             mask = self.sprite_resource.subimage_info["masks"][snum]
             bounding_box = self.sprite_resource.subimage_info["bbox_rects"][snum]
             radius = self.sprite_resource.subimage_info["radii"][snum]
@@ -970,7 +1425,7 @@ class CollideableObjectType(ManagerObjectType):
     def collision_check(self, other_obj_types):
         """
         Check for collisions between this and other object types' instances,
-        and queue collision events when detected.
+        and queue collision events for this type's instances when detected.
 
         :param other_obj_types: A list of other ObjectTypes to test
             for collisions with this one
@@ -981,74 +1436,299 @@ class CollideableObjectType(ManagerObjectType):
         self.debug("collision_check(other_obj_types={}):".format(other_obj_types))
         collision_types_queued = set()
         for other_obj in other_obj_types:
-            # other_obj.group = other_obj.group
-            if len(other_obj.group) == 0:
-                continue
-            if (len(self.group) == 1) and self.name == other_obj.name:
-                # skip self collision detection if there's only one sprite
+            collision_types_queued |= self.collision_check_pair(other_obj, check_other=False)
+        return collision_types_queued
+
+    def collision_check_pair(self, other_obj, check_self=True, check_other=True):
+        """
+        Check for collisions between this and another object type's
+        instances, testing each pair of instances only once.  Queue the
+        ``collision_<other type>`` events for this type's instances and the
+        ``collision_<this type>`` events for the other type's instances, as
+        requested.  The other type's collision normals are the negated
+        normals from this type's perspective.
+
+        :param other_obj: The ObjectType to test for collisions with this one
+        :type other_obj: :py:class:`ObjectType`
+        :param check_self: Queue collision events for this type's instances,
+            and push them out of solid instances
+        :type check_self: bool
+        :param check_other: Queue collision events for the other type's
+            instances, and push them out of solid instances
+        :type check_other: bool
+        :return: A list of collision event names that were queued, or an
+            empty list if none
+        """
+        self.debug("collision_check_pair(other_obj={}, check_self={}, check_other={}):".
+                   format(other_obj, check_self, check_other))
+        collision_types_queued = set()
+        if (len(self.group) == 0) or (len(other_obj.group) == 0):
+            return collision_types_queued
+        if (len(self.group) == 1) and self.name == other_obj.name:
+            # skip self collision detection if there's only one sprite
+            return collision_types_queued
+        collided_pairs = self._find_collided_pairs(other_obj)
+        if len(collided_pairs) == 0:
+            return collision_types_queued
+        # moving instances wake up the sleeping instances they touch
+        for inst_a, inst_b in collided_pairs:
+            if (inst_a in self.sleeping_instances) and other_obj._is_moving(inst_b):
+                self.wake_instance(inst_a)
+            elif (inst_b in other_obj.sleeping_instances) and self._is_moving(inst_a):
+                other_obj.wake_instance(inst_b)
+        # collect the instances each instance collided with, from both
+        #  types' perspectives
+        self_map = {}
+        other_map = {}
+        for inst_a, inst_b in collided_pairs:
+            self_map.setdefault(inst_a, []).append(inst_b)
+            other_map.setdefault(inst_b, []).append(inst_a)
+        if other_obj is self:
+            # both perspectives belong to this type
+            for inst_b in other_map.keys():
+                self_map.setdefault(inst_b, []).extend(other_map[inst_b])
+            check_self = check_self or check_other
+            check_other = False
+        # the overlap and normal for each collided pair are found once, and
+        #  looked up again for the other type's perspective; instances pushed
+        #  out of solid instances have new offsets, so they'll be recalculated
+        contact_cache = getattr(self.game_engine, "collision_contacts", None)
+        if contact_cache is None:
+            contact_cache = CollisionContactCache()
+        if check_self:
+            collision_types_queued |= self._resolve_collisions(other_obj, self_map,
+                                                               contact_cache)
+        if check_other:
+            collision_types_queued |= other_obj._resolve_collisions(self, other_map,
+                                                                    contact_cache)
+        return collision_types_queued
+
+    def _is_moving(self, instance):
+        # Return True if the instance moved this frame, either with its speed
+        #  or by having its position set, or will move with its speed
+        return (instance in self._frame_moved_instances) or (instance.speed != 0)
+
+    def group_order_key(self, instance):
+        """
+        Return a sort key that puts this type's instances in the order its
+        sprite group keeps them: by layer, then by creation.
+
+        :param instance: One of this type's instances
+        :type instance: :py:class:`~pygame_maker.actors.object_instance.ObjectInstance`
+        :return: The sort key
+        :rtype: (int, int)
+        """
+        return (self.group.get_layer_of_sprite(instance), instance.inst_id)
+
+    def _nearby_instances(self, instance, other_obj):
+        # Return other_obj's instances that could collide with instance, in
+        #  sprite group order.  Use the game engine's collision grid and
+        #  static instance tree to find nearby instances, if it has them;
+        #  otherwise, return all of other_obj's instances.
+        collision_grid = getattr(self.game_engine, "collision_grid", None)
+        if collision_grid is None:
+            return other_obj.group.sprites()
+        static_tree = getattr(self.game_engine, "static_collision_tree", None)
+        bounds = get_collision_bounds(instance)
+        nearby = collision_grid.query(bounds)
+        if static_tree is not None:
+            nearby |= static_tree.query(bounds)
+        nearby = [inst for inst in nearby if inst.kind is other_obj]
+        nearby.sort(key=other_obj.group_order_key)
+        return nearby
+
+    def _is_passive(self, instance, static_tree):
+        # Return True if the instance doesn't look for collisions itself:
+        #  it's asleep, or it's in the static collision tree
+        return ((instance in self.sleeping_instances) or
+                ((static_tree is not None) and (instance in static_tree)))
+
+    def _find_collided_pairs(self, other_obj):
+        # Return a list of (this type's instance, other type's instance)
+        #  tuples for every collision, in sprite group order.  Instances of
+        #  the same type are only tested against each other once.  Sleeping
+        #  and static instances don't look for collisions; the moving
+        #  instances find them instead, so pairs of instances that stay put
+        #  are never tested.
+        same_type = other_obj is self
+        static_tree = getattr(self.game_engine, "static_collision_tree", None)
+        collided_pairs = []
+        passive_found = False
+        for inst_a in self.group:
+            if self._is_passive(inst_a, static_tree):
+                passive_found = True
                 continue
-            collision_map = pygame.sprite.groupcollide(
-                self.group, other_obj.group, False, False, collided=sprite_collision_test)
-            for collider in collision_map.keys():
-                collision_normal = None
-                for other_inst in collision_map[collider]:
-                    overlap = get_mask_overlap(collider, other_inst)
-                    collision_normal = get_collision_normal(collider, other_inst)
-                    # in the event of a collision with a solid object (i.e.
-                    #  stationary), kick the sprite outside of the other
-                    #  object's collision mask
-                    if other_inst.kind.solid and collision_normal:
-                        divisor = float(dot_product(collision_normal, collision_normal))
-                        distance = 0
-                        if divisor != 0:
-                            distance = (float(overlap) / divisor + 0.5)
-                        adj_x = math.floor(distance * collision_normal[0] + 0.5)
-                        adj_y = math.floor(distance * collision_normal[1] + 0.5)
-                        collider.position.x += adj_x
-                        collider.position.y += adj_y
-                collision_name = "collision_{}".format(other_obj.name)
-                if collision_name not in collision_types_queued:
-                    collision_types_queued.add(collision_name)
-                self.debug("{} inst {}: Queue collision {}".
-                           format(self.name, collider.inst_id, collision_name))
-                collision_event_info = {
-                    "type": self, "instance": collider,
-                    "others": collision_map[collider]
-                }
-                if collision_normal:
-                    collision_event_info['normal'] = collision_normal
+            nearby = self._nearby_instances(inst_a, other_obj)
+            if same_type:
+                a_key = self.group_order_key(inst_a)
+                nearby = [inst for inst in nearby
+                          if (self._is_passive(inst, static_tree) or
+                              self.group_order_key(inst) > a_key)]
+            for inst_b in nearby:
+                if sprite_collision_test(inst_a, inst_b):
+                    collided_pairs.append((inst_a, inst_b))
+        if passive_found and not same_type:
+            # look for the other type's moving instances touching this type's
+            #  sleeping and static instances
+            for inst_b in other_obj.group:
+                if other_obj._is_passive(inst_b, static_tree):
+                    continue
+                for inst_a in other_obj._nearby_instances(inst_b, self):
+                    if (self._is_passive(inst_a, static_tree) and
+                            sprite_collision_test(inst_a, inst_b)):
+                        collided_pairs.append((inst_a, inst_b))
+        return collided_pairs
+
+    def _resolve_collisions(self, other_obj, collision_map, contact_cache):
+        # Push this type's colliding instances out of solid instances, and
+        #  queue collision events for them.
+        collision_grid = getattr(self.game_engine, "collision_grid", None)
+        collision_types_queued = set()
+        for collider in sorted(collision_map.keys(), key=self.group_order_key):
+            others = sorted(collision_map[collider], key=other_obj.group_order_key)
+            collision_normal = None
+            for other_inst in others:
+                overlap, collision_normal = get_collision_contact(collider, other_inst,
+                                                                  contact_cache)
+                # in the event of a collision with a solid object (i.e.
+                #  stationary), kick the sprite outside of the other
+                #  object's collision mask
+                if other_inst.kind.solid and collision_normal:
+                    divisor = float(dot_product(collision_normal, collision_normal))
+                    distance = 0
+                    if divisor != 0:
+                        distance = (float(overlap) / divisor + 0.5)
+                    adj_x = math.floor(distance * collision_normal[0] + 0.5)
+                    adj_y = math.floor(distance * collision_normal[1] + 0.5)
+                    collider.move_position(adj_x, adj_y)
+                    if collision_grid is not None:
+                        # keep the grid in step with the moved instance
+                        collision_grid.update(collider, get_collision_bounds(collider))
+            collision_name = "collision_{}".format(other_obj.name)
+            if collision_name not in collision_types_queued:
+                collision_types_queued.add(collision_name)
+            self.debug("{} inst {}: Queue collision {}".
+                       format(self.name, collider.inst_id, collision_name))
+            collision_event_info = {
+                "type": self, "instance": collider,
+                "others": others
+            }
+            if collision_normal:
+                collision_event_info['normal'] = collision_normal
+            self.game_engine.event_engine.queue_event(
+                self.EVENT_NAME_OBJECT_HASH["collision"](collision_name,
+                                                         collision_event_info)
+            )
+            # queue a child collision event if this instance has a parent
+            if collider.symbols["parent"] is not None:
+                parent = collider.symbols["parent"]
+                child_collision_name = "child_{}".format(collision_name)
+                collision_types_queued.add(child_collision_name)
+                child_collision_info = dict(collision_event_info)
+                child_collision_info["type"] = parent.kind
+                child_collision_info["instance"] = parent
+                child_collision_info["child_type"] = self
                 self.game_engine.event_engine.queue_event(
-                    self.EVENT_NAME_OBJECT_HASH["collision"](collision_name,
-                                                             collision_event_info)
+                    self.EVENT_NAME_OBJECT_HASH["child_collision"](child_collision_name,
+                                                                   child_collision_info)
                 )
-                # queue a child collision event if this instance has a parent
-                if collider.symbols["parent"] is not None:
-                    parent = collider.symbols["parent"]
-                    child_collision_name = "child_{}".format(collision_name)
-                    collision_types_queued.add(child_collision_name)
-                    child_collision_info = dict(collision_event_info)
-                    child_collision_info["type"] = parent.kind
-                    child_collision_info["instance"] = parent
-                    child_collision_info["child_type"] = self
+            # queue parent collision events if this instance has children
+            if len(collider.symbols["children"]) > 0:
+                for a_child in collider.symbols["children"]:
+                    parent_collision_name = "parent_{}".format(collision_name)
+                    collision_types_queued.add(parent_collision_name)
+                    parent_collision_info = dict(collision_event_info)
+                    parent_collision_info["type"] = a_child.kind
+                    parent_collision_info["instance"] = a_child
+                    parent_collision_info["parent_type"] = self
                     self.game_engine.event_engine.queue_event(
-                        self.EVENT_NAME_OBJECT_HASH["child_collision"](child_collision_name,
-                                                                       child_collision_info)
+                        self.EVENT_NAME_OBJECT_HASH["parent_collision"](parent_collision_name,
+                                                                        parent_collision_info)
                     )
-                # queue parent collision events if this instance has children
-                if len(collider.symbols["children"]) > 0:
-                    for a_child in collider.symbols["children"]:
-                        parent_collision_name = "parent_{}".format(collision_name)
-                        collision_types_queued.add(parent_collision_name)
-                        parent_collision_info = dict(collision_event_info)
-                        parent_collision_info["type"] = a_child.kind
-                        parent_collision_info["instance"] = a_child
-                        parent_collision_info["parent_type"] = self
-                        self.game_engine.event_engine.queue_event(
-                            self.EVENT_NAME_OBJECT_HASH["parent_collision"](parent_collision_name,
-                                                                            parent_collision_info)
-                        )
         return collision_types_queued
 
+    def index_instances(self, spatial_index):
+        """
+        Add every instance to the game engine's collision grid, except static
+        instances in the game engine's static collision tree.  Static
+        instances whose position changed are removed from the tree and added
+        to the grid instead; the rest are skipped without checking their
+        bounds.  The instances that moved since the last call are remembered
+        until the next one, so they can wake up the sleeping instances they
+        touch.
+
+        :param spatial_index: The index that will hold the instances
+        :type spatial_index: :py:class:`~pygame_maker.support.spatial_hash.SpatialHash`
+        """
+        static_tree = getattr(self.game_engine, "static_collision_tree", None)
+        for instance in self.group:
+            if ((static_tree is not None) and (instance in static_tree) and
+                    (instance not in self.moved_instances)):
+                continue
+            self._index_instance(instance, spatial_index, static_tree)
+        self._frame_moved_instances = self._moved_since_indexed | self.moved_instances
+        self._moved_since_indexed = set()
+        self.moved_instances = set()
+
+    def index_moved_instances(self, spatial_index):
+        """
+        Move the instances that changed position since the last call to
+        :py:meth:`index_instances` to their new places in the collision
+        grid, and drop deleted instances from it.  This keeps the grid
+        current for region queries made between collision checks.
+
+        :param spatial_index: The index that holds the instances
+        :type spatial_index: :py:class:`~pygame_maker.support.spatial_hash.SpatialHash`
+        :return: True if any instances were moved in the index, False otherwise
+        :rtype: bool
+        """
+        if len(self.moved_instances) == 0:
+            return False
+        static_tree = getattr(self.game_engine, "static_collision_tree", None)
+        for instance in self.moved_instances:
+            if instance in self.group:
+                self._index_instance(instance, spatial_index, static_tree)
+            else:
+                spatial_index.remove(instance)
+        self._moved_since_indexed |= self.moved_instances
+        self.moved_instances = set()
+        return True
+
+    @staticmethod
+    def _index_instance(instance, spatial_index, static_tree):
+        # place an instance in the collision grid, unless it's in the static
+        #  tree and hasn't moved
+        bounds = get_collision_bounds(instance)
+        if (static_tree is not None) and (instance in static_tree):
+            if static_tree.get_bounds(instance) == bounds:
+                return
+            static_tree.remove(instance)
+        spatial_index.insert(instance, bounds)
+
+    def instance_moved(self, instance):
+        """
+        Remember that an instance changed position, so
+        :py:meth:`index_moved_instances` can update the collision grid.
+
+        :param instance: The instance that moved
+        :type instance: :py:class:`~pygame_maker.actors.object_instance.ObjectInstance`
+        """
+        self.moved_instances.add(instance)
+
+    def get_static_instances(self):
+        """
+        Return the instances that are expected to stay put: those of a solid
+        object type, without a parent, with no speed or gravity.
+
+        :return: A list of static instances
+        :rtype: list
+        """
+        if not self.solid:
+            return []
+        return [inst for inst in self.group
+                if (inst.symbols["parent"] is None and inst.speed == 0 and
+                    inst.gravity == 0)]
+
     def update(self):
         """
         Call to perform position updates for all instances.  After all
@@ -1056,15 +1736,230 @@ class CollideableObjectType(ManagerObjectType):
         """
         self.debug("update():")
         if len(self.group) > 0:
-            #pylint: disable=no-member
-            self.group.update()
-            #pylint: enable=no-member
+            if self.inactive_outside_view is not None:
+                self._find_dormant_instances()
+            if self.vectorize_motion:
+                moved = self._update_motion_arrays()
+            else:
+                moved = [instance for instance in self.group.sprites()
+                         if ((instance not in self.sleeping_instances) and
+                             instance.update(defer_boundary_events=True))]
+            # boundary events are handled after every instance has moved
+            self._transmit_boundary_events(moved)
+            if self.sleep_when_idle:
+                self._find_sleeping_instances()
         # after all instances update(), check the delete list to see which
         #  ones should be removed and remove them
         if len(self.instance_delete_list) > 0:
+            static_tree = getattr(self.game_engine, "static_collision_tree", None)
+            for instance in self.instance_delete_list:
+                if static_tree is not None:
+                    static_tree.remove(instance)
+                self._forget_instance(instance)
+                # let index_moved_instances() drop it from the collision grid
+                self.instance_moved(instance)
             self.group.remove(self.instance_delete_list)
+            # keep destroyed instances for reuse, while the pool has room
+            free_slots = self.pool_size - len(self.instance_pool)
+            if free_slots > 0:
+                deleted = sorted(self.instance_delete_list, key=lambda inst: inst.inst_id)
+                self.instance_pool.extend(deleted[:free_slots])
             self.instance_delete_list = set()
 
+    def _update_motion_arrays(self):
+        # Move this type's instances in one vectorised step.  Instances with a
+        #  parent or children move together, so they still update()
+        #  themselves first.  The rest have their motion state copied into
+        #  the motion arrays, unless the arrays already hold their newest
+        #  state.  Moved instances only get their new rects; their positions
+        #  and symbols are brought up to date when they're next read.  Return
+        #  the instances that moved in the vectorised step.
+        motion = self.motion
+        array_instances = []
+        for instance in self.group.sprites():
+            if ((instance in self.sleeping_instances) or
+                    (instance in self.instance_delete_list)):
+                continue
+            if (instance.symbols["parent"] is not None or
+                    len(instance.symbols["children"]) > 0):
+                if instance.motion_stale:
+                    self.sync_instance_motion(instance)
+                motion.remove(instance)
+                instance.update()
+            else:
+                array_instances.append(instance)
+        slots = []
+        for instance in array_instances:
+            if instance in self.instance_delete_list:
+                continue
+            if not instance.motion_stale:
+                if instance.symbols["speed"] <= 0.0:
+                    # stationary instances have nothing to update
+                    motion.remove(instance)
+                    continue
+                position = instance.symbols["position"]
+                motion.store(instance, [position.x, position.y] +
+                             [instance.symbols[field] for field in motion.FIELDS[2:]])
+            slots.append(motion.get_slot(instance))
+        if len(slots) == 0:
+            return []
+        slots = np.array(slots)
+        slots = slots[motion.column("speed")[slots] > 0.0]
+        rounded_x, rounded_y = motion.integrate(slots)
+        motion.apply_friction(slots)
+        moved = [motion.items[slot] for slot in slots]
+        for instance, rect_x, rect_y in zip(moved, rounded_x, rounded_y):
+            instance.rect.x = rect_x
+            instance.rect.y = rect_y
+            instance.motion_stale = True
+        self.moved_instances.update(moved)
+        return moved
+
+    def _find_dormant_instances(self):
+        # Suspend the instances lying entirely outside the room's visible
+        #  area, grown by the inactive_outside_view margin, and resume the
+        #  ones that are back inside it.  Dormant instances only miss step
+        #  events and drawing: they keep moving, so they can come back into
+        #  view, and keep their boundary events.
+        instances = self.group.sprites()
+        rects = np.array([tuple(inst.rect) + tuple(inst.screen_dims) for inst in instances])
+        xpos, ypos, width, height, room_width, room_height = rects.T
+        margin = self.inactive_outside_view
+        outside = (((xpos + width) < -margin) | (xpos > (room_width + margin)) |
+                   ((ypos + height) < -margin) | (ypos > (room_height + margin)))
+        self.dormant_instances = set(instances[idx] for idx in np.flatnonzero(outside))
+
+    def _transmit_boundary_events(self, instances):
+        # Test all the moved instances against the room boundaries at once,
+        #  and transmit intersect_boundary or outside_room events for them.
+        #  An instance touching a boundary gets only intersect_boundary, even
+        #  if it's also outside the room.  Events are only created if this
+        #  type has an action sequence for them.
+        handled = [name for name in ("intersect_boundary", "outside_room")
+                   if name in self.event_action_sequences]
+        if (len(handled) == 0) or (len(instances) == 0):
+            return
+        intersects, outside = object_instance.find_boundary_hits(instances)
+        if "intersect_boundary" not in handled:
+            intersects[:] = False
+        if "outside_room" not in handled:
+            outside[:] = False
+        event_engine = self.game_engine.event_engine
+        event_names_queued = set()
+        for idx in np.flatnonzero(intersects | outside):
+            instance = instances[idx]
+            if instance in self.instance_delete_list:
+                continue
+            if intersects[idx]:
+                event_name = "intersect_boundary"
+            else:
+                event_name = "outside_room"
+            self.debug("  {} inst {} transmitting {} event".format(self.name, instance.inst_id,
+                                                                   event_name))
+            event_names_queued.add(event_name)
+            event_engine.queue_event(event.OtherEvent(event_name, {"type": self,
+                                                                  "instance": instance}))
+        # transmit each name once, so all the instances' events arrive together
+        for event_name in handled:
+            if event_name in event_names_queued:
+                event_engine.transmit_event(event_name)
+
+    def sync_instance_motion(self, instance):
+        """
+        Copy the position, speed, hspeed and vspeed left in the motion arrays
+        by the last vectorised update into an instance's position and symbol
+        table.
+
+        :param instance: The instance to bring up to date
+        :type instance: :py:class:`~pygame_maker.actors.object_instance.ObjectInstance`
+        """
+        instance.motion_stale = False
+        if instance not in self.motion:
+            return
+        xpos, ypos, speed, _, hspeed, vspeed = self.motion.load(instance)[:6]
+        instance.symbols["position"].store(xpos, ypos)
+        instance.symbols["position.x"] = xpos
+        instance.symbols["position.y"] = ypos
+        instance.symbols["speed"] = speed
+        instance.symbols["hspeed"] = hspeed
+        instance.symbols["vspeed"] = vspeed
+
+    def _find_sleeping_instances(self):
+        # Put awake instances to sleep once they've stayed in the same place
+        #  for SLEEP_IDLE_FRAMES frames with no speed or gravity.  Instances
+        #  with parents or children move with them, so they stay awake.
+        for instance in self.group:
+            if instance in self.sleeping_instances:
+                continue
+            if instance.motion_stale:
+                # read the speed without bringing the symbols up to date
+                speed = self.motion.load(instance)[2]
+            else:
+                speed = instance.speed
+            if (speed != 0 or instance.symbols["gravity"] != 0 or
+                    instance.symbols["parent"] is not None or
+                    len(instance.symbols["children"]) > 0):
+                self._idle_frames.pop(instance, None)
+                continue
+            rect_xywh = tuple(instance.rect)
+            last_rect_xywh, idle_frames = self._idle_frames.get(instance, (None, 0))
+            if rect_xywh != last_rect_xywh:
+                idle_frames = 0
+            idle_frames += 1
+            if idle_frames >= self.SLEEP_IDLE_FRAMES:
+                self.debug("{} inst {} is going to sleep".format(self.name, instance.inst_id))
+                self.sleeping_instances.add(instance)
+                self._idle_frames.pop(instance, None)
+            else:
+                self._idle_frames[instance] = (rect_xywh, idle_frames)
+
+    def wake_instance(self, instance):
+        """
+        Return a sleeping instance to the awake instances, and restart its
+        count of idle frames.
+
+        :param instance: The instance to wake up
+        :type instance: :py:class:`~pygame_maker.actors.object_instance.ObjectInstance`
+        """
+        self.sleeping_instances.discard(instance)
+        self._idle_frames.pop(instance, None)
+
+    def _forget_instance(self, instance):
+        # Drop a destroyed instance from this type's per-instance state, and
+        #  its queued events from the event engine, so none of it is left
+        #  over if the instance is reused from the pool
+        self.wake_instance(instance)
+        self.motion.remove(instance)
+        self.dormant_instances.discard(instance)
+        self.moved_instances.discard(instance)
+        self._moved_since_indexed.discard(instance)
+        self._frame_moved_instances.discard(instance)
+        self._previous_positions.pop(instance, None)
+        self.game_engine.event_engine.discard_instance_events(instance)
+
+    def store_previous_positions(self):
+        """
+        Remember each instance's position before a simulation step, so
+        :py:meth:`draw` can place it between the previous and current steps.
+        """
+        self._previous_positions = dict((inst, inst.rect.topleft) for inst in self.group)
+
+    def _interpolate_positions(self, fraction):
+        # move each instance part of the way from its previous position to
+        #  its current one; return the instances moved, with their current
+        #  positions
+        moved = []
+        for inst in self.group:
+            previous = self._previous_positions.get(inst)
+            current = inst.rect.topleft
+            if (previous is None) or (previous == current):
+                continue
+            inst.rect.topleft = (
+                int(math.floor(previous[0] + (current[0] - previous[0]) * fraction + 0.5)),
+                int(math.floor(previous[1] + (current[1] - previous[1]) * fraction + 0.5)))
+            moved.append((inst, current))
+        return moved
+
     def draw(self, in_event):
         """
         Respond to draw events.
@@ -1078,17 +1973,41 @@ class CollideableObjectType(ManagerObjectType):
                 if an_action.name == "draw_self":
                     # The normal, default action: each object instance draws
                     #  its sprite
-                    #pylint: disable=no-member
-                    self.group.draw(self.game_engine.draw_surface)
-                    #pylint: enable=no-member
+                    fraction = getattr(self.game_engine, "render_fraction", None)
+                    moved = []
+                    if fraction is not None:
+                        moved = self._interpolate_positions(fraction)
+                    # hide dormant instances while the group draws
+                    hidden = [inst for inst in self.dormant_instances
+                              if inst.symbols["visible"]]
+                    for inst in hidden:
+                        inst.symbols["visible"] = False
+                    try:
+                        #pylint: disable=no-member
+                        self.group.draw(self.game_engine.draw_surface)
+                        #pylint: enable=no-member
+                    finally:
+                        # put the instances back where the simulation left
+                        #  them, even if drawing failed
+                        for inst in hidden:
+                            inst.symbols["visible"] = True
+                        for inst, current in moved:
+                            inst.rect.topleft = current
 
     def make_new_instance(self, screen, settings=None, **kwargs):
         screen_dims = (screen.get_width(), screen.get_height())
-        new_instance = object_instance.ObjectInstance(
-            self, screen_dims, self._id, settings, **kwargs)
+        if len(self.instance_pool) > 0:
+            # reuse a destroyed instance
+            new_instance = self.instance_pool.pop()
+            self._forget_instance(new_instance)
+            new_instance.reset(screen_dims, self._id, settings, **kwargs)
+        else:
+            new_instance = object_instance.ObjectInstance(
+                self, screen_dims, self._id, settings, **kwargs)
         #pylint: disable=no-member
         self.group.add(new_instance)
         #pylint: enable=no-member
+        self.instance_moved(new_instance)
         return new_instance
 
     def get_applied_instance_list(self, an_action, in_event):
@@ -1138,6 +2057,72 @@ class CollideableObjectType(ManagerObjectType):
             #pylint: enable=no-member
         return apply_to_instances
 
+    def _select_batch_handler(self, event_name):
+        # Boundary and collision events are produced for many instances of
+        #  this type at once, so they're delivered in batches.
+        if ((event_name in self.BATCHED_INSTANCE_EVENTS) or
+                self.COLLISION_EVENT_RE.match(event_name)):
+            return self.handle_event_batch
+        return None
+
+    def _can_batch_sequence(self, sequence):
+        # Return True if running the action sequence once for a list of
+        #  target instances does the same as running it for each of their
+        #  events in turn: every action applies to "self", none are
+        #  conditionals or blocks, and none need the details of a particular
+        #  event.
+        engine_actions = getattr(self.game_engine, "GAME_ENGINE_ACTIONS", [])
+        for an_action in sequence.main_block.get_action_list():
+            if an_action is None:
+                continue
+            if (an_action.nest_adjustment or
+                    (an_action.action_data.get("apply_to") != "self") or
+                    (an_action.name in engine_actions) or
+                    (an_action.name in self.EVENT_DEPENDENT_ACTIONS)):
+                return False
+        return True
+
+    def handle_event_batch(self, events):
+        """
+        Execute the action sequence for a list of same-named events produced
+        by instances of this type, walking the sequence once for all the
+        instances.
+
+        Events that can't be handled together (other types' instances, an
+        instance's repeated events, or sequences that depend on each event's
+        details) are passed to the event's usual handler one at a time, which
+        ignores other types' events.
+
+        :param events: Events with the same name
+        :type events: list
+        """
+        self.debug("handle_event_batch(<{:d} events>):".format(len(events)))
+        event_name = events[0].name
+        handler = self._select_event_handler(event_name)
+        sequence = self.event_action_sequences.get(event_name)
+        if (sequence is None) or not self._can_batch_sequence(sequence):
+            for an_event in events:
+                handler(an_event)
+            return
+        first_event = None
+        targets = []
+        seen = set()
+        unbatched = []
+        for an_event in events:
+            instance = an_event.event_params.get("instance")
+            if ((an_event.event_params.get("type") == self) and (instance not in seen) and
+                    (instance in self.group)):
+                if first_event is None:
+                    first_event = an_event
+                seen.add(instance)
+                targets.append(instance)
+            else:
+                unbatched.append(an_event)
+        if len(targets) > 0:
+            self.execute_action_sequence(first_event, targets=targets)
+        for an_event in unbatched:
+            handler(an_event)
+
     def handle_instance_event(self, in_event):
         """
         Execute action sequences generated by an instance.
@@ -1151,7 +2136,9 @@ class CollideableObjectType(ManagerObjectType):
         :type in_event: :py:class:`~pygame_maker.events.event.Event`
         """
         self.debug("handle_instance_event(in_event={}):".format(in_event))
-        self.execute_action_sequence(in_event)
+        if ((in_event.event_params["type"] == self) and
+                (in_event.event_params["instance"] in self.group)):
+            self.execute_action_sequence(in_event)
 
     def handle_mouse_event(self, in_event):
         """
@@ -1159,17 +2146,29 @@ class CollideableObjectType(ManagerObjectType):
         instances, after filtering global mouse events through the base class's
         method.
 
-        If mouse event's XY coordinate intersects one or more instances and the
-        exact mouse event is handled by this object (button #, press/release),
-        then handle the event.
+        If mouse event's XY coordinate intersects one or more visible instances
+        and the exact mouse event is handled by this object (button #,
+        press/release), then handle the event.  The game engine's shared
+        hit-test finds the instances under the mouse, when it has one.  The
+        instances are passed to the action sequence in sprite group order, as
+        sorted by :py:meth:`group_order_key`.
+
+        Invisible instances never receive mouse events.  Global mouse events
+        are handled once by the base class, and aren't also sent to the
+        instances under the mouse.
 
         :param in_event: The event generated by an ObjectInstance of this type
         :type in_event: :py:class:`~pygame_maker.events.event.Event`
         """
-        super(CollideableObjectType, self).handle_mouse_event(in_event)
-        #pylint: disable=no-member
-        clicked = self.group.get_sprites_at(in_event['position'])
-        #pylint: enable=no-member
+        if super(CollideableObjectType, self).handle_mouse_event(in_event):
+            return
+        if hasattr(self.game_engine, "get_instances_under_mouse"):
+            clicked = self.game_engine.get_instances_under_mouse(in_event['position'], self)
+        else:
+            #pylint: disable=no-member
+            clicked = [inst for inst in self.group.get_sprites_at(in_event['position'])
+                       if inst.visible]
+            #pylint: enable=no-member
         if len(clicked) > 0:
             self.execute_action_sequence(in_event, clicked)
 
@@ -1183,7 +2182,11 @@ class CollideableObjectType(ManagerObjectType):
         :type in_event: :py:class:`~pygame_maker.events.event.Event`
         """
         self.debug("handle_step_event(in_event={}):".format(in_event))
-        self.execute_action_sequence(in_event, targets=[inst for inst in self.group])
+        targets = [inst for inst in self.group if inst not in self.dormant_instances]
+        if (len(targets) == 0) and (len(self.dormant_instances) > 0):
+            # every instance is dormant
+            return
+        self.execute_action_sequence(in_event, targets=targets)
 
     def __repr__(self):
         rpr = "<{} '{}' sprite='{}'>".format(type(self).__name__, self.name, self.sprite_resource)
@@ -8,6 +8,7 @@ Pygame maker simple object instances
 
 import re
 import math
+import logging
 import pygame
 import pygame_maker.events.event as event
 from pygame_maker.support import coordinate
@@ -22,10 +23,26 @@ class SimpleObjectInstance(logging_object.LoggingObject):
 
     The most useful features of this class is allowing the logic engine to
     access symbols, and supporting variable and code execution type actions.
+
+    Instances keep only their own state.  The logger and the map from action
+    names to handler methods are shared by every instance of a class, and
+    the symbol table reads INSTANCE_SYMBOLS until a symbol is changed.
     """
+    #: Default symbol values, shared by all instances' symbol tables
     INSTANCE_SYMBOLS = {}
+    #: Map action names to the names of the methods that handle them
+    ACTION_METHODS = {
+        'debug': 'print_debug',
+        'execute_code': 'execute_code',
+        'if_variable_value': 'if_variable_value',
+        'set_variable_value': 'set_variable_value',
+        'destroy_object': 'destroy_object',
+    }
     # Regex for searching for symbol interpolations in debug strings
     INTERPOLATION_REGEX = re.compile("{([^}]*)}")
+    # Logging state is shared by all instances of a class
+    log_indent = 0
+    indent_size = 2
 
     def __init__(self, kind, screen_dims, new_id, settings=None, **kwargs):
         """
@@ -51,8 +68,12 @@ class SimpleObjectInstance(logging_object.LoggingObject):
               integer [(0,0)]
 
         """
-        # call base class init
-        super(SimpleObjectInstance, self).__init__(type(self).__name__)
+        # share one logger among all instances of each class, instead of
+        #  calling the base class init
+        cls = type(self)
+        if "logger" not in cls.__dict__:
+            cls.logger_name = cls.__name__
+            cls.logger = logging.getLogger(cls.__name__)
         #: Name the instance based on the ObjectType's name and the ID
         self.name = "{}{}".format(kind.name, new_id)
         #: The ObjectType this SimpleObjectInstance belongs to
@@ -65,38 +86,75 @@ class SimpleObjectInstance(logging_object.LoggingObject):
         self.inst_id = new_id
         # rect for storing the instance's position
         self.rect = pygame.Rect(0, 0, 0, 0)
-        # Symbols tracked by ObjectInstances
-        self._symbols = {
-            "parent": None,
-            "children": [],
-            "position": coordinate.Coordinate(0, 0,
-                                              self._update_position_x,
-                                              self._update_position_y)
-        }
-        #: Subclasses override this class variable to add their known symbols
-        self._symbols.update(self.INSTANCE_SYMBOLS)
-        #: Symbol table
-        self.symbols = SymbolTable()
-        for sym in self._symbols.keys():
-            self.symbols[sym] = self._symbols[sym]
+        #: True when the object type's last vectorised update left newer
+        #: motion state than this instance's position and symbols hold
+        self.motion_stale = False
+        # True when move_position() changed the position since the
+        #  position.x and position.y symbols were last set
+        self._position_symbols_stale = False
+        # the flattened hierarchy below this instance, while it has children
+        #  and no parent; None until the next update after the hierarchy
+        #  changes
+        self._flat_tree = None
+        # descendants whose position was set since this instance's last
+        #  update, including this instance if it's a root that moved
+        self._moved_descendants = set()
+        #: Symbol table; subclasses override INSTANCE_SYMBOLS to add their
+        #: known symbols
+        self.symbols = SymbolTable(shared_symbols=self.INSTANCE_SYMBOLS)
+        # Symbols tracked by each instance
+        self.symbols["parent"] = None
+        self.symbols["children"] = []
+        self.symbols["position"] = coordinate.Coordinate(0, 0,
+                                                         self._update_position_x,
+                                                         self._update_position_y)
+        self._apply_settings(settings, kwargs)
+        # print("Initial symbols:")
+        # self.symbols.dumpVars()
+
+        self._code_block_id = 0
+
+    def reset(self, screen_dims, new_id, settings=None, **kwargs):
+        """
+        Return a destroyed instance to the state of a new one, so its object
+        type can reuse it instead of creating another instance.  The symbol
+        table, rect and position are emptied and reused.
 
+        :param screen_dims: Width, height of the surface this instance will be
+            drawn to
+        :type screen_dims: [int, int]
+        :param new_id: A unique integer ID for this instance
+        :type new_id: int
+        :param settings: Attribute settings, as for :py:meth:`__init__`
+        :type settings: None or dict
+        :param kwargs: Attribute settings, as for :py:meth:`__init__`
+        """
+        self.name = "{}{}".format(self.kind.name, new_id)
+        self.screen_dims[:] = screen_dims[0:2]
+        self.inst_id = new_id
+        self.rect.topleft = (0, 0)
+        self.motion_stale = False
+        self._position_symbols_stale = False
+        self._flat_tree = None
+        self._moved_descendants.clear()
+        children = self.symbols["children"]
+        del children[:]
+        position = self.symbols["position"]
+        position.store(0, 0)
+        self.symbols.clear()
+        self.symbols["parent"] = None
+        self.symbols["children"] = children
+        self.symbols["position"] = position
+        self._apply_settings(settings, kwargs)
+
+    def _apply_settings(self, settings, kwargs):
+        # Apply the settings dict and kwargs given to __init__() or reset().
         attr_values = {}
         if settings is not None:
             attr_values.update(settings)
         attr_values.update(kwargs)
         if len(attr_values.keys()) > 0:
             self._apply_kwargs(attr_values)
-        # print("Initial symbols:")
-        # self.symbols.dumpVars()
-
-        self.action_name_to_method_map = {
-            'debug': self.print_debug,
-            'execute_code': self.execute_code,
-            'if_variable_value': self.if_variable_value,
-            'set_variable_value': self.set_variable_value,
-            'destroy_object': self.destroy_object,
-        }
-        self._code_block_id = 0
 
     def _update_position_x(self):
         # Automatically called when the X coordinate of the position changes
@@ -105,6 +163,9 @@ class SimpleObjectInstance(logging_object.LoggingObject):
         #pylint: disable=no-member
         self.symbols['position.x'] = self.position.x
         #pylint: enable=no-member
+        self.kind.instance_moved(self)
+        if (self.symbols["parent"] is not None) or (len(self.symbols["children"]) > 0):
+            self._moved_in_hierarchy()
 
     def _update_position_y(self):
         # Automatically called when the Y coordinate of the position changes
@@ -113,6 +174,9 @@ class SimpleObjectInstance(logging_object.LoggingObject):
         #pylint: disable=no-member
         self.symbols['position.y'] = self.position.y
         #pylint: enable=no-member
+        self.kind.instance_moved(self)
+        if (self.symbols["parent"] is not None) or (len(self.symbols["children"]) > 0):
+            self._moved_in_hierarchy()
 
     def _round_position_x_to_rect_x(self):
         # Called when the x coordinate of the position changes, to round
@@ -133,6 +197,47 @@ class SimpleObjectInstance(logging_object.LoggingObject):
         self.rect.y = math.floor(self.position.y + 0.5)
         #pylint: enable=no-member
 
+    def _sync_motion(self):
+        # Bring the position and symbols up to date, if a vectorised update
+        #  moved this instance since they were last read
+        if self.motion_stale:
+            self.kind.sync_instance_motion(self)
+
+    def _sync_symbols(self):
+        # Bring the symbol table up to date before actions or code use it
+        self._sync_motion()
+        if self._position_symbols_stale:
+            self._position_symbols_stale = False
+            position = self.symbols['position']
+            self.symbols['position.x'] = position.x
+            self.symbols['position.y'] = position.y
+
+    def move_position(self, xadj, yadj):
+        """
+        Move the instance by an x, y offset, without running the position's
+        change callbacks.  The rect follows right away; the ``position.x``
+        and ``position.y`` symbols are set the next time an action or code
+        block runs for this instance.
+
+        :param xadj: Distance to move along the X axis
+        :type xadj: float
+        :param yadj: Distance to move along the Y axis
+        :type yadj: float
+        """
+        self._sync_motion()
+        position = self.symbols['position']
+        #pylint: disable=no-member
+        xpos = position.x + xadj
+        ypos = position.y + yadj
+        position.store(xpos, ypos)
+        #pylint: enable=no-member
+        self.rect.x = int(math.floor(xpos + 0.5))
+        self.rect.y = int(math.floor(ypos + 0.5))
+        self._position_symbols_stale = True
+        self.kind.instance_moved(self)
+        if (self.symbols["parent"] is not None) or (len(self.symbols["children"]) > 0):
+            self._moved_in_hierarchy()
+
     @property
     def code_block_id(self):
         """Return a unique code block id."""
@@ -142,12 +247,15 @@ class SimpleObjectInstance(logging_object.LoggingObject):
     @property
     def position(self):
         """Position of this instance.  Set a new position using an x, y list."""
+        self._sync_motion()
         return self.symbols['position']
 
     @position.setter
     def position(self, new_coord):
         if len(new_coord) >= 2:
             self.debug("Set {}'s position to {}".format(self.name, new_coord))
+            self.kind.wake_instance(self)
+            self._sync_motion()
             self.symbols['position'].x = new_coord[0]
             self.symbols['position'].y = new_coord[1]
 
@@ -205,6 +313,7 @@ class SimpleObjectInstance(logging_object.LoggingObject):
         # :param new_value: The symbol's new value
         self.debug("_symbol_change_callback(sym={}, new_value={}):".format(sym,
                                                                            new_value))
+        self.kind.wake_instance(self)
         handled_change = False
         if hasattr(self, sym):
             setattr(self, sym, new_value)
@@ -232,6 +341,7 @@ class SimpleObjectInstance(logging_object.LoggingObject):
         """
         self.debug("execute_code(action={}, keep_code_block={}):".format(action,
                                                                          keep_code_block))
+        self._sync_symbols()
         if len(action.action_data['code']) > 0:
             instance_handle_name = "obj_{}_block{}".format(self.kind.name, self.code_block_id)
             if 'language_engine_handle' not in action.runtime_data:
@@ -370,6 +480,32 @@ class SimpleObjectInstance(logging_object.LoggingObject):
                                                                        value_result))
             self.symbols[action['variable']] = value_result
 
+    def get_root_instance(self):
+        """
+        Return the instance at the top of this instance's hierarchy: its
+        parent's parent, and so on.  An instance without a parent is its own
+        root.
+        """
+        root = self
+        while root.symbols["parent"] is not None:
+            root = root.symbols["parent"]
+        return root
+
+    def _hierarchy_changed(self):
+        # Forget the flattened hierarchies that include this instance, after
+        #  a child was added or removed
+        inst = self
+        while inst is not None:
+            inst._flat_tree = None
+            inst = inst.symbols["parent"]
+
+    def _moved_in_hierarchy(self):
+        # Remember that this instance's position changed, so its root places
+        #  its descendants on the next update.  A child's position is
+        #  relative to its parent; a root remembers its own move, which
+        #  places all of its descendants.
+        self.get_root_instance()._moved_descendants.add(self)
+
     def set_parent_instance(self, parent):
         """
         Set or replace this instance's parent, for forwarding 'child' events.
@@ -390,6 +526,7 @@ class SimpleObjectInstance(logging_object.LoggingObject):
         """Remove the parent instance, for example when it is destroyed"""
         self.debug("remove_parent_instance():")
         self.symbols["parent"] = None
+        self._hierarchy_changed()
 
     def add_child_instance(self, child):
         """Add a child instance to this one, for forwarding 'parent' events"""
@@ -403,6 +540,7 @@ class SimpleObjectInstance(logging_object.LoggingObject):
             #pylint: disable=no-member
             self.symbols["children"].append(child)
             #pylint: enable=no-member
+            self._hierarchy_changed()
         else:
             self.info("add_child_instance() called with already existing child instance")
 
@@ -422,6 +560,7 @@ class SimpleObjectInstance(logging_object.LoggingObject):
             #pylint: disable=no-member
             self.symbols["children"].remove(child)
             #pylint: enable=no-member
+            self._hierarchy_changed()
         else:
             self.info("remove_child_instance() called with non-existent child instance")
 
@@ -484,6 +623,8 @@ class SimpleObjectInstance(logging_object.LoggingObject):
         #  apply_to: assumed to have directed the action to this instance
         #  relative: add to instead of replace property settings
         self.debug("execute_action(action={}, an_event={}):".format(action, an_event))
+        self.kind.wake_instance(self)
+        self._sync_symbols()
         action_params = {}
         handled_action = False
         # check for expressions that need to be executed
@@ -492,8 +633,8 @@ class SimpleObjectInstance(logging_object.LoggingObject):
                 continue
             action_params[param] = action.get_parameter_expression_result(
                 param, self.symbols, self.game_engine.language_engine)
-        if action.name in self.action_name_to_method_map.keys():
-            self.action_name_to_method_map[action.name](action)
+        if action.name in self.ACTION_METHODS:
+            getattr(self, self.ACTION_METHODS[action.name])(action)
             handled_action = True
             self.debug("  {} inst {} execute_action {} handled".format(self.kind.name,
                                                                        self.inst_id,
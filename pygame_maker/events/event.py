@@ -11,8 +11,8 @@ import pygame
 
 
 __all__ = ["Event", "AlarmEvent", "CollisionEvent", "DrawEvent", "KeyEvent",
-           "MouseEvent", "ObjectStateEvent", "OtherEvent", "StepEvent",
-           "UnknownEventError"]
+           "MouseEvent", "ObjectStateEvent", "OtherEvent", "ReadOnlyEventParams",
+           "StepEvent", "UnknownEventError"]
 
 
 class UnknownEventError(Exception):
@@ -20,8 +20,34 @@ class UnknownEventError(Exception):
     pass
 
 
+class ReadOnlyEventParams(dict):
+    """
+    Event parameters that can't be changed, for events that are reused.
+    Attempts to change them raise TypeError.
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        # refuse every method that would change the parameters
+        raise TypeError("Event parameters are read-only")
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+
 class Event(object):
-    """Base class for events."""
+    """
+    Base class for events.
+
+    Events are slotted records: subclasses list any attributes of their own
+    in ``__slots__``.
+    """
+    __slots__ = ("name", "event_params")
     HANDLED_EVENTS = []
 
     event_type_registry = []
@@ -87,10 +113,10 @@ class Event(object):
         :type event_params: dict|None
         """
         self.name = event_name
-        ev_params = {}
-        if event_params is not None:
-            ev_params.update(event_params)
-        self.event_params = ev_params
+        if event_params is None:
+            self.event_params = {}
+        else:
+            self.event_params = dict(event_params)
 
     def __getitem__(self, item_name):
         """
@@ -113,9 +139,21 @@ class Event(object):
         :param item_name: A parameter name
         :type item_name: str
         :param val: The parameter's new value
+        :raise: TypeError if the event is read-only
         """
         self.event_params[item_name] = val
 
+    def make_read_only(self):
+        """
+        Stop the event's parameters from being changed, so that one event can
+        be sent many times without handlers seeing each other's changes.
+
+        :return: This event
+        :rtype: Event
+        """
+        self.event_params = ReadOnlyEventParams(self.event_params)
+        return self
+
     def _repr_event_strings(self):
         event_param_strs = []
         ev_str = ""
@@ -135,6 +173,7 @@ class Event(object):
 
 class ObjectStateEvent(Event):
     """Wrap object state events."""
+    __slots__ = ()
     OBJECT_STATE_EVENTS = [
         "create",
         "create_child",
@@ -161,6 +200,7 @@ class ObjectStateEvent(Event):
 
 class AlarmEvent(Event):
     """Wrap alarm events."""
+    __slots__ = ()
     ALARM_COUNT = 12
     ALARM_EVENTS = ["alarm{:d}".format(n) for n in range(0, ALARM_COUNT)]
     #: Complete list of alarm event names
@@ -182,6 +222,7 @@ class AlarmEvent(Event):
 
 class StepEvent(Event):
     """Wrap step events."""
+    __slots__ = ()
     STEP_EVENTS = [
         "normal_step",
         "begin_step",
@@ -206,6 +247,7 @@ class StepEvent(Event):
 
 class MouseEvent(Event):
     """Wrap mouse events."""
+    __slots__ = ()
     MOUSE_EVENTS = [
         "mouse_button_left",
         "mouse_button_right",
@@ -259,6 +301,7 @@ class MouseEvent(Event):
 
 class OtherEvent(Event):
     """Wrap miscellaneous events."""
+    __slots__ = ()
     OTHER_EVENTS = [
         "outside_room",
         "parent_outside_room",
@@ -305,6 +348,7 @@ class OtherEvent(Event):
 
 class DrawEvent(Event):
     """Wrap draw events."""
+    __slots__ = ()
     DRAW_EVENTS = [
         "draw",
         "gui",
@@ -329,6 +373,7 @@ class DrawEvent(Event):
 
 class KeyEvent(Event):
     """Wrap keyboard events."""
+    __slots__ = ()
     ARROW_KEYS = [
         "kb_left",
         "kb_right",
@@ -577,6 +622,7 @@ class KeyEvent(Event):
 
 class CollisionEvent(Event):
     """Wrap collision events."""
+    __slots__ = ("collision_object_name",)
     #: All collision events start with this prefix
     HANDLED_EVENTS = ["collision", "parent_collision", "child_collision"]
 
@@ -6,6 +6,7 @@ Licensed under LGPL v2.1 (see file COPYING for details)
 Define the class that allows other classes to subscribe to and receive events.
 """
 
+import logging
 from pygame_maker.support import logging_object
 
 
@@ -25,15 +26,31 @@ class EventEngine(logging_object.LoggingObject):
         #: have been queued, and that will be transmitted by transmit_event()
         #: when that event name is supplied as a parameter
         self.event_queues = {}
-
-    def register_event_handler(self, event_name, event_handler):
+        # map event names to tuples of their handlers, rebuilt whenever a
+        #  handler is registered or unregistered
+        self._dispatch_table = {}
+        # map event names to lists of (handler, batch handler) pairs, for
+        #  handlers that accept a list of their events; handlers are compared
+        #  by equality, since they may not be hashable
+        self._batch_handlers = {}
+        # map event names to tuples of (handler, batch handler) pairs, only
+        #  for names with at least one batch handler
+        self._batch_table = {}
+
+    def register_event_handler(self, event_name, event_handler, batch_handler=None):
         """
         Add a handler method reference to the named event.
 
+        When a batch handler is supplied, transmit_event() calls it once with
+        the list of all queued events of that name, instead of calling the
+        event handler once per event.
+
         :param event_name: The name of the event to register a handler for
         :type event_name: str
         :param event_handler: The event handler method
         :type event_handler: callable
+        :param batch_handler: An optional method accepting a list of events
+        :type batch_handler: None | callable
         """
         self.debug("register_event_handler({}, <hdlr>):".format(event_name))
         if event_name not in self.event_handlers.keys():
@@ -43,6 +60,11 @@ class EventEngine(logging_object.LoggingObject):
             idx = len(self.event_handlers[event_name]) + 1
             self.info("  add event handler #{:d} for {}".format(idx, event_name))
             self.event_handlers[event_name].append(event_handler)
+        if batch_handler is not None:
+            self._forget_batch_handler(event_name, event_handler)
+            self._batch_handlers.setdefault(event_name, []).append((event_handler,
+                                                                    batch_handler))
+        self._rebuild_dispatch(event_name)
         # print("handlers: {}".format(self.event_handlers))
 
     def unregister_event_handler(self, event_name, event_handler):
@@ -59,9 +81,59 @@ class EventEngine(logging_object.LoggingObject):
             if event_handler in self.event_handlers[event_name]:
                 self.info("  remove event handler for {}".format(event_name))
                 self.event_handlers[event_name].remove(event_handler)
+                if event_handler not in self.event_handlers[event_name]:
+                    self._forget_batch_handler(event_name, event_handler)
                 if len(self.event_handlers[event_name]) == 0:
                     self.info("  delete last event handler for {}".format(event_name))
                     del self.event_handlers[event_name]
+                self._rebuild_dispatch(event_name)
+
+    def _rebuild_dispatch(self, event_name):
+        # Refresh the handler tuples used by transmit_event() for the named
+        #  event.
+        handlers = self.event_handlers.get(event_name)
+        if handlers is None:
+            self._dispatch_table.pop(event_name, None)
+            self._batch_table.pop(event_name, None)
+            return
+        self._dispatch_table[event_name] = tuple(handlers)
+        batch_handlers = self._batch_handlers.get(event_name)
+        if batch_handlers:
+            self._batch_table[event_name] = tuple(
+                (hdlr, self._find_batch_handler(batch_handlers, hdlr)) for hdlr in handlers)
+        else:
+            self._batch_table.pop(event_name, None)
+
+    @staticmethod
+    def _find_batch_handler(batch_handlers, event_handler):
+        # Return the batch handler paired with an event handler, or None
+        for hdlr, batch_hdlr in batch_handlers:
+            if hdlr == event_handler:
+                return batch_hdlr
+        return None
+
+    def _forget_batch_handler(self, event_name, event_handler):
+        # Drop the batch handler paired with an unregistered event handler
+        batch_handlers = [pair for pair in self._batch_handlers.get(event_name, [])
+                          if pair[0] != event_handler]
+        if len(batch_handlers) > 0:
+            self._batch_handlers[event_name] = batch_handlers
+        else:
+            self._batch_handlers.pop(event_name, None)
+
+    def has_handlers(self, event_name):
+        """
+        Report whether any handler is registered for the named event.
+
+        Event sources can check this to avoid queueing events that nothing
+        would receive.
+
+        :param event_name: The name of an event
+        :type event_name: str
+        :return: True if the event has at least one handler, False otherwise
+        :rtype: bool
+        """
+        return event_name in self._dispatch_table
 
     def queue_event(self, an_event):
         """
@@ -70,43 +142,95 @@ class EventEngine(logging_object.LoggingObject):
         :param an_event: The event to add to the queue
         :type an_event: :py:class:`~pygame_maker.events.event.Event`
         """
-        self.debug("queue_event({}):".format(an_event))
         ename = an_event.name
-        if ename not in self.event_queues.keys():
-            self.debug("  queue event #1 named {}".format(ename))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.debug("queue_event({}):".format(an_event))
+            self.debug("  queue event #{:d} named {}".format(
+                len(self.event_queues.get(ename, [])) + 1, ename))
+        queue = self.event_queues.get(ename)
+        if queue is None:
             self.event_queues[ename] = [an_event]
         else:
-            idx = len(self.event_queues[ename]) + 1
-            self.debug("  queue event #{:d} named {}".format(idx, ename))
-            self.event_queues[ename].append(an_event)
+            queue.append(an_event)
         # print("queues: {}".format(self.event_queues))
 
+    def discard_instance_events(self, instance):
+        """
+        Remove the queued events sent to an instance, so they can't reach it
+        after it's destroyed.
+
+        :param instance: The instance named in the events' ``instance``
+            parameter
+        """
+        for event_name in list(self.event_queues.keys()):
+            queued_events = self.event_queues[event_name]
+            kept = [queued for queued in queued_events
+                    if queued.event_params.get("instance") is not instance]
+            if len(kept) == 0:
+                del self.event_queues[event_name]
+            elif len(kept) < len(queued_events):
+                queued_events[:] = kept
+
     def transmit_event(self, event_name):
         """
         Forward queued events matching the named event (if handlers exist for
-        it), to each registered handler.
+        it), to each registered handler.  Queued events without handlers are
+        discarded.
+
+        Handlers registered with a batch handler receive all the queued events
+        in one call; events queued while the batch is handled are delivered in
+        a following batch.
 
         Delete the queued events after handling them.
 
         :param event_name: The name of the event to transmit to its handlers
         :type event_name: str
         """
-        # print("check for {} handlers..".format(event_name))
-        self.debug("transmit_event({}):".format(event_name))
-        if event_name in self.event_handlers.keys():
-            # print("found. check for event queues..")
-            queue_len = len(self.event_queues[event_name])
-            if queue_len > 0:
-                self.debug("  found {:d} queued {} events".format(queue_len,
-                                                                  event_name))
-            for queued in self.event_queues[event_name]:
-                # print("handle queue item {}".format(queued))
-                for idx, handler in enumerate(self.event_handlers[event_name]):
-                    self.debug("    call handler #{:d}".format(idx+1))
+        handlers = self._dispatch_table.get(event_name)
+        if handlers is None:
+            # nothing will receive these events; don't let them pile up
+            self.event_queues.pop(event_name, None)
+            return
+        queued_events = self.event_queues.get(event_name)
+        if queued_events is None:
+            return
+        batch_pairs = self._batch_table.get(event_name)
+        if batch_pairs is not None:
+            self._transmit_batched(batch_pairs, queued_events)
+        elif self.logger.isEnabledFor(logging.DEBUG):
+            self._transmit_logged(event_name, handlers, queued_events)
+        else:
+            # events queued by the handlers are delivered in the same pass
+            for queued in queued_events:
+                for handler in handlers:
                     handler(queued)
-            # clear the queue
-            self.debug("  delete queued {} events".format(event_name))
-            del self.event_queues[event_name]
+        # clear the queue
+        self.event_queues.pop(event_name, None)
+
+    def _transmit_batched(self, batch_pairs, queued_events):
+        # Deliver queued events in rounds, so events queued by the handlers
+        #  are delivered too, as transmit_event() does for single events.
+        start = 0
+        while start < len(queued_events):
+            batch = queued_events[start:]
+            start = len(queued_events)
+            self.debug("  transmit batch of {:d} events".format(len(batch)))
+            for handler, batch_handler in batch_pairs:
+                if batch_handler is not None:
+                    batch_handler(batch)
+                else:
+                    for queued in batch:
+                        handler(queued)
+
+    def _transmit_logged(self, event_name, handlers, queued_events):
+        # Deliver queued events as transmit_event() does, logging each step.
+        self.debug("transmit_event({}):".format(event_name))
+        self.debug("  found {:d} queued {} events".format(len(queued_events), event_name))
+        for queued in queued_events:
+            for idx, handler in enumerate(handlers):
+                self.debug("    call handler #{:d}".format(idx+1))
+                handler(queued)
+        self.debug("  delete queued {} events".format(event_name))
 
     def transmit_event_type(self, event_type):
         """
@@ -14,6 +14,8 @@ import yaml
 import pygame
 from pygame_maker.support import logging_object
 from pygame_maker.support import css_to_style
+from pygame_maker.support import spatial_hash
+from pygame_maker.support import static_bvh
 from pygame_maker.actors import object_sprite
 from pygame_maker.sounds import sound
 from pygame_maker.actors import object_type
@@ -82,6 +84,11 @@ class GameEngine(logging_object.LoggingObject):
         "screen_dimensions": (640, 480),
         "frames_per_second": 60,
         "stylesheet": "",
+        "collision_cell_size": spatial_hash.SpatialHash.DEFAULT_CELL_SIZE,
+        "sprite_mask_cache": False,
+        "simulation_rate": 0,
+        "max_catch_up_steps": 5,
+        "interpolate_rendering": False,
         "logging_config": {
             "version": 1,
             "formatters": {
@@ -185,6 +192,16 @@ class GameEngine(logging_object.LoggingObject):
         self.done = False
         #: The mouse coordinate saved each time a mouse motion event occurs
         self.mouse_pos = [0, 0]
+        # events sent every frame, created once and reused; they're
+        #  read-only, so handlers can't change what later handlers and frames
+        #  receive
+        self._begin_step_event = event.StepEvent('begin_step').make_read_only()
+        self._normal_step_event = event.StepEvent('normal_step').make_read_only()
+        self._end_step_event = event.StepEvent('end_step').make_read_only()
+        self._draw_event = event.DrawEvent('draw').make_read_only()
+        self._no_key_event = event.KeyEvent('kb_no_key').make_read_only()
+        self._no_button_events = ()
+        self._update_no_button_events()
         #: The list where pygame events get stored, so that the pygame event
         #: FIFO doesn't fill up
         self.current_events = []
@@ -197,6 +214,26 @@ class GameEngine(logging_object.LoggingObject):
         #: Store a :py:class:`pygame.time.Clock` instance, used for
         #: controlling the frame rate
         self.clock = None
+        #: How far the drawn frame lies between the previous and the latest
+        #: simulation step, from 0 to 1; None unless rendering is
+        #: interpolated
+        self.render_fraction = None
+        # milliseconds per fixed simulation step, or 0 to update once per
+        #  frame; set by start_simulation()
+        self._step_time = 0
+        # milliseconds that have passed without being simulated yet
+        self._unsimulated_time = 0
+        # map each object type name to the list of object types its
+        #  instances need collision checks against; None until the first
+        #  collision check, or after object types change their collision
+        #  handlers
+        self._collision_interest = None
+        # masks used by region queries, keyed by shape and size
+        self._query_masks = {}
+        # the mouse position last hit-tested, and the instances found under it
+        #  mapped by object type name; None when instances may have moved
+        #  since
+        self._mouse_hits = None
 
         self.load_game_settings()
 
@@ -222,17 +259,50 @@ class GameEngine(logging_object.LoggingObject):
         if len(self.resources['rooms']) == 0:
             raise GameEngineException("No game room resource found")
 
+        #: The uniform grid that limits collision tests to instances that
+        #: are near each other, rebuilt every frame
+        self.collision_grid = spatial_hash.SpatialHash(self.game_settings["collision_cell_size"])
+        #: The overlaps and normals found for colliding instances, kept for
+        #: instances that don't move relative to each other between frames
+        self.collision_contacts = object_type.CollisionContactCache()
+        #: The bounding volume hierarchy holding solid instances that don't
+        #: move, built when a room is loaded
+        self.static_collision_tree = static_bvh.StaticBVH()
+        # let game language functions make region queries, without handing
+        #  the rest of the engine to game code
+        self.language_engine.region_queries = {
+            "get_instances_at_point": self.get_instances_at_point,
+            "get_instances_in_rect": self.get_instances_in_rect,
+            "get_instances_in_circle": self.get_instances_in_circle
+        }
+
     def load_game_settings(self):
         """
         Collect the settings for the game itself, expected to be found in a
         file in the base game directory named ``game_settings.yaml``.
 
+        collision_cell_size sets the width and height, in pixels, of the grid
+        cells that instances are sorted into before collision checks (64 by
+        default); only instances that share a cell are tested against each
+        other.  Cells around the size of a typical sprite work best.
+
+        Setting sprite_mask_cache to true (it defaults to false) keeps each
+        sprite's collision masks in a file next to its image, so they don't
+        have to be recreated every time the game starts; see
+        :py:meth:`~pygame_maker.actors.object_sprite.ObjectSprite.get_mask_cache_filename`.
+        The directories holding the sprite images must then be writable.
+
         The YAML format follows::
 
             game_name: <name>
             screen_dimensions: [<width>, <height>]
             frames_per_second: <positive integer>
             stylesheet: <name of CSS-formatted file>
+            collision_cell_size: <positive integer>
+            sprite_mask_cache: true|false
+            simulation_rate: <non-negative integer>
+            max_catch_up_steps: <positive integer>
+            interpolate_rendering: true|false
             logging_config:
               version: 1
               formatters:
@@ -331,6 +401,9 @@ class GameEngine(logging_object.LoggingObject):
                                 # last one read in will override the others
                                 self.debug("{}".format(res))
                                 self._fix_file_path(res_path, res)
+                                if res_path == "sprites":
+                                    res.use_mask_cache = (
+                                        self.game_settings["sprite_mask_cache"] is True)
                                 self.resources[res_path][res.name] = res
                     else:
                         # rooms are meant to stay in order
@@ -413,7 +486,13 @@ class GameEngine(logging_object.LoggingObject):
                 key_event_init_name = "{}_keydn".format(pk_map[key_event.key])
             elif key_event.type == pygame.KEYUP:
                 key_event_init_name = "{}_keyup".format(pk_map[key_event.key])
-        kev = event.KeyEvent(key_event_init_name)
+        if key_event_init_name == "kb_no_key":
+            if not self.event_engine.has_handlers(key_event_init_name):
+                # no object type handles the absence of key presses
+                return
+            kev = self._no_key_event
+        else:
+            kev = event.KeyEvent(key_event_init_name)
         # print("queue event: {}".format(kev))
         self.event_engine.queue_event(kev)
         # print("xmit event: {}".format(key_event_name))
@@ -436,6 +515,7 @@ class GameEngine(logging_object.LoggingObject):
         if mouse_event:
             self.mouse_pos[0] = mouse_event.pos[0]
             self.mouse_pos[1] = mouse_event.pos[1]
+            self._update_no_button_events()
             self.language_engine.global_symbol_table.set_constant(
                 'mouse.x', self.mouse_pos[0])
             self.language_engine.global_symbol_table.set_constant(
@@ -505,18 +585,24 @@ class GameEngine(logging_object.LoggingObject):
                         event_names.append(ev_table_entry["global_released_name"])
                         # print("queue {}".format(event_names[-1]))
         else:
-            self.event_engine.queue_event(
-                event.MouseEvent("mouse_nobutton", {"position": self.mouse_pos}))
-            event_names.append("mouse_nobutton")
-            self.event_engine.queue_event(
-                event.MouseEvent("mouse_global_nobutton", {"position": self.mouse_pos}))
-            event_names.append("mouse_global_nobutton")
+            for no_button_event in self._no_button_events:
+                if self.event_engine.has_handlers(no_button_event.name):
+                    self.event_engine.queue_event(no_button_event)
+                    event_names.append(no_button_event.name)
         # transmit all queued event types
         for ev_name in event_names:
             self.event_engine.transmit_event(ev_name)
             if ev_name not in ['mouse_nobutton', 'mouse_global_nobutton']:
                 self.debug("Event '{}' queued and transmitted".format(ev_name))
 
+    def _update_no_button_events(self):
+        # Create the read-only nobutton events sent every frame that has no
+        #  mouse button event, holding the current mouse position.
+        position = tuple(self.mouse_pos)
+        self._no_button_events = tuple(
+            event.MouseEvent(ev_name, {"position": position}).make_read_only()
+            for ev_name in ("mouse_nobutton", "mouse_global_nobutton"))
+
     def setup(self, screen):
         """
         Called by :py:meth:`run` after pygame has been initialized.
@@ -592,6 +678,260 @@ class GameEngine(logging_object.LoggingObject):
         self.symbols.set_constant('room_height', room_height)
         self.info("Room {:d} loaded.".format(room_n))
 
+    def build_static_collision_tree(self):
+        """
+        Place the current room's static instances (see
+        :py:meth:`~pygame_maker.actors.object_type.CollideableObjectType.get_static_instances`)
+        into a bounding volume hierarchy, so they don't need to be added to
+        the collision grid each frame.  Called by
+        :py:meth:`~pygame_maker.scenes.room.Room.load_room`.
+        """
+        static_instances = []
+        for obj_type in self.resources['objects'].values():
+            static_instances.extend(obj_type.get_static_instances())
+        self.static_collision_tree.build(
+            [(inst, object_type.get_collision_bounds(inst)) for inst in static_instances])
+        self.debug("{:d} static instances placed in collision tree".
+                   format(len(self.static_collision_tree)))
+
+    def invalidate_collision_interest(self):
+        """
+        Discard the collision interest matrix, so it will be rebuilt before
+        the next collision check.  Object types call this when their
+        collision event handlers or their ``solid`` flag change.
+        """
+        self._collision_interest = None
+
+    def get_collision_interest(self):
+        """
+        Find the object type pairs that need collision checks.
+
+        Testing an object type's instances for collisions with another
+        type's instances is only useful if it can have an effect:
+
+        * the first type handles the ``collision_<other type>`` event
+        * any type handles ``child_collision_<other type>`` or
+          ``parent_collision_<other type>``, since instances of any type can
+          be parents or children
+        * the other type is solid, so instances will be pushed out of it
+
+        :return: A dict mapping each object type name to a list of the object
+            types to check it against, in ``resources['objects']`` order
+        :rtype: dict
+        """
+        if ((self._collision_interest is None) or
+                (len(self._collision_interest) != len(self.resources['objects']))):
+            obj_types = self.resources['objects'].values()
+            # names of object types that parent_ or child_ collision events
+            #  are handled for
+            relative_collision_names = set()
+            for obj_type in obj_types:
+                for ev_name in obj_type.event_action_sequences.keys():
+                    minfo = object_type.ObjectType.COLLISION_EVENT_RE.match(ev_name)
+                    if minfo and minfo.group(1):
+                        relative_collision_names.add(minfo.group(2))
+            self._collision_interest = {}
+            for obj_type in obj_types:
+                self._collision_interest[obj_type.name] = [
+                    other for other in obj_types
+                    if (getattr(other, "solid", False) or
+                        other.name in relative_collision_names or
+                        "collision_{}".format(other.name) in obj_type.event_action_sequences)
+                ]
+        return self._collision_interest
+
+    def get_instances_overlapping_mask(self, mask, position, object_types=None):
+        """
+        Find the object instances whose collision masks overlap a mask placed
+        at a position.
+
+        Candidates come from the collision grid and the static collision
+        tree, so only the instances near the mask are tested.  Instances
+        that are about to be deleted are left out.
+
+        :param mask: The mask to test
+        :type mask: :py:class:`pygame.mask.Mask`
+        :param position: The XY coordinate of the mask's upper left corner
+        :type position: (int, int)
+        :param object_types: The names of the object types to search, or
+            None to search all object types
+        :type object_types: None | list of str
+        :return: The overlapping instances, sorted by object type name and
+            instance ID
+        :rtype: list
+        """
+        self._refresh_collision_grid()
+        mask_size = mask.get_size()
+        search_rect = pygame.Rect(int(position[0]), int(position[1]), mask_size[0],
+                                  mask_size[1])
+        candidates = (self.collision_grid.query(search_rect) |
+                      self.static_collision_tree.query(search_rect))
+        found = []
+        for inst in candidates:
+            if (object_types is not None) and (inst.kind.name not in object_types):
+                continue
+            if (inst not in inst.kind.group) or (inst in inst.kind.instance_delete_list):
+                continue
+            if object_type.mask_overlaps_instance(mask, search_rect.topleft, inst):
+                found.append(inst)
+        found.sort(key=lambda inst: (inst.kind.name, inst.inst_id))
+        return found
+
+    def get_instances_at_point(self, point, object_types=None):
+        """
+        Find the object instances with a collision mask pixel at a point.
+
+        :param point: The XY coordinate to search
+        :type point: (int, int)
+        :param object_types: The names of the object types to search, or
+            None to search all object types
+        :type object_types: None | list of str
+        :return: The instances found, sorted by object type name and instance
+            ID
+        :rtype: list
+        """
+        return self.get_instances_overlapping_mask(self._get_query_mask("rect", 1, 1), point,
+                                                   object_types)
+
+    def get_instances_in_rect(self, rect, object_types=None):
+        """
+        Find the object instances whose collision masks overlap a rectangle.
+
+        :param rect: The rectangle to search
+        :type rect: :py:class:`pygame.Rect`
+        :param object_types: The names of the object types to search, or
+            None to search all object types
+        :type object_types: None | list of str
+        :return: The instances found, sorted by object type name and instance
+            ID
+        :rtype: list
+        """
+        rect = pygame.Rect(rect)
+        if rect.width < 1 or rect.height < 1:
+            return []
+        return self.get_instances_overlapping_mask(
+            self._get_query_mask("rect", rect.width, rect.height), rect.topleft, object_types)
+
+    def get_instances_in_circle(self, center, radius, object_types=None):
+        """
+        Find the object instances whose collision masks overlap a circle.
+
+        :param center: The XY coordinate of the circle's center
+        :type center: (int, int)
+        :param radius: The circle's radius
+        :type radius: int
+        :param object_types: The names of the object types to search, or
+            None to search all object types
+        :type object_types: None | list of str
+        :return: The instances found, sorted by object type name and instance
+            ID
+        :rtype: list
+        """
+        radius = int(radius)
+        if radius < 0:
+            return []
+        if radius == 0:
+            return self.get_instances_at_point(center, object_types)
+        return self.get_instances_overlapping_mask(
+            self._get_query_mask("disk", radius), (int(center[0]) - radius,
+                                                   int(center[1]) - radius),
+            object_types)
+
+    def get_instances_under_mouse(self, position, obj_type):
+        """
+        Find the visible instances of an object type whose rects contain the
+        mouse position, so mouse events can be sent to them.
+
+        Every object type's instances are hit-tested together, once for each
+        mouse position, using the collision grid and static collision tree.
+        The result is reused by all object types that handle the mouse
+        event, until an instance moves or the next frame begins.
+
+        :param position: The mouse XY coordinate
+        :type position: (int, int)
+        :param obj_type: The object type whose instances are wanted
+        :type obj_type: :py:class:`~pygame_maker.actors.object_type.ObjectType`
+        :return: The instances under the mouse, in sprite group order (bottom
+            layer first)
+        :rtype: list
+        """
+        position = (int(position[0]), int(position[1]))
+        if (self._refresh_collision_grid() or (self._mouse_hits is None) or
+                (self._mouse_hits[0] != position)):
+            # use the same empty rect test as pygame's
+            #  LayeredUpdates.get_sprites_at()
+            point_rect = pygame.Rect(position, (0, 0))
+            hits = {}
+            for inst in (self.collision_grid.query(point_rect) |
+                         self.static_collision_tree.query(point_rect)):
+                if point_rect.colliderect(inst.rect) and (inst in inst.kind.group):
+                    hits.setdefault(inst.kind.name, []).append(inst)
+            for type_hits in hits.values():
+                type_hits.sort(key=type_hits[0].kind.group_order_key)
+            self._mouse_hits = (position, hits)
+        return [inst for inst in self._mouse_hits[1].get(obj_type.name, [])
+                if inst.visible]
+
+    def get_instance_memory_report(self):
+        """
+        Report the approximate memory used by each object type's instances,
+        as measured by
+        :py:func:`~pygame_maker.actors.object_type.get_instance_size`.
+
+        :return: A dict mapping the name of each object type that has
+            instances to the average number of bytes used per instance
+        :rtype: dict
+        """
+        report = {}
+        for obj_name, obj_type in self.resources['objects'].items():
+            instances = obj_type.get_instances()
+            if len(instances) == 0:
+                continue
+            total_size = sum(object_type.get_instance_size(inst) for inst in instances)
+            report[obj_name] = total_size // len(instances)
+        return report
+
+    def get_instance_activity(self):
+        """
+        Count the object instances that are active, and those dormant for
+        being outside the visible area of the room (see the
+        ``inactive_outside_view`` object type setting).  Dormant instances
+        still move, but skip step events and drawing.
+
+        :return: The number of active instances and the number of dormant
+            instances
+        :rtype: (int, int)
+        """
+        active = 0
+        dormant = 0
+        for obj_type in self.resources['objects'].values():
+            dormant_count = len(getattr(obj_type, "dormant_instances", ()))
+            active += len(obj_type.get_instances()) - dormant_count
+            dormant += dormant_count
+        return active, dormant
+
+    def _refresh_collision_grid(self):
+        # Move instances created or moved since the collision grid was built
+        #  to their new places in it.  Return True if any instance changed.
+        changed = False
+        for obj_type in self.resources['objects'].values():
+            if obj_type.index_moved_instances(self.collision_grid):
+                changed = True
+        return changed
+
+    def _get_query_mask(self, shape, *size):
+        # create region query masks once for each shape and size
+        key = (shape,) + size
+        if key not in self._query_masks:
+            if shape == "disk":
+                diameter = 2 * size[0] + 1
+                self._query_masks[key] = object_sprite.create_disk_mask(
+                    pygame.Rect(0, 0, diameter, diameter), size[0])
+            else:
+                self._query_masks[key] = object_sprite.create_rectangle_mask(
+                    pygame.Rect(0, 0, size[0], size[1]))
+        return self._query_masks[key]
+
     def collect_event(self, an_event):
         """
         The pygame event queue will lose events unless they are handled.  This
@@ -614,6 +954,10 @@ class GameEngine(logging_object.LoggingObject):
         #  received this frame
         key_pressed = False
         mouse_button = False
+        if self.render_fraction is not None:
+            # remember where instances were, to draw them between steps
+            for obj_type in self.resources['objects'].values():
+                obj_type.store_previous_positions()
         # create any new objects that were queued by create_object* events
         for new_obj, params in self.new_object_queue:
             # This will transmit a 'create' event that will be received by the
@@ -623,9 +967,7 @@ class GameEngine(logging_object.LoggingObject):
         self.new_object_queue = []
         # begin_step happens before other events, but after create (new
         #  instances receive all events)
-        sev = event.StepEvent('begin_step')
-        self.event_engine.queue_event(sev)
-        self.event_engine.transmit_event(sev.name)
+        self._send_frame_event(self._begin_step_event)
         for cev in self.current_events:
             if cev.type == pygame.QUIT:
                 self.done = True
@@ -651,30 +993,109 @@ class GameEngine(logging_object.LoggingObject):
         # done with event handling
         self.current_events = []
         # normal_step happens before updating object instance positions
-        sev = event.StepEvent('normal_step')
-        self.event_engine.queue_event(sev)
-        self.event_engine.transmit_event(sev.name)
+        self._send_frame_event(self._normal_step_event)
         # perform position updates on all objects
         for obj_name in self.resources['objects'].keys():
             self.resources['objects'][obj_name].update()
         # check for object instance collisions
-        obj_types = self.resources['objects'].values()
+        obj_types = list(self.resources['objects'].values())
+        # sort instances into grid cells, so only neighbors get tested for
+        #  collisions
+        self.collision_grid.clear()
+        for obj_type in obj_types:
+            obj_type.index_instances(self.collision_grid)
+        self._mouse_hits = None
+        self.collision_contacts.next_frame()
         collision_types = set()
-        for obj_name in self.resources['objects'].keys():
-            collision_types |= self.resources['objects'][obj_name].collision_check(obj_types)
+        # only check object type pairs whose collisions would have an effect,
+        #  and check each pair once for both types
+        collision_interest = self.get_collision_interest()
+        for type_idx, obj_type in enumerate(obj_types):
+            for other_type in obj_types[type_idx:]:
+                check_self = other_type in collision_interest[obj_type.name]
+                check_other = obj_type in collision_interest[other_type.name]
+                if check_self or check_other:
+                    collision_types |= obj_type.collision_check_pair(other_type, check_self,
+                                                                     check_other)
         if len(collision_types) > 0:
             for coll_type in collision_types:
                 self.event_engine.transmit_event(coll_type)
 
+    def end_step(self):
+        """
+        Called by :py:meth:`run` after each update, when the simulation runs
+        at a fixed rate, or by :py:meth:`draw_objects` otherwise.
+        """
+        self._send_frame_event(self._end_step_event)
+
+    def start_simulation(self):
+        """
+        Called by :py:meth:`run` before the main loop, to prepare
+        :py:meth:`simulate` for the game's simulation_rate setting.  The
+        first call to :py:meth:`simulate` always runs one update.
+        """
+        # with a simulation rate, update in fixed steps of this many
+        #  milliseconds, as many as fit into the time that has passed
+        self._step_time = 0
+        if self.game_settings['simulation_rate'] > 0:
+            self._step_time = 1000.0 / self.game_settings['simulation_rate']
+        # start with enough time saved up for the first step
+        self._unsimulated_time = self._step_time
+        self.render_fraction = None
+        if (self._step_time > 0) and self.game_settings['interpolate_rendering']:
+            self.render_fraction = 0.0
+
+    def simulate(self, elapsed_time):
+        """
+        Called by :py:meth:`run` once per frame, to run the game logic for
+        the time that has passed since the previous frame.
+
+        Without a simulation_rate, this runs one :py:meth:`update`.
+        Otherwise, it runs :py:meth:`update` and :py:meth:`end_step` once for
+        every fixed step that fits into the time not yet simulated, up to
+        max_catch_up_steps.  Time left over after that many steps is dropped,
+        so a game that falls behind slows down instead of spending every
+        frame on updates.  With interpolate_rendering, render_fraction is
+        set to how far the remaining time reaches toward the next step.
+
+        :param elapsed_time: Milliseconds since the previous frame
+        :type elapsed_time: int | float
+        :return: The number of updates run
+        :rtype: int
+        """
+        step_time = self._step_time
+        if step_time <= 0:
+            self.update()
+            return 1
+        self._unsimulated_time += elapsed_time
+        steps = 0
+        while ((self._unsimulated_time >= step_time) and
+               (steps < self.game_settings['max_catch_up_steps']) and
+               not self.done):
+            self.update()
+            self.end_step()
+            self._unsimulated_time -= step_time
+            steps += 1
+        if self._unsimulated_time >= step_time:
+            # too far behind to catch up
+            self._unsimulated_time %= step_time
+        if self.render_fraction is not None:
+            self.render_fraction = self._unsimulated_time / step_time
+        return steps
+
     def draw_objects(self):
         """Called by :py:meth:`run` to draw the foreground items."""
-        # end_step happens just before drawing object instances
-        sev = event.StepEvent('end_step')
-        self.event_engine.queue_event(sev)
-        self.event_engine.transmit_event(sev.name)
-        drev = event.DrawEvent('draw')
-        self.event_engine.queue_event(drev)
-        self.event_engine.transmit_event(drev.name)
+        if self.game_settings['simulation_rate'] <= 0:
+            # end_step happens just before drawing object instances
+            self.end_step()
+        self._send_frame_event(self._draw_event)
+
+    def _send_frame_event(self, frame_event):
+        # Queue and transmit one of the events sent every frame, unless no
+        #  object type has an action sequence for it.
+        if self.event_engine.has_handlers(frame_event.name):
+            self.event_engine.queue_event(frame_event)
+            self.event_engine.transmit_event(frame_event.name)
 
     def draw_background(self):
         """Called by :py:meth:`run` to draw the room background."""
@@ -702,6 +1123,8 @@ class GameEngine(logging_object.LoggingObject):
         self.setup(self.screen)
         pygame.display.set_caption(self.game_settings['game_name'])
         self.clock = pygame.time.Clock()
+        self.start_simulation()
+        elapsed_time = 0
 
         # --- Main Loop ---
         while not self.done:
@@ -709,19 +1132,22 @@ class GameEngine(logging_object.LoggingObject):
                 self.collect_event(an_event)
 
             # --- Game Logic ---
-            self.update()
+            steps = self.simulate(elapsed_time)
 
-            #self.screen.fill(self.WHITE)
-            # --- Drawing ---
-            self.draw_background()
-            self.draw_objects()
+            # without interpolation, a frame with no new step would look
+            #  the same as the last one
+            if (steps > 0) or (self.render_fraction is not None):
+                #self.screen.fill(self.WHITE)
+                # --- Drawing ---
+                self.draw_background()
+                self.draw_objects()
 
-            # update screen
-            self.final_pass()
-            pygame.display.flip()
+                # update screen
+                self.final_pass()
+                pygame.display.flip()
 
             # limit frame rate
-            self.clock.tick(self.game_settings['frames_per_second'])
+            elapsed_time = self.clock.tick(self.game_settings['frames_per_second'])
 
         # close window & quit
         pygame.quit()
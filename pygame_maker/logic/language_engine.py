@@ -87,11 +87,16 @@ class SymbolTable(object):
     if specified in sym_change_callback, will be called whenever a symbol
     changes.  The callback will be expected to have the signature
     callback(sym_name, new_value).
+
+    Many symbol tables can share one dict of default values, passed in
+    shared_symbols.  A shared symbol is read from that dict until it is set
+    in this table, so each table only stores the symbols that differ from
+    their defaults.
     """
     #: Any unknown symbol receives this value, to help with debugging
     DEFAULT_UNINITIALIZED_VALUE = -sys.maxint - 1
 
-    def __init__(self, initial_symbols=None, sym_change_callback=None):
+    def __init__(self, initial_symbols=None, sym_change_callback=None, shared_symbols=None):
         """
         Initialize a new symbol table.
 
@@ -101,12 +106,18 @@ class SymbolTable(object):
         :param sym_change_callback: An optional callback to execute whenever
             the interpreted language changes a symbol's value
         :type sym_change_callback: callable
+        :param shared_symbols: Default variable values, which are never
+            modified by this table
+        :type shared_symbols: dict
         """
         self.vars = {}
         if initial_symbols is not None:
             self.vars.update(initial_symbols)
         self.sym_change_callback = sym_change_callback
         self.consts = {}
+        self.shared = {}
+        if shared_symbols is not None:
+            self.shared = shared_symbols
 
     def dump_vars(self):
         """
@@ -118,11 +129,19 @@ class SymbolTable(object):
         print "constants:"
         for const in constlist:
             print "{} = {}".format(const, self.consts[const])
-        varlist = list(self.vars.keys())
+        varlist = list(set(self.vars.keys()) | set(self.shared.keys()))
         varlist.sort()
         print "variables:"
         for var in varlist:
-            print "{} = {}".format(var, self.vars[var])
+            print "{} = {}".format(var, self[var])
+
+    def clear(self):
+        """
+        Remove all variables and constants.  Shared symbols go back to their
+        default values.
+        """
+        self.vars.clear()
+        self.consts.clear()
 
     def keys(self):
         """
@@ -131,7 +150,8 @@ class SymbolTable(object):
         :return: Symbol list
         :rtype: list
         """
-        return self.vars.keys() + self.consts.keys()
+        shared_keys = [sym for sym in self.shared if sym not in self.vars]
+        return self.vars.keys() + shared_keys + self.consts.keys()
 
     def __setitem__(self, item, val):
         """
@@ -163,6 +183,8 @@ class SymbolTable(object):
             new_val = self.consts[item]
         elif item in self.vars:
             new_val = self.vars[item]
+        elif item in self.shared:
+            new_val = self.shared[item]
         # print("Retrieve item {}: {}".format(item, new_val))
         return new_val
 
@@ -1136,7 +1158,7 @@ class CodeBlock(logging_object.LoggingObject):
         Execute the ``run()`` function inside the Python code block.
 
         :param sym_tables: A mapping of 'globals' => global symbol table,
-            'locals' => local symbol table
+            'locals' => local symbol table, 'queries' => region query functions
         :type sym_tables: dict
         """
         self.debug("run(sym_tables={}):".format(str(sym_tables)))
@@ -1236,6 +1258,9 @@ class LanguageEngine(logging_object.LoggingObject):
         self.global_symbol_table = SymbolTable()
         self.global_symbol_table.set_constant('pi', math.pi)
         self.global_symbol_table.set_constant('e', math.e)
+        #: The region query functions that game language code may call,
+        #: by name; the game engine fills these in
+        self.region_queries = {}
         #: A dict containing known function signatures
         self.functionmap = {
             'distance': {"arglist":
@@ -1252,7 +1277,31 @@ class LanguageEngine(logging_object.LoggingObject):
             'debug': {"argslist":
                       [{"type": "string", "name": "debug_str"}],
                       'block': []
-                     }
+                     },
+            'instance_count_at': {"arglist":
+                                  [{"type": "number", "name": "x"},
+                                   {"type": "number", "name": "y"}],
+                                  'block': []
+                                 },
+            'instance_count_in_rect': {"arglist":
+                                       [{"type": "number", "name": "x"},
+                                        {"type": "number", "name": "y"},
+                                        {"type": "number", "name": "width"},
+                                        {"type": "number", "name": "height"}],
+                                       'block': []
+                                      },
+            'instance_count_in_circle': {"arglist":
+                                         [{"type": "number", "name": "x"},
+                                          {"type": "number", "name": "y"},
+                                          {"type": "number", "name": "radius"}],
+                                         'block': []
+                                        },
+            'object_count_at': {"arglist":
+                                [{"type": "string", "name": "object_name"},
+                                 {"type": "number", "name": "x"},
+                                 {"type": "number", "name": "y"}],
+                                'block': []
+                               }
         }
         #: Code blocks registered in the language engine
         self.code_blocks = {}
@@ -1307,7 +1356,8 @@ class LanguageEngine(logging_object.LoggingObject):
                 self.local_tables[block_name] = {}
             self.local_tables[block_name].update(local_symbol_table)
         symtables = {'globals': self.global_symbol_table,
-                     'locals': local_symbol_table}
+                     'locals': local_symbol_table,
+                     'queries': self.region_queries}
         self.code_blocks[block_name].module_context.run(symtables)
 
     def unregister_code_block(self, block_name):
@@ -126,3 +126,93 @@ def userfunc_debug(_symbols, debug_str, count=0):
     """
     sys.stderr.write("{}\n".format(debug_str))
     return debug_str
+
+
+def _count_instances(_symbols, query_name, *args):
+    # Make a region query through the functions the game engine handed to
+    #  the language engine, and count the instances found.  Code blocks run
+    #  without a game engine find nothing.
+    region_queries = _symbols.get("queries", {})
+    if query_name not in region_queries:
+        return 0
+    return len(region_queries[query_name](*args))
+
+
+def userfunc_instance_count_at(_symbols, x, y, count=0):
+    """
+    Make an ``instance_count_at`` function available to game language code,
+    that counts the object instances with a collision mask pixel at a point.
+
+    :param _symbols: The symbols dict
+    :type _symbols: dict
+    :param x: The point's X coordinate
+    :type x: Number
+    :param y: The point's Y coordinate
+    :type y: Number
+    :return: The number of instances found
+    :rtype: int
+    """
+    return _count_instances(_symbols, "get_instances_at_point", (int(x), int(y)))
+
+
+def userfunc_instance_count_in_rect(_symbols, x, y, width, height, count=0):
+    """
+    Make an ``instance_count_in_rect`` function available to game language
+    code, that counts the object instances overlapping a rectangle.
+
+    :param _symbols: The symbols dict
+    :type _symbols: dict
+    :param x: The X coordinate of the rectangle's upper left corner
+    :type x: Number
+    :param y: The Y coordinate of the rectangle's upper left corner
+    :type y: Number
+    :param width: The rectangle's width
+    :type width: Number
+    :param height: The rectangle's height
+    :type height: Number
+    :return: The number of instances found
+    :rtype: int
+    """
+    return _count_instances(_symbols, "get_instances_in_rect",
+                            (int(x), int(y), int(width), int(height)))
+
+
+def userfunc_instance_count_in_circle(_symbols, x, y, radius, count=0):
+    """
+    Make an ``instance_count_in_circle`` function available to game language
+    code, that counts the object instances overlapping a circle.
+
+    :param _symbols: The symbols dict
+    :type _symbols: dict
+    :param x: The X coordinate of the circle's center
+    :type x: Number
+    :param y: The Y coordinate of the circle's center
+    :type y: Number
+    :param radius: The circle's radius
+    :type radius: Number
+    :return: The number of instances found
+    :rtype: int
+    """
+    return _count_instances(_symbols, "get_instances_in_circle", (int(x), int(y)),
+                            int(radius))
+
+
+def userfunc_object_count_at(_symbols, object_name, x, y, count=0):
+    """
+    Make an ``object_count_at`` function available to game language code,
+    that counts the instances of one object type with a collision mask pixel
+    at a point.
+
+    :param _symbols: The symbols dict
+    :type _symbols: dict
+    :param object_name: The name of the object type to count
+    :type object_name: str
+    :param x: The point's X coordinate
+    :type x: Number
+    :param y: The point's Y coordinate
+    :type y: Number
+    :return: The number of instances found
+    :rtype: int
+    """
+    return _count_instances(_symbols, "get_instances_at_point", (int(x), int(y)),
+                            [object_name])
@@ -374,6 +374,10 @@ class Room(logging_object.LoggingObject):
         for an_object, positionxy, init_code in self.init_object_instances:
             self.add_object_instance_at(surface, an_object, positionxy,
                                         init_code)
+        # stationary solid instances only need to be sorted for collision
+        #  checks once
+        if hasattr(self.game_engine, "build_static_collision_tree"):
+            self.game_engine.build_static_collision_tree()
 
     def draw_room_background(self, surface):
         """
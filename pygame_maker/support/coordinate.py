@@ -15,6 +15,8 @@ class Coordinate(object):
 
     Allows for running callback methods when x and/or y are changed.
     """
+    __slots__ = ("_xcoord", "_ycoord", "x_callback", "y_callback")
+
     def __init__(self, x=0, y=0, x_change_callback=None, y_change_callback=None):
         """
         Store an x, y coordinate.
@@ -63,6 +65,20 @@ class Coordinate(object):
         """Return a copy of the coordinate, complete with callbacks."""
         return Coordinate(self.x, self.y, self.x_callback, self.y_callback)
 
+    def store(self, x, y):
+        """
+        Set both components at once, without running the change callbacks.
+
+        :param x: New X component
+        :type x: int | float
+        :param y: New Y component
+        :type y: int | float
+        """
+        #pylint: disable=invalid-name
+        self._xcoord = x
+        self._ycoord = y
+        #pylint: enable=invalid-name
+
     def __getitem__(self, itemkey):
         """
         Support index form coordinate[0] for x or coordinate[1] for y.
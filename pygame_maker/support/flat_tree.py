@@ -0,0 +1,87 @@
+"""
+Author: Ron Lockwood-Childs
+
+Licensed under LGPL v2.1 (see file COPYING for details)
+
+Pygame maker flattened tree class.
+"""
+
+import numpy as np
+
+
+class FlatTree(object):
+    """
+    Store a tree of items in a flat list, in depth-first order.
+
+    Every item comes after its parent, so one pass from start to end visits
+    parents before their children.  Every subtree fills a contiguous range
+    of indices, starting with the subtree's own root.
+    """
+
+    def __init__(self, root, get_children):
+        """
+        Flatten the tree below a root item.
+
+        :param root: The item at the root of the tree; must be hashable
+        :param get_children: A function returning the list of an item's
+            children
+        :type get_children: callable
+        """
+        #: The items, in depth-first order; the root is first
+        self.items = []
+        #: The index of each item's parent; -1 for the root
+        self.parents = []
+        #: The index just past the end of each item's subtree
+        self.subtree_ends = []
+        # map items to their indices
+        self._indices = {}
+        stack = [(root, -1)]
+        while len(stack) > 0:
+            item, parent_idx = stack.pop()
+            idx = len(self.items)
+            self.items.append(item)
+            self.parents.append(parent_idx)
+            self.subtree_ends.append(idx + 1)
+            self._indices[item] = idx
+            # push children in reverse, so they are flattened in order
+            for child in reversed(get_children(item)):
+                stack.append((child, idx))
+        # every subtree ends where the last of its descendants' subtrees ends
+        for idx in range(len(self.items) - 1, 0, -1):
+            parent_idx = self.parents[idx]
+            self.subtree_ends[parent_idx] = max(self.subtree_ends[parent_idx],
+                                                self.subtree_ends[idx])
+
+    def index(self, item):
+        """
+        Return an item's index.
+
+        :param item: An item in the tree
+        :return: The item's index, or None if the item isn't in the tree
+        :rtype: None | int
+        """
+        return self._indices.get(item)
+
+    def get_subtree_indices(self, items):
+        """
+        Return the indices of the given items and all their descendants, in
+        depth-first order.  Each index is listed once, even when the items'
+        subtrees overlap.
+
+        :param items: Items in the tree; items not in the tree are ignored
+        :type items: iterable
+        :return: The subtrees' indices
+        :rtype: numpy.ndarray
+        """
+        touched = np.zeros(len(self.items), dtype=bool)
+        for item in items:
+            idx = self._indices.get(item)
+            if idx is not None:
+                touched[idx:self.subtree_ends[idx]] = True
+        return np.flatnonzero(touched)
+
+    def __contains__(self, item):
+        return item in self._indices
+
+    def __len__(self):
+        return len(self.items)
@@ -0,0 +1,168 @@
+"""
+Author: Ron Lockwood-Childs
+
+Licensed under LGPL v2.1 (see file COPYING for details)
+
+Pygame maker motion arrays class.
+"""
+
+import numpy as np
+
+
+class MotionArrays(object):
+    """
+    Store the motion state of many items in parallel NumPy arrays, one row
+    per field, so the whole set of items can be moved in one step.
+
+    Each item is assigned a slot, which is its column in every row.  Slots
+    stay packed at the start of the arrays: removing an item moves the item
+    in the last slot into the freed one.
+    """
+    #: Names of the stored fields, in row order
+    FIELDS = ("x", "y", "speed", "direction", "hspeed", "vspeed", "friction",
+              "gravity", "gravity_direction")
+    #: Number of slots allocated before the arrays first need to grow
+    INITIAL_CAPACITY = 16
+
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        """
+        Create empty motion arrays.
+
+        :param capacity: The number of slots to allocate up front
+        :type capacity: int
+        """
+        #: The item stored in each slot
+        self.items = []
+        # map items to their slots
+        self._slots = {}
+        self._data = np.zeros((len(self.FIELDS), max(int(capacity), 1)))
+
+    def add(self, item):
+        """
+        Give an item a slot.  Items that already have one keep it.
+
+        :param item: The item to add; must be hashable
+        :return: The item's slot
+        :rtype: int
+        """
+        if item in self._slots:
+            return self._slots[item]
+        slot = len(self.items)
+        if slot == self._data.shape[1]:
+            grown = np.zeros((len(self.FIELDS), slot * 2))
+            grown[:, :slot] = self._data
+            self._data = grown
+        self._data[:, slot] = 0.0
+        self.items.append(item)
+        self._slots[item] = slot
+        return slot
+
+    def remove(self, item):
+        """
+        Free an item's slot.  Items that aren't present are ignored.
+
+        :param item: The item to remove
+        """
+        slot = self._slots.pop(item, None)
+        if slot is None:
+            return
+        last_slot = len(self.items) - 1
+        last_item = self.items.pop()
+        if slot != last_slot:
+            self._data[:, slot] = self._data[:, last_slot]
+            self.items[slot] = last_item
+            self._slots[last_item] = slot
+
+    def get_slot(self, item):
+        """
+        Return the slot assigned to an item.
+
+        :param item: The item to look up
+        :return: The item's slot, or None if not present
+        :rtype: None | int
+        """
+        return self._slots.get(item)
+
+    def store(self, item, values):
+        """
+        Copy an item's motion state into its slot, adding the item if needed.
+
+        :param item: The item to store
+        :param values: One value for each name in :py:attr:`FIELDS`, in the
+            same order
+        :type values: sequence of float
+        """
+        # add() may grow the arrays, so find the slot first
+        slot = self.add(item)
+        self._data[:, slot] = values
+
+    def load(self, item):
+        """
+        Return an item's motion state.
+
+        :param item: The item to look up
+        :return: One value for each name in :py:attr:`FIELDS`, in the same
+            order
+        :rtype: list of float
+        """
+        return self._data[:, self._slots[item]].tolist()
+
+    def column(self, field):
+        """
+        Return one field for all occupied slots.
+
+        :param field: One of the names in :py:attr:`FIELDS`
+        :type field: str
+        :return: A view of the field's row; writing to it changes the stored
+            values
+        :rtype: numpy.ndarray
+        """
+        return self._data[self.FIELDS.index(field), :len(self.items)]
+
+    def integrate(self, slots):
+        """
+        Move the items in the given slots by their hspeed and vspeed.
+
+        :param slots: The slots to move
+        :type slots: numpy.ndarray
+        :return: The new x and y positions, rounded to the nearest whole pixel
+        :rtype: (list of int, list of int)
+        """
+        data = self._data
+        new_x = data[0, slots] + data[4, slots]
+        new_y = data[1, slots] + data[5, slots]
+        data[0, slots] = new_x
+        data[1, slots] = new_y
+        rounded_x = np.floor(new_x + 0.5).astype(int).tolist()
+        rounded_y = np.floor(new_y + 0.5).astype(int).tolist()
+        return (rounded_x, rounded_y)
+
+    def apply_friction(self, slots):
+        """
+        Slow the moving items in the given slots by their friction, without
+        letting their speed drop below zero.  Their hspeed and vspeed are
+        recalculated from the new speed.
+
+        :param slots: The slots to slow down
+        :type slots: numpy.ndarray
+        :return: The slots that slowed down
+        :rtype: numpy.ndarray
+        """
+        data = self._data
+        speed = data[2, slots]
+        friction = data[6, slots]
+        slowed = slots[(friction > 0.0) & (speed > 0.0)]
+        if len(slowed) == 0:
+            return slowed
+        new_speed = np.maximum(data[2, slowed] - data[6, slowed], 0.0)
+        radians = data[3, slowed] / 180.0 * np.pi
+        data[2, slowed] = new_speed
+        data[4, slowed] = new_speed * np.sin(radians)
+        data[5, slowed] = new_speed * -1 * np.cos(radians)
+        return slowed
+
+    def __contains__(self, item):
+        return item in self._slots
+
+    def __len__(self):
+        return len(self.items)
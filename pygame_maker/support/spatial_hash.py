@@ -0,0 +1,125 @@
+"""
+Author: Ron Lockwood-Childs
+
+Licensed under LGPL v2.1 (see file COPYING for details)
+
+Pygame maker spatial hash class.
+"""
+
+
+class SpatialHash(object):
+    """
+    Sort items into the cells of a uniform grid, using each item's bounding
+    rectangle.
+
+    An item is placed in every cell its rectangle touches, so any two items
+    whose rectangles overlap share at least one cell.  Querying a rectangle
+    returns the items from the cells it touches, which is a superset of the
+    items whose rectangles overlap it.
+    """
+    #: Default width and height of a grid cell, in pixels
+    DEFAULT_CELL_SIZE = 64
+
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        """
+        Create an empty spatial hash.
+
+        :param cell_size: The width and height of each grid cell, in pixels
+        :type cell_size: int
+        :raises: ValueError if cell_size is less than 1
+        """
+        cell_size = int(cell_size)
+        if cell_size < 1:
+            raise ValueError("SpatialHash cell size must be a positive integer (got {})".
+                             format(cell_size))
+        #: The width and height of each grid cell
+        self.cell_size = cell_size
+        #: Map (column, row) cell keys to the set of items inside them
+        self.cells = {}
+        # map items to the (column, row) span of cells they occupy
+        self._item_spans = {}
+
+    def _cell_span(self, rect):
+        # find the first and last columns and rows touched by rect; an empty
+        #  rect still occupies the cell containing its top left corner
+        left_col = rect.left // self.cell_size
+        top_row = rect.top // self.cell_size
+        right_col = (rect.left + max(rect.width, 1) - 1) // self.cell_size
+        bottom_row = (rect.top + max(rect.height, 1) - 1) // self.cell_size
+        return (left_col, top_row, right_col, bottom_row)
+
+    def insert(self, item, rect):
+        """
+        Add an item to every cell touched by its rectangle.  If the item was
+        already present, it is moved to the cells for the new rectangle.
+
+        :param item: The item to add; must be hashable
+        :param rect: The item's bounding rectangle
+        :type rect: :py:class:`pygame.Rect`
+        """
+        span = self._cell_span(rect)
+        old_span = self._item_spans.get(item)
+        if old_span == span:
+            return
+        if old_span is not None:
+            self._remove_from_cells(item, old_span)
+        self._item_spans[item] = span
+        cells = self.cells
+        for col in range(span[0], span[2] + 1):
+            for row in range(span[1], span[3] + 1):
+                if (col, row) in cells:
+                    cells[(col, row)].add(item)
+                else:
+                    cells[(col, row)] = set([item])
+
+    #: Moving an item is the same as inserting it again
+    update = insert
+
+    def _remove_from_cells(self, item, span):
+        cells = self.cells
+        for col in range(span[0], span[2] + 1):
+            for row in range(span[1], span[3] + 1):
+                cell = cells[(col, row)]
+                cell.discard(item)
+                if len(cell) == 0:
+                    del cells[(col, row)]
+
+    def remove(self, item):
+        """
+        Remove an item from the spatial hash.  Items that aren't present are
+        ignored.
+
+        :param item: The item to remove
+        """
+        span = self._item_spans.pop(item, None)
+        if span is not None:
+            self._remove_from_cells(item, span)
+
+    def clear(self):
+        """Remove all items."""
+        self.cells = {}
+        self._item_spans = {}
+
+    def query(self, rect):
+        """
+        Collect the items sharing a cell with the given rectangle.
+
+        :param rect: The rectangle to search
+        :type rect: :py:class:`pygame.Rect`
+        :return: The items found in the cells touched by rect
+        :rtype: set
+        """
+        span = self._cell_span(rect)
+        cells = self.cells
+        found = set()
+        for col in range(span[0], span[2] + 1):
+            for row in range(span[1], span[3] + 1):
+                if (col, row) in cells:
+                    found |= cells[(col, row)]
+        return found
+
+    def __contains__(self, item):
+        return item in self._item_spans
+
+    def __len__(self):
+        return len(self._item_spans)
@@ -0,0 +1,134 @@
+"""
+Author: Ron Lockwood-Childs
+
+Licensed under LGPL v2.1 (see file COPYING for details)
+
+Pygame maker static bounding volume hierarchy class.
+"""
+
+import pygame
+
+
+class StaticBVH(object):
+    """
+    Organize items that rarely move into a tree of bounding rectangles, so
+    the items near a rectangle can be found without checking all of them.
+
+    The tree is built all at once.  Removing an item only forgets it; the tree
+    is rebuilt from the remaining items once more than half of its entries
+    have been removed.
+    """
+    #: The largest number of items stored in a leaf node
+    LEAF_SIZE = 4
+
+    def __init__(self, items=None):
+        """
+        Create a bounding volume hierarchy.
+
+        :param items: The items to build the tree from, see :py:meth:`build`
+        :type items: iterable of (item, :py:class:`pygame.Rect`) tuples
+        """
+        self._root = None
+        # map items to their bounding rects
+        self._bounds = {}
+        # the number of items the tree was built with
+        self._entry_count = 0
+        if items is not None:
+            self.build(items)
+
+    def build(self, items):
+        """
+        Replace the tree's contents with a new set of items.
+
+        :param items: Each item paired with its bounding rectangle; items must
+            be hashable
+        :type items: iterable of (item, :py:class:`pygame.Rect`) tuples
+        """
+        self._bounds = {}
+        for item, rect in items:
+            self._bounds[item] = pygame.Rect(rect)
+        self._rebuild()
+
+    def _rebuild(self):
+        entries = [((rect.left, rect.top, rect.right, rect.bottom), item)
+                   for item, rect in self._bounds.items()]
+        self._entry_count = len(entries)
+        self._root = None
+        if len(entries) > 0:
+            self._root = self._build_node(entries)
+
+    def _build_node(self, entries):
+        # A node is a tuple: (box, low child, high child, entries), where box
+        #  is (left, top, right, bottom) and entries is None except in leaves.
+        box = (min([entry[0][0] for entry in entries]),
+               min([entry[0][1] for entry in entries]),
+               max([entry[0][2] for entry in entries]),
+               max([entry[0][3] for entry in entries]))
+        if len(entries) <= self.LEAF_SIZE:
+            return (box, None, None, entries)
+        # split the entries in half along the box's longest side
+        if (box[2] - box[0]) >= (box[3] - box[1]):
+            entries.sort(key=lambda entry: entry[0][0] + entry[0][2])
+        else:
+            entries.sort(key=lambda entry: entry[0][1] + entry[0][3])
+        middle = len(entries) // 2
+        return (box, self._build_node(entries[:middle]), self._build_node(entries[middle:]),
+                None)
+
+    def remove(self, item):
+        """
+        Remove an item from the tree.  Items that aren't present are ignored.
+
+        :param item: The item to remove
+        """
+        if self._bounds.pop(item, None) is not None:
+            if len(self._bounds) * 2 < self._entry_count:
+                self._rebuild()
+
+    def get_bounds(self, item):
+        """
+        Return the bounding rectangle stored for an item.
+
+        :param item: The item to look up
+        :return: The item's bounding rectangle, or None if not present
+        :rtype: None | :py:class:`pygame.Rect`
+        """
+        return self._bounds.get(item)
+
+    def query(self, rect):
+        """
+        Collect the items whose bounding rectangles touch or overlap the given
+        rectangle.
+
+        :param rect: The rectangle to search
+        :type rect: :py:class:`pygame.Rect`
+        :return: The items found
+        :rtype: set
+        """
+        found = set()
+        if self._root is None:
+            return found
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        stack = [self._root]
+        while len(stack) > 0:
+            box, low, high, entries = stack.pop()
+            if box[0] > right or box[2] < left or box[1] > bottom or box[3] < top:
+                continue
+            if entries is None:
+                stack.append(low)
+                stack.append(high)
+                continue
+            for ebox, item in entries:
+                if (ebox[0] > right or ebox[2] < left or ebox[1] > bottom or
+                        ebox[3] < top):
+                    continue
+                # skip items removed since the tree was built
+                if item in self._bounds:
+                    found.add(item)
+        return found
+
+    def __contains__(self, item):
+        return item in self._bounds
+
+    def __len__(self):
+        return len(self._bounds)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""
+Author: Ron Lockwood-Childs
+
+Licensed under LGPL v2.1 (see file COPYING for details)
+
+Measure how many events per second the pygame_maker.events.event_engine
+module delivers, with DEBUG logging turned off as in a normal game.
+"""
+
+import logging
+import timeit
+from pygame_maker.events.event import StepEvent
+from pygame_maker.events.event_engine import EventEngine
+
+#: Events queued before each transmit_event() call
+EVENTS_PER_ROUND = 100
+#: Handlers registered for the event
+HANDLER_COUNT = 3
+#: Rounds of queuing and transmitting in each timed run
+ROUNDS = 2000
+
+
+def run_round(engine, events):
+    """Queue a round of events, then transmit them to their handlers."""
+    for an_event in events:
+        engine.queue_event(an_event)
+    engine.transmit_event("normal_step")
+
+
+def main():
+    """Report the best events per second from several timed runs."""
+    logging.getLogger("EventEngine").setLevel(logging.WARNING)
+    engine = EventEngine()
+    for _ in range(HANDLER_COUNT):
+        engine.register_event_handler("normal_step", lambda an_event: None)
+    events = [StepEvent("normal_step") for _ in range(EVENTS_PER_ROUND)]
+    seconds = min(timeit.repeat(lambda: run_round(engine, events), number=ROUNDS, repeat=5))
+    print("{:.0f} events per second, {:d} handlers each".format(
+        ROUNDS * EVENTS_PER_ROUND / seconds, HANDLER_COUNT))
+
+
+if __name__ == "__main__":
+    main()
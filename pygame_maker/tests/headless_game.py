@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+"""
+Author: Ron Lockwood-Childs
+
+Licensed under LGPL v2.1 (see file COPYING for details)
+
+Build a game engine that runs without a display, for unit tests that need
+object types, instances and events to work together.
+"""
+
+import os
+import shutil
+import tempfile
+import yaml
+import pygame
+from pygame_maker.game_engine import GameEngine
+from pygame_maker.actors.object_sprite import ObjectSprite
+from pygame_maker.actors.object_type import CollideableObjectType
+from pygame_maker.actions.action import Action
+from pygame_maker.actions.action_sequence import ActionSequence
+
+UNITTEST_FILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "unittest_files")
+
+# game settings for tests: log warnings to the console only
+GAME_SETTINGS_YAML = """\
+logging_config:
+  version: 1
+  formatters:
+    normal:
+      format: '%(name)s [%(levelname)s]:%(message)s'
+  handlers:
+    console:
+      class: logging.StreamHandler
+      level: WARNING
+      formatter: normal
+      stream: ext://sys.stdout
+  root:
+    level: WARNING
+    handlers: [console]
+"""
+
+ROOM_YAML = """\
+- rm_test:
+    width: {:d}
+    height: {:d}
+"""
+
+
+def make_game_engine(room_size=(640, 480), game_dir=None, **game_settings):
+    """
+    Create a game engine with a single empty room, and a draw surface the
+    size of the room.  Object types are added with
+    :py:func:`add_object_type`.
+
+    :param room_size: The room's width and height
+    :type room_size: (int, int)
+    :param game_dir: A directory to build the game in, that may already
+        hold other resources and is left in place afterward; by default, a
+        temporary directory is used and removed
+    :type game_dir: None | str
+    :param game_settings: Replacements for the game engine's default game
+        settings, written to the game's settings file
+    :return: The new game engine
+    :rtype: :py:class:`~pygame_maker.game_engine.GameEngine`
+    """
+    topdir = os.getcwd()
+    keep_game_dir = game_dir is not None
+    if not keep_game_dir:
+        game_dir = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(game_dir, GameEngine.GAME_SETTINGS_FILE), "w") as settings_f:
+            settings_f.write(GAME_SETTINGS_YAML)
+            if len(game_settings) > 0:
+                settings_f.write(yaml.safe_dump(game_settings, default_flow_style=False))
+        if not os.path.isdir(os.path.join(game_dir, "rooms")):
+            os.mkdir(os.path.join(game_dir, "rooms"))
+        with open(os.path.join(game_dir, "rooms", "rooms.yaml"), "w") as room_f:
+            room_f.write(ROOM_YAML.format(*room_size))
+        os.chdir(game_dir)
+        game_engine = GameEngine()
+    finally:
+        os.chdir(topdir)
+        if not keep_game_dir:
+            shutil.rmtree(game_dir)
+    #pylint: disable=too-many-function-args
+    game_engine.draw_surface = pygame.Surface(room_size)
+    #pylint: enable=too-many-function-args
+    game_engine.screen = game_engine.draw_surface
+    return game_engine
+
+
+def make_action_sequence(*actions):
+    """
+    Create an action sequence from (action name, parameter dict) tuples.
+
+    :return: The new action sequence
+    :rtype: :py:class:`~pygame_maker.actions.action_sequence.ActionSequence`
+    """
+    sequence = ActionSequence()
+    for action_name, params in actions:
+        sequence.append_action(Action.get_action_instance_by_name(action_name, params))
+    return sequence
+
+
+def add_object_type(game_engine, name, image="ball2.png", collision_type="rectangle",
+                    events=None, **kwargs):
+    """
+    Add a collideable object type to a game engine, with its own sprite.
+
+    :param game_engine: The game engine from :py:func:`make_game_engine`
+    :param name: The new object type's name
+    :type name: str
+    :param image: The name of an image file in the unittest_files directory
+    :type image: str
+    :param collision_type: The sprite's collision type
+    :type collision_type: str
+    :param events: Map event names to action sequences
+    :type events: None | dict
+    :param kwargs: Object type settings, as for
+        :py:class:`~pygame_maker.actors.object_type.CollideableObjectType`
+    :return: The new object type
+    :rtype: :py:class:`~pygame_maker.actors.object_type.CollideableObjectType`
+    """
+    sprite_name = "spr_{}".format(name)
+    game_engine.resources['sprites'][sprite_name] = ObjectSprite(
+        sprite_name, filename=os.path.join(UNITTEST_FILES_DIR, image),
+        collision_type=collision_type)
+    obj_type = CollideableObjectType(name, game_engine, sprite=sprite_name,
+                                     event_action_sequences=events, **kwargs)
+    game_engine.resources['objects'][name] = obj_type
+    return obj_type
+
+
+def init_display():
+    """Set up pygame, so sprite images can be loaded."""
+    pygame.init()
+    pygame.display.set_mode((640, 480))
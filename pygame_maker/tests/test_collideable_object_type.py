@@ -0,0 +1,782 @@
+#!/usr/bin/env python
+"""
+Author: Ron Lockwood-Childs
+
+Licensed under LGPL v2.1 (see file COPYING for details)
+
+Unit test how the CollideableObjectType class updates its instances.
+"""
+
+import sys
+import os
+import random
+import re
+import unittest
+import pygame
+from pygame_maker.actions.action import Action
+from pygame_maker.events.event import MouseEvent, StepEvent, OtherEvent
+from pygame_maker.actors.object_type import CollideableObjectType, ObjectTypeException
+from pygame_maker.actors.object_instance import ObjectInstance
+import headless_game
+
+
+class TestSleepingInstances(unittest.TestCase):
+    """Unit tests for putting idle instances to sleep and waking them."""
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_sleeper = headless_game.add_object_type(
+            self.game_engine, "obj_sleeper", sleep_when_idle=True,
+            events={"collision_obj_mover": headless_game.make_action_sequence()})
+        self.obj_mover = headless_game.add_object_type(self.game_engine, "obj_mover")
+        self.sleeper = self.obj_sleeper.create_instance(self.game_engine.draw_surface,
+                                                        position=(100, 100))
+
+    def update_until_asleep(self):
+        """Update the game engine for long enough that idle instances sleep."""
+        for _ in range(CollideableObjectType.SLEEP_IDLE_FRAMES):
+            self.game_engine.update()
+
+    def test_005idle_instance_sleeps(self):
+        """Test that only instances that stay still fall asleep."""
+        runner = self.obj_sleeper.create_instance(self.game_engine.draw_surface,
+                                                  position=(200, 100), speed=1)
+        for _ in range(CollideableObjectType.SLEEP_IDLE_FRAMES - 1):
+            self.game_engine.update()
+        self.assertEqual(self.obj_sleeper.sleeping_instances, set())
+        self.game_engine.update()
+        self.assertEqual(self.obj_sleeper.sleeping_instances, set([self.sleeper]))
+        # sleeping instances aren't moved
+        self.sleeper.symbols["speed"] = 1
+        self.sleeper.symbols["hspeed"] = 1
+        self.game_engine.update()
+        self.assertEqual(self.sleeper.rect.topleft, (100, 100))
+        self.assertTrue(runner not in self.obj_sleeper.sleeping_instances)
+
+    def test_010action_wakes_instance(self):
+        """Test that running an action wakes an instance."""
+        self.update_until_asleep()
+        self.assertTrue(self.sleeper in self.obj_sleeper.sleeping_instances)
+        self.sleeper.execute_action(
+            Action.get_action_instance_by_name("set_velocity_compass",
+                                               compass_directions="RIGHT", speed=2), None)
+        self.assertEqual(self.obj_sleeper.sleeping_instances, set())
+        self.game_engine.update()
+        self.assertEqual(self.sleeper.rect.topleft, (102, 100))
+
+    def test_015position_change_wakes_instance(self):
+        """Test that setting the position wakes an instance."""
+        self.update_until_asleep()
+        self.sleeper.position = (50, 60)
+        self.assertEqual(self.obj_sleeper.sleeping_instances, set())
+        # the instance must stay still for a full idle period again
+        for _ in range(CollideableObjectType.SLEEP_IDLE_FRAMES - 1):
+            self.game_engine.update()
+        self.assertEqual(self.obj_sleeper.sleeping_instances, set())
+
+    def test_020symbol_change_wakes_instance(self):
+        """Test that code changing an instance's symbols wakes it."""
+        self.update_until_asleep()
+        self.sleeper.execute_code(Action.get_action_instance_by_name("execute_code",
+                                                                     code="speed = 3"))
+        self.assertEqual(self.sleeper.symbols["speed"], 3)
+        self.assertEqual(self.obj_sleeper.sleeping_instances, set())
+
+    def test_025moving_contact_wakes_instance(self):
+        """Test that an instance moving by speed into a sleeper wakes it."""
+        self.update_until_asleep()
+        mover = self.obj_mover.create_instance(self.game_engine.draw_surface,
+                                               position=(50, 100), speed=10, direction=90)
+        self.game_engine.update()
+        self.assertTrue(self.sleeper in self.obj_sleeper.sleeping_instances)
+        self.game_engine.update()
+        self.assertTrue(mover.rect.colliderect(self.sleeper.rect))
+        self.assertEqual(self.obj_sleeper.sleeping_instances, set())
+
+    def test_030positioned_contact_wakes_instance(self):
+        """Test that an instance placed against a sleeper wakes it."""
+        mover = self.obj_mover.create_instance(self.game_engine.draw_surface,
+                                               position=(300, 300))
+        self.update_until_asleep()
+        self.assertTrue(self.sleeper in self.obj_sleeper.sleeping_instances)
+        mover.position = (110, 100)
+        self.game_engine.update()
+        self.assertEqual(self.obj_sleeper.sleeping_instances, set())
+
+    def test_035still_contact_lets_instance_sleep(self):
+        """Test that a touching instance that doesn't move doesn't wake a sleeper."""
+        self.obj_mover.create_instance(self.game_engine.draw_surface, position=(110, 100))
+        self.update_until_asleep()
+        self.update_until_asleep()
+        self.assertTrue(self.sleeper in self.obj_sleeper.sleeping_instances)
+
+
+class TestMouseEvents(unittest.TestCase):
+    """Unit tests for sending mouse events to the instances under the mouse."""
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_button = headless_game.add_object_type(
+            self.game_engine, "obj_button",
+            events={"mouse_button_left": headless_game.make_action_sequence(),
+                    "mouse_global_button_left": headless_game.make_action_sequence()})
+        self.buttons = [self.obj_button.create_instance(self.game_engine.draw_surface,
+                                                        position=(100 + 8 * idx, 100))
+                        for idx in range(3)]
+        self.handled = []
+        execute_action_sequence = self.obj_button.execute_action_sequence
+
+        def recorded_execute_action_sequence(in_event, targets=None):
+            """Record the event and its targets, then run the action sequence."""
+            self.handled.append((in_event.name, targets))
+            execute_action_sequence(in_event, targets)
+        self.obj_button.execute_action_sequence = recorded_execute_action_sequence
+
+    def test_040hits_in_group_order(self):
+        """Test that the instances under the mouse are found in sprite group order."""
+        self.obj_button.group.change_layer(self.buttons[0], 1)
+        position = (120, 110)
+        hits = self.game_engine.get_instances_under_mouse(position, self.obj_button)
+        self.assertEqual(hits, [self.buttons[1], self.buttons[2], self.buttons[0]])
+        self.assertEqual(hits, self.obj_button.group.get_sprites_at(position))
+        # only instances whose rects contain the mouse are found
+        self.assertEqual(self.game_engine.get_instances_under_mouse((104, 110),
+                                                                    self.obj_button),
+                         [self.buttons[0]])
+        self.assertEqual(self.game_engine.get_instances_under_mouse((300, 300),
+                                                                    self.obj_button), [])
+
+    def test_045moved_instance_hit_where_it_is(self):
+        """Test that a remembered hit test is redone after an instance moves."""
+        position = (104, 110)
+        self.assertEqual(self.game_engine.get_instances_under_mouse(position, self.obj_button),
+                         [self.buttons[0]])
+        self.buttons[2].position = (90, 100)
+        self.assertEqual(self.game_engine.get_instances_under_mouse(position, self.obj_button),
+                         [self.buttons[0], self.buttons[2]])
+
+    def test_050invisible_instances_not_clicked(self):
+        """Test that invisible instances don't receive mouse events."""
+        self.buttons[1].visible = False
+        self.obj_button.handle_mouse_event(MouseEvent("mouse_button_left",
+                                                      {"position": (120, 110)}))
+        self.assertEqual(self.handled, [("mouse_button_left",
+                                         [self.buttons[0], self.buttons[2]])])
+        self.handled = []
+        self.obj_button.handle_mouse_event(MouseEvent("mouse_button_left",
+                                                      {"position": (110, 110)}))
+        self.assertEqual(self.handled, [("mouse_button_left", [self.buttons[0]])])
+        self.handled = []
+        for button in self.buttons:
+            button.visible = False
+        self.obj_button.handle_mouse_event(MouseEvent("mouse_button_left",
+                                                      {"position": (120, 110)}))
+        self.assertEqual(self.handled, [])
+
+    def test_055global_event_handled_once(self):
+        """Test that global mouse events aren't also sent to the instances under the mouse."""
+        self.obj_button.handle_mouse_event(MouseEvent("mouse_global_button_left",
+                                                      {"position": (120, 110)}))
+        self.assertEqual(self.handled, [("mouse_global_button_left", None)])
+
+
+class TestPositionSymbols(unittest.TestCase):
+    """Unit tests for updating the position symbols when they're used."""
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_ball = headless_game.add_object_type(self.game_engine, "obj_ball")
+        self.ball = self.obj_ball.create_instance(self.game_engine.draw_surface,
+                                                  position=(100, 100))
+
+    def test_060symbols_set_by_action(self):
+        """Test that an action sets the position symbols left stale by a move."""
+        self.ball.move_position(5, -10)
+        self.assertEqual(self.ball.rect.topleft, (105, 90))
+        self.assertEqual((self.ball.symbols["position.x"], self.ball.symbols["position.y"]),
+                         (100, 100))
+        self.ball.execute_action(
+            Action.get_action_instance_by_name("set_horizontal_speed", horizontal_speed=0),
+            None)
+        self.assertEqual((self.ball.symbols["position.x"], self.ball.symbols["position.y"]),
+                         (105, 90))
+
+    def test_065symbols_set_by_code(self):
+        """Test that a code block reads the position symbols left by a move."""
+        self.ball.speed = 4
+        self.ball.direction = 90
+        self.game_engine.update()
+        self.assertEqual(self.ball.rect.topleft, (104, 100))
+        self.assertEqual(self.ball.symbols["position.x"], 100)
+        self.ball.execute_code(Action.get_action_instance_by_name("execute_code",
+                                                                  code="speed = position.x"))
+        self.assertEqual(self.ball.symbols["position.x"], 104)
+        self.assertEqual(self.ball.symbols["speed"], 104)
+
+
+class TestSharedImages(unittest.TestCase):
+    """Unit tests for sharing sprite subimages between instances."""
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_ball = headless_game.add_object_type(self.game_engine, "obj_ball")
+        self.balls = [self.obj_ball.create_instance(self.game_engine.draw_surface,
+                                                    position=(100 + 40 * idx, 100))
+                      for idx in range(2)]
+        self.subimage = self.obj_ball.sprite_resource.subimages[0]
+        # an opaque pixel, to check for changes
+        self.pixel = self.subimage.get_bounding_rect().center
+        self.original_color = tuple(self.subimage.get_at(self.pixel))
+
+    def test_070instances_share_subimage(self):
+        """Test that instances showing the same subimage share its surface."""
+        self.assertTrue(self.balls[0].image is self.subimage)
+        self.assertTrue(self.balls[1].image is self.subimage)
+
+    def test_075writable_image_copies_subimage(self):
+        """
+        Test that changing one instance's writable image leaves the shared
+        subimage and the other instances' images alone.
+        """
+        ball_rect, ball_mask = pygame.Rect(self.balls[0].rect), self.balls[0].mask
+        writable = self.balls[0].get_writable_image()
+        self.assertFalse(writable is self.subimage)
+        self.assertTrue(self.balls[0].image is writable)
+        self.assertTrue(self.balls[1].image is self.subimage)
+        writable.fill((255, 0, 0, 128))
+        self.assertEqual(tuple(self.subimage.get_at(self.pixel)), self.original_color)
+        self.assertEqual(tuple(writable.get_at(self.pixel)), (255, 0, 0, 128))
+        # the copy is made once, and the instance keeps its place and mask
+        self.assertTrue(self.balls[0].get_writable_image() is writable)
+        self.assertEqual(self.balls[0].rect, ball_rect)
+        self.assertTrue(self.balls[0].mask is ball_mask)
+        # a new subimage number goes back to the shared subimage
+        self.balls[0].subimage_number = 0
+        self.assertTrue(self.balls[0].image is self.subimage)
+
+
+class TestBoundaryEvents(unittest.TestCase):
+    """Unit tests for sending room boundary events to moved instances."""
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_ball = headless_game.add_object_type(
+            self.game_engine, "obj_ball",
+            events={"intersect_boundary": headless_game.make_action_sequence(),
+                    "outside_room": headless_game.make_action_sequence()})
+        self.received = []
+        for event_name in ("intersect_boundary", "outside_room"):
+            self.game_engine.event_engine.register_event_handler(event_name,
+                                                                 self.received.append)
+
+    def create_ball(self, position, speed=1):
+        """Create a ball instance moving right."""
+        return self.obj_ball.create_instance(self.game_engine.draw_surface, position=position,
+                                             speed=speed, direction=90)
+
+    def get_received_names(self):
+        """Return each instance's received boundary event names."""
+        names = {}
+        for ev in self.received:
+            names.setdefault(ev["instance"], []).append(ev.name)
+        return names
+
+    def test_080intersect_takes_precedence(self):
+        """
+        Test that each moved instance on or outside the room's boundaries gets
+        exactly one event, and that touching a boundary beats being outside.
+        """
+        straddling_left = self.create_ball((-20, 100))
+        outside_left = self.create_ball((-100, 100))
+        self.create_ball((300, 100))
+        straddling_right = self.create_ball((630, 200))
+        outside_corner = self.create_ball((700, 600))
+        still_outside = self.create_ball((-100, 300), speed=0)
+        self.game_engine.update()
+        self.assertEqual(self.get_received_names(), {
+            straddling_left: ["intersect_boundary"],
+            outside_left: ["outside_room"],
+            straddling_right: ["intersect_boundary"],
+            outside_corner: ["outside_room"],
+        })
+        self.assertTrue(still_outside not in self.get_received_names())
+
+    def test_085parent_gets_one_event(self):
+        """Test that a parent instance and its child each get one boundary event."""
+        parent = self.create_ball((-20, 100))
+        child = self.obj_ball.create_instance(self.game_engine.draw_surface, position=(0, 200))
+        child.set_parent_instance(parent)
+        self.game_engine.update()
+        self.assertEqual(child.rect.topleft, (-19, 300))
+        self.assertEqual(self.get_received_names(), {
+            parent: ["intersect_boundary"],
+            child: ["intersect_boundary"],
+        })
+
+
+class TestInstancePool(unittest.TestCase):
+    """Unit tests for reusing destroyed instances."""
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_ball = headless_game.add_object_type(self.game_engine, "obj_ball", pool_size=4,
+                                                      vectorize_motion=True, sleep_when_idle=True)
+
+    def create_ball(self, **kwargs):
+        """Create a ball instance."""
+        return self.obj_ball.create_instance(self.game_engine.draw_surface, **kwargs)
+
+    def destroy(self, instance):
+        """Destroy an instance, and let its type remove it."""
+        instance.destroy_object(None)
+        self.game_engine.update()
+
+    def test_090destroyed_instance_reused(self):
+        """Test that a new instance reuses a destroyed one, with fresh state."""
+        ball = self.create_ball(position=(100, 100), speed=3, direction=90)
+        ball.symbols["score"] = 10
+        ball.subimage_number = 0
+        ball_id = ball.inst_id
+        self.game_engine.update()
+        self.assertTrue(ball in self.obj_ball.motion)
+        self.destroy(ball)
+        self.assertEqual(self.obj_ball.instance_pool, [ball])
+        self.assertFalse(ball in self.obj_ball.motion)
+        new_ball = self.create_ball(position=(200, 50))
+        self.assertTrue(new_ball is ball)
+        self.assertEqual(self.obj_ball.instance_pool, [])
+        self.assertNotEqual(new_ball.inst_id, ball_id)
+        self.assertEqual(new_ball.rect.topleft, (200, 50))
+        self.assertEqual(tuple(new_ball.position), (200, 50))
+        self.assertEqual(new_ball.start_position, (200, 50))
+        self.assertEqual((new_ball.speed, new_ball.hspeed, new_ball.direction), (0, 0, 0))
+        self.assertFalse("score" in new_ball.symbols.keys())
+        self.assertFalse(new_ball.motion_stale)
+        self.game_engine.update()
+        self.assertEqual(new_ball.rect.topleft, (200, 50))
+        self.assertFalse(new_ball in self.obj_ball.motion)
+
+    def test_095reused_instance_forgets_bookkeeping(self):
+        """
+        Test that reused instances keep no children, and aren't left asleep,
+        moved or placed at their old positions by their type.
+        """
+        sleeper = self.create_ball(position=(200, 100))
+        parent = self.create_ball(position=(100, 100))
+        child = self.create_ball(position=(10, 10))
+        child.set_parent_instance(parent)
+        for _ in range(CollideableObjectType.SLEEP_IDLE_FRAMES):
+            self.game_engine.update()
+        self.assertEqual(self.obj_ball.sleeping_instances, set([sleeper]))
+        parent.position = (120, 100)
+        self.obj_ball.store_previous_positions()
+        sleeper.destroy_object(None)
+        self.destroy(parent)
+        self.assertEqual(sorted(self.obj_ball.instance_pool, key=lambda inst: inst.inst_id),
+                         [sleeper, parent, child])
+        self.game_engine.update()
+        new_balls = [self.create_ball(position=(300 + 40 * idx, 300)) for idx in range(3)]
+        self.assertEqual(set(new_balls), set([sleeper, parent, child]))
+        for new_ball in new_balls:
+            self.assertEqual(new_ball.symbols["children"], [])
+            self.assertTrue(new_ball.symbols["parent"] is None)
+            for state in (self.obj_ball.sleeping_instances, self.obj_ball.dormant_instances,
+                          self.obj_ball._idle_frames, self.obj_ball._previous_positions,
+                          self.obj_ball._moved_since_indexed,
+                          self.obj_ball._frame_moved_instances):
+                self.assertFalse(new_ball in state)
+        self.assertEqual(self.obj_ball.moved_instances, set(new_balls))
+        # the collision grid only finds the instances where they are now
+        for position in ((110, 110), (130, 110), (210, 110)):
+            self.assertEqual(self.game_engine.get_instances_at_point(position), [])
+        self.assertEqual(self.game_engine.get_instances_at_point((310, 310)), [new_balls[0]])
+
+
+class TestInstanceHierarchy(unittest.TestCase):
+    """Unit tests for placing child instances relative to their parents."""
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_ball = headless_game.add_object_type(self.game_engine, "obj_ball")
+        self.parent = self.obj_ball.create_instance(self.game_engine.draw_surface,
+                                                    position=(100, 100))
+        self.child = self.obj_ball.create_instance(self.game_engine.draw_surface,
+                                                   position=(10, 20))
+        self.child.set_parent_instance(self.parent)
+        self.grandchild = self.obj_ball.create_instance(self.game_engine.draw_surface,
+                                                        position=(5, 5))
+        self.grandchild.set_parent_instance(self.child)
+        self.game_engine.update()
+
+    def test_100children_follow_positioned_parent(self):
+        """Test that setting a stationary parent's position moves its descendants."""
+        self.assertEqual(self.child.rect.topleft, (110, 120))
+        self.assertEqual(self.grandchild.rect.topleft, (115, 125))
+        self.parent.position = (200, 50)
+        self.game_engine.update()
+        self.assertEqual(self.child.rect.topleft, (210, 70))
+        self.assertEqual(self.grandchild.rect.topleft, (215, 75))
+        # moving without speed places the descendants too
+        self.parent.move_position(-50, 10)
+        self.game_engine.update()
+        self.assertEqual(self.child.rect.topleft, (160, 80))
+        self.assertEqual(self.grandchild.rect.topleft, (165, 85))
+
+    def test_105moved_child_places_its_subtree(self):
+        """Test that setting a child's position moves its own descendants."""
+        self.child.position = (30, 40)
+        self.game_engine.update()
+        self.assertEqual(self.parent.rect.topleft, (100, 100))
+        self.assertEqual(self.child.rect.topleft, (130, 140))
+        self.assertEqual(self.grandchild.rect.topleft, (135, 145))
+
+
+class TestDormantInstances(unittest.TestCase):
+    """Unit tests for culling instances outside the room's visible area."""
+
+    def make_objects(self, **kwargs):
+        """
+        Create a ball type whose instances go dormant outside the room, with
+        one ball inside the room and one coming back in from the right.
+        """
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_ball = headless_game.add_object_type(
+            self.game_engine, "obj_ball", inactive_outside_view=0,
+            events={"normal_step": headless_game.make_action_sequence(),
+                    "outside_room": headless_game.make_action_sequence()},
+            **kwargs)
+        self.inside = self.obj_ball.create_instance(self.game_engine.draw_surface,
+                                                    position=(100, 100))
+        self.returning = self.obj_ball.create_instance(self.game_engine.draw_surface,
+                                                       position=(700, 100), speed=20,
+                                                       direction=270)
+        self.received = []
+        self.game_engine.event_engine.register_event_handler("outside_room",
+                                                             self.received.append)
+        self.step_targets = []
+        execute_action_sequence = self.obj_ball.execute_action_sequence
+
+        def recorded_execute_action_sequence(in_event, targets=None):
+            """Record the step event targets, then run the action sequence."""
+            if in_event.name == "normal_step":
+                self.step_targets.append(targets)
+            execute_action_sequence(in_event, targets)
+        self.obj_ball.execute_action_sequence = recorded_execute_action_sequence
+        self.drawn = []
+        group_draw = self.obj_ball.group.draw
+
+        def recorded_draw(surface):
+            """Record the visible instances, then draw the group."""
+            self.drawn.append(set(inst for inst in self.obj_ball.group
+                                  if inst.symbols["visible"]))
+            return group_draw(surface)
+        self.obj_ball.group.draw = recorded_draw
+
+    def check_returning_instance(self):
+        """
+        Check that the instance outside the room keeps moving and getting
+        outside_room events while it skips step events and drawing, and that
+        it resumes once it's back in the room.
+        """
+        for xpos in (680, 660, 640):
+            self.game_engine.update()
+            self.assertEqual(self.obj_ball.dormant_instances, set([self.returning]))
+            self.assertEqual(self.game_engine.get_instance_activity(), (1, 1))
+            self.assertEqual(self.returning.rect.x, xpos)
+            self.obj_ball.handle_step_event(StepEvent("normal_step"))
+            self.assertEqual(self.step_targets[-1], [self.inside])
+            self.game_engine.draw_objects()
+            self.assertEqual(self.drawn[-1], set([self.inside]))
+        # at x=640 the instance touches the room's edge, and intersects it
+        self.assertEqual([ev["instance"] for ev in self.received], [self.returning] * 2)
+        # the instance is back inside the room
+        self.game_engine.update()
+        self.assertEqual(self.obj_ball.dormant_instances, set())
+        self.assertEqual(self.game_engine.get_instance_activity(), (2, 0))
+        self.assertEqual(self.returning.rect.x, 620)
+        self.obj_ball.handle_step_event(StepEvent("normal_step"))
+        self.assertEqual(set(self.step_targets[-1]), set([self.inside, self.returning]))
+        self.game_engine.draw_objects()
+        self.assertEqual(self.drawn[-1], set([self.inside, self.returning]))
+        # dormant instances' visibility was restored after drawing
+        self.assertTrue(self.returning.symbols["visible"])
+
+    def test_110dormant_instance_resumes(self):
+        """Test that a dormant instance keeps moving until it comes back into view."""
+        self.make_objects()
+        self.check_returning_instance()
+
+    def test_115vectorized_dormant_instance_resumes(self):
+        """Test that vectorized motion also keeps moving dormant instances."""
+        self.make_objects(vectorize_motion=True)
+        self.check_returning_instance()
+
+
+class TestBatchActions(unittest.TestCase):
+    """Unit tests for applying motion actions to many instances at once."""
+
+    # symbols that differ between the compared instances by design
+    PLACEMENT_SYMBOLS = ("position", "position.x", "position.y", "parent", "children")
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_ball = headless_game.add_object_type(self.game_engine, "obj_ball")
+
+    def create_balls(self):
+        """Create balls with a mix of speeds and directions."""
+        return [self.obj_ball.create_instance(self.game_engine.draw_surface,
+                                              position=(50 + 40 * idx, 60 + 30 * idx),
+                                              speed=speed, direction=direction)
+                for idx, (speed, direction) in enumerate(((0, 0), (3, 45), (5, 200),
+                                                          (1.5, 300)))]
+
+    def get_symbols(self, instance):
+        """Return the instance's symbols, except those that place it."""
+        instance._sync_symbols()
+        return dict((name, instance.symbols[name]) for name in instance.symbols.keys()
+                    if name not in self.PLACEMENT_SYMBOLS)
+
+    def test_120batch_matches_single_actions(self):
+        """
+        Test that every batched motion action leaves instances in the same
+        state as applying the action to each instance in turn.
+        """
+        actions = [
+            ("set_velocity_compass", {"compass_directions": "UP|LEFT|DOWNRIGHT",
+                                      "speed": 4}),
+            ("set_velocity_compass", {"compass_directions": "RIGHT", "speed": 2}),
+            ("set_velocity_compass", {"compass_directions": "NONE", "speed": 6}),
+            ("move_toward_point", {"destination.x": 300, "destination.y": 50, "speed": 5}),
+            ("set_horizontal_speed", {"horizontal_direction": "LEFT",
+                                      "horizontal_speed": 3}),
+            ("set_horizontal_speed", {"horizontal_direction": "RIGHT",
+                                      "horizontal_speed": 2, "relative": True}),
+            ("set_vertical_speed", {"vertical_direction": "DOWN", "vertical_speed": 2}),
+            ("set_vertical_speed", {"vertical_direction": "UP", "vertical_speed": 1,
+                                    "relative": True}),
+            ("reverse_horizontal_speed", {}),
+            ("reverse_vertical_speed", {}),
+        ]
+        self.assertEqual(set(name for name, params in actions),
+                         set(ObjectInstance.BATCH_ACTION_METHODS.keys()))
+        for action_name, params in actions:
+            action = Action.get_action_instance_by_name(action_name, **params)
+            self.assertTrue(ObjectInstance.can_batch_action(action))
+            single = self.create_balls()
+            batched = self.create_balls()
+            before_symbols = self.get_symbols(batched[1])
+            random.seed(7)
+            for inst in single:
+                inst.execute_action(action, None)
+            random.seed(7)
+            ObjectInstance.execute_batch_action(batched, action)
+            self.assertNotEqual(self.get_symbols(batched[1]), before_symbols, action_name)
+            for single_inst, batched_inst in zip(single, batched):
+                single_symbols = self.get_symbols(single_inst)
+                batched_symbols = self.get_symbols(batched_inst)
+                self.assertEqual(sorted(single_symbols.keys()), sorted(batched_symbols.keys()))
+                for name, value in single_symbols.items():
+                    if isinstance(value, float):
+                        self.assertAlmostEqual(batched_symbols[name], value, places=6,
+                                               msg="{} {}".format(action_name, name))
+                    else:
+                        self.assertEqual(batched_symbols[name], value,
+                                         "{} {}".format(action_name, name))
+
+
+class TestBatchedBoundaryEvents(unittest.TestCase):
+    """Unit tests for delivering a frame's boundary events to a type at once."""
+
+    def make_world(self, batched):
+        """
+        Create balls that reach the room's right edge in the same frame, and
+        an instance of another type that does too.  Without batching, each
+        type's boundary handler is registered on its own.
+        """
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_ball = headless_game.add_object_type(
+            self.game_engine, "obj_ball",
+            events={"intersect_boundary": headless_game.make_action_sequence(
+                ("reverse_horizontal_speed", {}),
+                ("set_vertical_speed", {"vertical_direction": "DOWN", "vertical_speed": 1,
+                                        "relative": True}))})
+        self.obj_other = headless_game.add_object_type(
+            self.game_engine, "obj_other",
+            events={"intersect_boundary": headless_game.make_action_sequence(
+                ("reverse_horizontal_speed", {}))})
+        event_engine = self.game_engine.event_engine
+        if not batched:
+            for obj_type in (self.obj_ball, self.obj_other):
+                handler = obj_type._select_event_handler("intersect_boundary")
+                event_engine.unregister_event_handler("intersect_boundary", handler)
+                event_engine.register_event_handler("intersect_boundary", handler)
+        self.balls = [self.obj_ball.create_instance(self.game_engine.draw_surface,
+                                                    position=(600, ypos), speed=10,
+                                                    direction=direction)
+                      for ypos, direction in ((100, 90), (200, 60), (300, 120))]
+        # this one stays inside the room
+        self.balls.append(self.obj_ball.create_instance(self.game_engine.draw_surface,
+                                                        position=(100, 400), speed=10,
+                                                        direction=90))
+        self.other = self.obj_other.create_instance(self.game_engine.draw_surface,
+                                                    position=(600, 400), speed=10,
+                                                    direction=90)
+        self.ball_targets = []
+        execute_action_sequence = self.obj_ball.execute_action_sequence
+
+        def recorded_execute_action_sequence(in_event, targets=None):
+            """Record the targets, then run the action sequence."""
+            self.ball_targets.append(targets)
+            execute_action_sequence(in_event, targets)
+        self.obj_ball.execute_action_sequence = recorded_execute_action_sequence
+        # a repeated event for one ball, and an event for the other type's
+        #  instance, arrive along with the frame's boundary events
+        event_engine.queue_event(OtherEvent("intersect_boundary", {"type": self.obj_ball,
+                                                                   "instance": self.balls[1]}))
+        event_engine.queue_event(OtherEvent("intersect_boundary", {"type": self.obj_other,
+                                                                   "instance": self.other}))
+        self.game_engine.update()
+
+    def get_motion(self):
+        """Return each instance's speed, direction, hspeed and vspeed."""
+        motion = []
+        for inst in self.balls + [self.other]:
+            inst._sync_symbols()
+            motion.append(tuple(inst.symbols[name]
+                                for name in ("speed", "direction", "hspeed", "vspeed")))
+        return motion
+
+    def test_125batched_events_match_single_events(self):
+        """
+        Test that batched boundary events leave instances in the same state
+        as handling each event in turn.
+        """
+        self.make_world(batched=False)
+        single_motion = self.get_motion()
+        self.assertEqual(len(self.ball_targets), 4)
+        self.make_world(batched=True)
+        batched_motion = self.get_motion()
+        # the balls' events arrive as one batch, with the repeated event
+        #  handled on its own
+        self.assertEqual(len(self.ball_targets), 2)
+        self.assertEqual(sorted(self.ball_targets[0]), sorted(self.balls[:3]))
+        self.assertEqual(self.ball_targets[1], None)
+        for single, batched in zip(single_motion, batched_motion):
+            for single_value, batched_value in zip(single, batched):
+                self.assertAlmostEqual(batched_value, single_value, places=6)
+        # the other type's instance only had its own action applied
+        self.assertAlmostEqual(batched_motion[4][3], 0.0, places=6)
+
+
+class TestLocationActions(unittest.TestCase):
+    """Unit tests for the actions that search a location for instances."""
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_ball = headless_game.add_object_type(self.game_engine, "obj_ball")
+        self.obj_wall = headless_game.add_object_type(self.game_engine, "obj_wall",
+                                                      solid=True)
+        self.obj_cloud = headless_game.add_object_type(self.game_engine, "obj_cloud")
+        self.ball = self.obj_ball.create_instance(self.game_engine.draw_surface,
+                                                  position=(50, 100))
+        self.wall = self.obj_wall.create_instance(self.game_engine.draw_surface,
+                                                  position=(200, 100))
+        self.cloud = self.obj_cloud.create_instance(self.game_engine.draw_surface,
+                                                    position=(300, 100))
+
+    def found_at(self, question, **params):
+        """
+        Run a step event whose action sequence asks the question, and report
+        whether the ball's conditional action ran.
+        """
+        self.ball.hspeed = 0
+        self.obj_ball["normal_step"] = headless_game.make_action_sequence(
+            (question, params),
+            ("set_horizontal_speed", {"horizontal_direction": "RIGHT",
+                                      "horizontal_speed": 3}))
+        self.obj_ball.execute_action_sequence(StepEvent("normal_step"))
+        return self.ball.hspeed != 0
+
+    def test_130collision_at_location(self):
+        """Test that if_collision_at_location finds instances in the way."""
+        self.assertTrue(self.found_at("if_collision_at_location",
+                                      **{"position.x": 210, "position.y": 100}))
+        # the cloud isn't solid, unless any collision counts
+        self.assertFalse(self.found_at("if_collision_at_location",
+                                       **{"position.x": 300, "position.y": 100}))
+        self.assertTrue(self.found_at("if_collision_at_location", collision_type="any",
+                                      **{"position.x": 300, "position.y": 100}))
+        self.assertFalse(self.found_at("if_collision_at_location", collision_type="any",
+                                       **{"position.x": 400, "position.y": 100}))
+        # the location doesn't move the ball
+        self.assertEqual(self.ball.rect.topleft, (50, 100))
+
+    def test_135object_at_location(self):
+        """Test that if_object_at_location finds only the named object type."""
+        self.assertTrue(self.found_at("if_object_at_location", object="obj_cloud",
+                                      **{"position.x": 290, "position.y": 110}))
+        self.assertFalse(self.found_at("if_object_at_location", object="obj_cloud",
+                                       **{"position.x": 200, "position.y": 100}))
+        self.assertTrue(self.found_at("if_object_at_location", object="obj_cloud",
+                                      relative=True, **{"position.x": 250, "position.y": 0}))
+
+    def test_140destroy_instances_at_location(self):
+        """Test that destroy_instances_at_location destroys only what's there."""
+        self.obj_ball["normal_step"] = headless_game.make_action_sequence(
+            ("destroy_instances_at_location", {"position.x": 210, "position.y": 110}))
+        self.obj_ball.execute_action_sequence(StepEvent("normal_step"))
+        self.assertIn(self.wall, self.obj_wall.instance_delete_list)
+        self.assertNotIn(self.ball, self.obj_ball.instance_delete_list)
+        self.assertNotIn(self.cloud, self.obj_cloud.instance_delete_list)
+
+    def test_145code_counts_instances(self):
+        """
+        Test that game code counts instances through the region query
+        functions, without reaching the game engine itself.
+        """
+        self.ball.execute_code(Action.get_action_instance_by_name(
+            "execute_code", code="speed = instance_count_in_rect(190, 90, 200, 20)"))
+        self.assertEqual(self.ball.symbols["speed"], 2)
+        self.assertNotIn("game_engine",
+                         self.game_engine.language_engine.global_symbol_table.keys())
+
+
+class TestEventHandlerCache(unittest.TestCase):
+    """Unit tests for remembering the handler chosen for each event name."""
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_ball = headless_game.add_object_type(self.game_engine, "obj_ball")
+        self.event_handlers = self.game_engine.event_engine.event_handlers
+
+    def test_150handler_found_once(self):
+        """Test that later lookups of an event name reuse the first match."""
+        self.obj_ball["normal_step"] = headless_game.make_action_sequence()
+        self.assertEqual(self.event_handlers["normal_step"],
+                         [self.obj_ball.handle_step_event])
+        self.obj_ball.handler_table = {}
+        del self.obj_ball["normal_step"]
+        self.assertNotIn("normal_step", self.event_handlers)
+
+    def test_155new_handler_found(self):
+        """
+        Test that setting an action sequence finds a handler added since the
+        event name was last looked up.
+        """
+        self.assertRaises(ObjectTypeException, self.obj_ball.__setitem__, "custom_event",
+                          headless_game.make_action_sequence())
+        self.obj_ball.handler_table[re.compile("^custom_event$")] = \
+            self.obj_ball.handle_instance_event
+        self.obj_ball["custom_event"] = headless_game.make_action_sequence()
+        self.assertEqual(self.event_handlers["custom_event"],
+                         [self.obj_ball.handle_instance_event])
+        del self.obj_ball["custom_event"]
+        self.assertNotIn("custom_event", self.event_handlers)
+
+
+# run from the tests directory to find the unittest_files subdirectory
+os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
+
+headless_game.init_display()
+unittest.main()
+pygame.quit()
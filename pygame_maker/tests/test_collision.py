@@ -0,0 +1,357 @@
+#!/usr/bin/env python
+"""
+Author: Ron Lockwood-Childs
+
+Licensed under LGPL v2.1 (see file COPYING for details)
+
+Unit test collision checks between object types.
+"""
+
+import sys
+import os
+import random
+import unittest
+import pygame
+from pygame_maker.actors import object_type
+from pygame_maker.support import spatial_hash
+from pygame_maker.support import static_bvh
+import headless_game
+
+
+class TestCollisionInterest(unittest.TestCase):
+    """Unit tests for the game engine's collision interest matrix."""
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_a = headless_game.add_object_type(self.game_engine, "obj_a")
+        self.obj_b = headless_game.add_object_type(self.game_engine, "obj_b")
+        self.inst_a = self.obj_a.create_instance(self.game_engine.draw_surface,
+                                                 position=(100, 100))
+        self.inst_b = self.obj_b.create_instance(self.game_engine.draw_surface,
+                                                 position=(110, 110))
+        self.pair_checks = []
+        for obj_type in (self.obj_a, self.obj_b):
+            self.record_pair_checks(obj_type)
+
+    def record_pair_checks(self, obj_type):
+        """
+        Keep a list of the type pairs checked by collision_check_pair(), as
+        (type checked, type it was checked against) tuples.
+        """
+        check_pair = obj_type.collision_check_pair
+
+        def recorded_check_pair(other_obj, check_self=True, check_other=True):
+            """Record the call, then check the pair."""
+            if check_self:
+                self.pair_checks.append((obj_type.name, other_obj.name))
+            if check_other and (other_obj is not obj_type):
+                self.pair_checks.append((other_obj.name, obj_type.name))
+            return check_pair(other_obj, check_self, check_other)
+        obj_type.collision_check_pair = recorded_check_pair
+
+    def get_interest_names(self):
+        """Return the collision interest matrix, with types listed by name."""
+        interest = self.game_engine.get_collision_interest()
+        return dict((name, sorted(other.name for other in others))
+                    for name, others in interest.items())
+
+    def test_005uninterested_types_skipped(self):
+        """Test that overlapping types with no collision handlers aren't checked."""
+        self.assertEqual(self.get_interest_names(), {"obj_a": [], "obj_b": []})
+        self.game_engine.update()
+        self.assertEqual(self.pair_checks, [])
+
+    def test_010solid_change_invalidates_interest(self):
+        """Test that changing a type's solid flag rebuilds the interest matrix."""
+        self.game_engine.get_collision_interest()
+        self.obj_b.solid = True
+        self.assertEqual(self.get_interest_names(), {"obj_a": ["obj_b"], "obj_b": ["obj_b"]})
+        self.game_engine.update()
+        self.assertEqual(sorted(self.pair_checks), [("obj_a", "obj_b"), ("obj_b", "obj_b")])
+        # the solid instance pushed the other one out
+        self.assertFalse(self.inst_a.rect.colliderect(self.inst_b.rect))
+        self.obj_b.solid = False
+        self.assertEqual(self.get_interest_names(), {"obj_a": [], "obj_b": []})
+
+    def test_015handler_registration_invalidates_interest(self):
+        """Test that adding or removing a collision handler rebuilds the matrix."""
+        self.game_engine.get_collision_interest()
+        self.obj_a["collision_obj_b"] = headless_game.make_action_sequence()
+        self.assertEqual(self.get_interest_names(), {"obj_a": ["obj_b"], "obj_b": []})
+        self.game_engine.update()
+        self.assertEqual(self.pair_checks, [("obj_a", "obj_b")])
+        del self.obj_a["collision_obj_b"]
+        self.assertEqual(self.get_interest_names(), {"obj_a": [], "obj_b": []})
+        # any instance can be a parent or child, so relative collision
+        #  events make every type interested in the named type
+        self.obj_b["child_collision_obj_a"] = headless_game.make_action_sequence()
+        self.assertEqual(self.get_interest_names(), {"obj_a": ["obj_a"], "obj_b": ["obj_a"]})
+
+
+class TestCollisionPairs(unittest.TestCase):
+    """Unit tests for checking each colliding instance pair once."""
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_a = headless_game.add_object_type(
+            self.game_engine, "obj_a", collision_type="precise",
+            events={"collision_obj_a": headless_game.make_action_sequence(),
+                    "collision_obj_b": headless_game.make_action_sequence()})
+        self.obj_b = headless_game.add_object_type(
+            self.game_engine, "obj_b", collision_type="precise",
+            events={"collision_obj_a": headless_game.make_action_sequence()})
+        self.received = []
+        for event_name in ("collision_obj_a", "collision_obj_b"):
+            self.game_engine.event_engine.register_event_handler(event_name,
+                                                                 self.received.append)
+
+    def get_received(self, event_name, instance):
+        """Return the received events with the given name and instance."""
+        return [ev for ev in self.received
+                if (ev.name == event_name) and (ev["instance"] is instance)]
+
+    def test_020pair_collides_for_both_types(self):
+        """Test that one check sends each type its collision event and normal."""
+        inst_a = self.obj_a.create_instance(self.game_engine.draw_surface, position=(100, 100))
+        inst_b = self.obj_b.create_instance(self.game_engine.draw_surface, position=(120, 104))
+        self.game_engine.update()
+        self.assertEqual(len(self.received), 2)
+        a_events = self.get_received("collision_obj_b", inst_a)
+        b_events = self.get_received("collision_obj_a", inst_b)
+        self.assertEqual(len(a_events), 1)
+        self.assertEqual(len(b_events), 1)
+        self.assertEqual(a_events[0]["others"], [inst_b])
+        self.assertEqual(b_events[0]["others"], [inst_a])
+        # the other type's normal is the same normal, seen from the other side
+        normal_a = a_events[0]["normal"]
+        self.assertEqual(b_events[0]["normal"], (-normal_a[0], -normal_a[1]))
+        self.assertEqual(object_type.get_collision_contact(inst_a, inst_b)[1], normal_a)
+        self.assertEqual(object_type.get_collision_contact(inst_b, inst_a)[1],
+                         b_events[0]["normal"])
+
+    def test_025same_type_pair_collides_once(self):
+        """Test that instances of the same type each get one collision event."""
+        inst_a1 = self.obj_a.create_instance(self.game_engine.draw_surface, position=(100, 100))
+        inst_a2 = self.obj_a.create_instance(self.game_engine.draw_surface, position=(120, 104))
+        self.game_engine.update()
+        self.assertEqual(len(self.received), 2)
+        a1_events = self.get_received("collision_obj_a", inst_a1)
+        a2_events = self.get_received("collision_obj_a", inst_a2)
+        self.assertEqual(len(a1_events), 1)
+        self.assertEqual(len(a2_events), 1)
+        self.assertEqual(a1_events[0]["others"], [inst_a2])
+        self.assertEqual(a2_events[0]["others"], [inst_a1])
+        normal_a1 = a1_events[0]["normal"]
+        self.assertEqual(a2_events[0]["normal"], (-normal_a1[0], -normal_a1[1]))
+
+
+class TestCollisionContactCache(unittest.TestCase):
+    """Unit tests for the CollisionContactCache class."""
+
+    def setUp(self):
+        self.mask_a = pygame.mask.Mask((10, 10))
+        self.mask_a.fill()
+        self.mask_b = pygame.mask.Mask((10, 10))
+        self.mask_b.fill()
+        self.contact = (20, (-2, 0))
+
+    def test_030reversed_lookup_negates_normal(self):
+        """Test that a result is found from either mask's side."""
+        cache = object_type.CollisionContactCache()
+        self.assertEqual(cache.get(self.mask_a, self.mask_b, (8, 0)), None)
+        cache.add(self.mask_a, self.mask_b, (8, 0), self.contact)
+        self.assertEqual(cache.get(self.mask_a, self.mask_b, (8, 0)), self.contact)
+        self.assertEqual(cache.get(self.mask_b, self.mask_a, (-8, 0)), (20, (2, 0)))
+        self.assertEqual(cache.get(self.mask_a, self.mask_b, (-8, 0)), None)
+        cache.add(self.mask_a, self.mask_b, (0, 0), (100, None))
+        self.assertEqual(cache.get(self.mask_b, self.mask_a, (0, 0)), (100, None))
+
+    def test_035results_kept_for_one_frame(self):
+        """Test that results survive one next_frame() unless used."""
+        cache = object_type.CollisionContactCache()
+        cache.add(self.mask_a, self.mask_b, (8, 0), self.contact)
+        cache.next_frame()
+        self.assertEqual(cache.get(self.mask_a, self.mask_b, (8, 0)), self.contact)
+        # using a result keeps it for another frame
+        cache.next_frame()
+        self.assertEqual(cache.get(self.mask_a, self.mask_b, (8, 0)), self.contact)
+        cache.next_frame()
+        cache.next_frame()
+        self.assertEqual(cache.get(self.mask_a, self.mask_b, (8, 0)), None)
+
+    def test_040replaced_masks_not_matched(self):
+        """Test that a new mask isn't given an old mask's result."""
+        cache = object_type.CollisionContactCache()
+        cache.add(self.mask_a, self.mask_b, (8, 0), self.contact)
+        other_mask = pygame.mask.Mask((10, 10))
+        self.assertEqual(cache.get(other_mask, self.mask_b, (8, 0)), None)
+        self.assertEqual(cache.get(self.mask_b, other_mask, (-8, 0)), None)
+
+
+class TestCollisionGrid(unittest.TestCase):
+    """Unit tests for finding colliding instances through the collision grid."""
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_a = headless_game.add_object_type(self.game_engine, "obj_a",
+                                                   collision_type="precise")
+        self.obj_b = headless_game.add_object_type(self.game_engine, "obj_b",
+                                                   collision_type="disk")
+        rand = random.Random(11)
+        for obj_type in (self.obj_a, self.obj_b):
+            for _ in range(40):
+                obj_type.create_instance(self.game_engine.draw_surface,
+                                         position=(rand.randint(-20, 300),
+                                                   rand.randint(-20, 300)))
+
+    def get_groupcollide_pairs(self, obj_type, other_type):
+        """
+        Return the colliding pairs found by testing every instance of one type
+        against every instance of the other, as collision checks did before
+        the collision grid.
+        """
+        collision_map = pygame.sprite.groupcollide(
+            obj_type.group, other_type.group, False, False,
+            collided=object_type.sprite_collision_test)
+        return set(self.get_pair_key(obj_type, other_type, inst_a, inst_b)
+                   for inst_a, others in collision_map.items() for inst_b in others)
+
+    @staticmethod
+    def get_pair_key(obj_type, other_type, inst_a, inst_b):
+        """Return a pair, without its order if both instances have the same type."""
+        if obj_type is other_type:
+            return frozenset((inst_a, inst_b))
+        return (inst_a, inst_b)
+
+    def get_grid_pairs(self, obj_type, other_type, cell_size):
+        """Return the colliding pairs found through a collision grid."""
+        self.game_engine.collision_grid = spatial_hash.SpatialHash(cell_size)
+        for a_type in (self.obj_a, self.obj_b):
+            a_type.index_instances(self.game_engine.collision_grid)
+        pairs = [self.get_pair_key(obj_type, other_type, inst_a, inst_b)
+                 for inst_a, inst_b in obj_type._find_collided_pairs(other_type)]
+        # each pair is found once
+        self.assertEqual(len(pairs), len(set(pairs)))
+        return set(pairs)
+
+    def test_045grid_finds_groupcollide_pairs(self):
+        """
+        Test that the collision grid finds the same colliding pairs as testing
+        every pair of instances, whatever its cell size.
+        """
+        type_pairs = ((self.obj_a, self.obj_b), (self.obj_a, self.obj_a),
+                      (self.obj_b, self.obj_b))
+        for obj_type, other_type in type_pairs:
+            expected = self.get_groupcollide_pairs(obj_type, other_type)
+            self.assertTrue(len(expected) > 0)
+            for cell_size in (8, 64, 1000):
+                self.assertEqual(self.get_grid_pairs(obj_type, other_type, cell_size),
+                                 expected)
+
+    def test_050cell_size_setting(self):
+        """Test that the collision_cell_size game setting sizes the grid's cells."""
+        self.assertEqual(self.game_engine.collision_grid.cell_size,
+                         spatial_hash.SpatialHash.DEFAULT_CELL_SIZE)
+        game_engine = headless_game.make_game_engine(collision_cell_size=16)
+        self.assertEqual(game_engine.collision_grid.cell_size, 16)
+
+
+class TestStaticCollisionTree(unittest.TestCase):
+    """Unit tests for keeping stationary solid instances out of the collision grid."""
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_wall = headless_game.add_object_type(
+            self.game_engine, "obj_wall", solid=True,
+            events={"collision_obj_ball": headless_game.make_action_sequence()})
+        self.obj_ball = headless_game.add_object_type(
+            self.game_engine, "obj_ball",
+            events={"collision_obj_wall": headless_game.make_action_sequence()})
+        self.walls = [self.obj_wall.create_instance(self.game_engine.draw_surface,
+                                                    position=(xpos, 200))
+                      for xpos in (100, 132, 164, 400)]
+        self.ball = self.obj_ball.create_instance(self.game_engine.draw_surface,
+                                                  position=(132, 150), speed=10,
+                                                  direction=180)
+        self.received = []
+        for event_name in ("collision_obj_ball", "collision_obj_wall"):
+            self.game_engine.event_engine.register_event_handler(event_name,
+                                                                 self.received.append)
+        self.wall_queries = []
+        nearby_instances = self.obj_wall._nearby_instances
+
+        def recorded_nearby_instances(instance, other_obj):
+            """Record the wall looking for nearby instances, then find them."""
+            self.wall_queries.append(instance)
+            return nearby_instances(instance, other_obj)
+        self.obj_wall._nearby_instances = recorded_nearby_instances
+
+    def run_until_collision(self):
+        """
+        Update until the ball hits a wall, and return the collision events
+        as (name, instance, others, normal) tuples.
+        """
+        for _ in range(10):
+            self.game_engine.update()
+            if len(self.received) > 0:
+                break
+        return sorted((ev.name, ev["instance"].inst_id,
+                       [inst.inst_id for inst in ev["others"]], ev["normal"])
+                      for ev in self.received)
+
+    def test_055walls_stay_out_of_grid(self):
+        """
+        Test that loading the room puts the walls into the static tree, that
+        they never search for collisions themselves, and that the ball's
+        collisions with them are the same as without the tree.
+        """
+        self.game_engine.load_room(0)
+        self.assertEqual(set(self.walls), set(inst for inst in self.walls
+                                              if inst in self.game_engine.static_collision_tree))
+        self.assertFalse(self.ball in self.game_engine.static_collision_tree)
+        events = self.run_until_collision()
+        for wall in self.walls:
+            self.assertFalse(wall in self.game_engine.collision_grid)
+        self.assertTrue(self.ball in self.game_engine.collision_grid)
+        self.assertEqual(self.wall_queries, [])
+        # the ball landed on top of the wall below it
+        self.assertEqual([(name, inst_id) for name, inst_id, others, normal in events],
+                         [("collision_obj_ball", self.walls[1].inst_id),
+                          ("collision_obj_wall", self.ball.inst_id)])
+        self.assertEqual(events[1][2], [self.walls[1].inst_id])
+        self.assertTrue(events[1][3][1] < 0)
+        self.assertFalse(self.ball.rect.colliderect(self.walls[1].rect))
+        # either type can be checked first
+        self.assertEqual([(inst_b, inst_a) for inst_a, inst_b in
+                          self.obj_wall._find_collided_pairs(self.obj_ball)],
+                         self.obj_ball._find_collided_pairs(self.obj_wall))
+        self.assertEqual(self.wall_queries, [])
+        static_events = events
+        static_position = self.ball.rect.topleft
+        # without the tree, the walls are found through the grid instead
+        self.setUp()
+        self.game_engine.static_collision_tree = static_bvh.StaticBVH()
+        self.assertEqual(self.run_until_collision(), static_events)
+        self.assertEqual(self.ball.rect.topleft, static_position)
+
+    def test_060moved_wall_leaves_tree(self):
+        """Test that a static instance whose position changes moves to the grid."""
+        self.game_engine.load_room(0)
+        self.game_engine.update()
+        self.walls[3].position = (400, 300)
+        self.assertTrue(self.walls[3] in self.game_engine.static_collision_tree)
+        self.game_engine.update()
+        self.assertFalse(self.walls[3] in self.game_engine.static_collision_tree)
+        self.assertTrue(self.walls[3] in self.game_engine.collision_grid)
+        # the walls that stayed put are still in the tree
+        for wall in self.walls[:3]:
+            self.assertTrue(wall in self.game_engine.static_collision_tree)
+            self.assertFalse(wall in self.game_engine.collision_grid)
+
+
+# run from the tests directory to find the unittest_files subdirectory
+os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
+
+headless_game.init_display()
+unittest.main()
+pygame.quit()
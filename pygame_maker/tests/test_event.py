@@ -93,5 +93,36 @@ class TestEvent(unittest.TestCase):
         with self.assertRaises(UnknownEventError):
             Event.get_event_instance_by_name("bogus_keyup")
 
+    def test_050slotted_events(self):
+        """
+        Test that events store only their declared attributes, and keep a
+        copy of the parameters they were created with.
+        """
+        params = {"position": (10, 20)}
+        mouse_event = MouseEvent("mouse_nobutton", params)
+        params["position"] = (0, 0)
+        self.assertEqual(mouse_event["position"], (10, 20))
+        self.assertFalse(hasattr(mouse_event, "__dict__"))
+        with self.assertRaises(AttributeError):
+            mouse_event.extra = True
+        collision_event = CollisionEvent("collision_ball")
+        self.assertEqual(collision_event.collision_object_name, "ball")
+        self.assertFalse(hasattr(collision_event, "__dict__"))
+
+    def test_055read_only_events(self):
+        """Test that a read-only event's parameters can't be changed."""
+        mouse_event = MouseEvent("mouse_nobutton", {"position": (10, 20)}).make_read_only()
+        with self.assertRaises(TypeError):
+            mouse_event["position"] = (0, 0)
+        with self.assertRaises(TypeError):
+            mouse_event.event_params.update({"extra": True})
+        with self.assertRaises(TypeError):
+            del mouse_event.event_params["position"]
+        self.assertEqual(mouse_event.event_params, {"position": (10, 20)})
+        # other events aren't affected
+        other_event = MouseEvent("mouse_nobutton", mouse_event.event_params)
+        other_event["position"] = (0, 0)
+        self.assertEqual(mouse_event["position"], (10, 20))
+
 unittest.main()
 
@@ -9,7 +9,7 @@ Unit test the pygame_maker.events.event_engine module.
 
 import unittest
 import logging
-from pygame_maker.events.event import StepEvent, MouseEvent
+from pygame_maker.events.event import StepEvent, MouseEvent, OtherEvent
 from pygame_maker.events.event_engine import EventEngine
 
 EELOGGER = logging.getLogger("EventEngine")
@@ -84,5 +84,119 @@ class TestEventEngine(unittest.TestCase):
         ]
         self.assertEqual(self.called_events, expected_calls)
 
+    def test_015handler_changes_between_transmits(self):
+        """
+        Test that registering and unregistering handlers changes which
+        handlers receive the next transmitted events, and that transmitting
+        an event with nothing queued does nothing.
+        """
+        self.called_events = []
+        hdlr1 = lambda name: self.event_handler(name, 'hdlr1')
+        hdlr2 = lambda name: self.event_handler(name, 'hdlr2')
+        self.event_engine.register_event_handler('normal_step', hdlr1)
+        self.event_engine.transmit_event('normal_step')
+        self.event_engine.queue_event(StepEvent('normal_step'))
+        self.event_engine.transmit_event('normal_step')
+        self.event_engine.register_event_handler('normal_step', hdlr2)
+        self.event_engine.unregister_event_handler('normal_step', hdlr1)
+        self.event_engine.queue_event(StepEvent('normal_step'))
+        self.event_engine.transmit_event('normal_step')
+        expected_calls = [
+            '<StepEvent "normal_step"> hdlr1',
+            '<StepEvent "normal_step"> hdlr2'
+        ]
+        self.assertEqual(self.called_events, expected_calls)
+        self.assertTrue('normal_step' not in self.event_engine.event_queues)
+
+    def test_020batch_handler_receives_event_list(self):
+        """
+        Test that a handler registered with a batch handler receives all
+        queued events in one call, that other handlers of the same event still
+        receive them one at a time, and that events queued during a batch are
+        delivered in a following batch.
+        """
+        self.called_events = []
+        batches = []
+        hdlr1 = lambda name: self.event_handler(name, 'hdlr1')
+        hdlr2 = lambda name: self.event_handler(name, 'hdlr2')
+
+        def batch_hdlr(events):
+            batches.append([str(ev) for ev in events])
+            if len(batches) == 1:
+                self.event_engine.queue_event(StepEvent('normal_step', {'round': 2}))
+
+        self.event_engine.register_event_handler('normal_step', hdlr1, batch_hdlr)
+        self.event_engine.register_event_handler('normal_step', hdlr2)
+        self.event_engine.queue_event(StepEvent('normal_step'))
+        self.event_engine.queue_event(StepEvent('normal_step'))
+        self.event_engine.transmit_event('normal_step')
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(len(batches[0]), 2)
+        self.assertEqual(len(batches[1]), 1)
+        self.assertEqual(len(self.called_events), 3)
+        self.assertTrue(all(call.endswith('hdlr2') for call in self.called_events))
+        self.assertTrue('normal_step' not in self.event_engine.event_queues)
+        # without a batch handler, events go back to single delivery
+        self.event_engine.unregister_event_handler('normal_step', hdlr1)
+        self.event_engine.register_event_handler('normal_step', hdlr1)
+        self.called_events = []
+        self.event_engine.queue_event(StepEvent('normal_step'))
+        self.event_engine.transmit_event('normal_step')
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(len(self.called_events), 2)
+
+    def test_025events_without_handlers(self):
+        """
+        Test that has_handlers() follows handler registration, and that
+        transmitting events nothing handles discards them instead of leaving
+        them queued.
+        """
+        hdlr1 = lambda name: self.event_handler(name, 'hdlr1')
+        self.assertFalse(self.event_engine.has_handlers('kb_no_key'))
+        self.event_engine.register_event_handler('kb_no_key', hdlr1)
+        self.assertTrue(self.event_engine.has_handlers('kb_no_key'))
+        self.event_engine.unregister_event_handler('kb_no_key', hdlr1)
+        self.assertFalse(self.event_engine.has_handlers('kb_no_key'))
+        self.event_engine.queue_event(StepEvent('end_step'))
+        self.event_engine.transmit_event('end_step')
+        self.assertTrue('end_step' not in self.event_engine.event_queues)
+        self.assertEqual(self.called_events, [])
+
+    def test_030unhashable_handler_beside_batch_handler(self):
+        """
+        Test that handlers that can't be hashed, such as a list's append
+        method, can share an event name with a batch handler.
+        """
+        received = []
+        batches = []
+        self.event_engine.register_event_handler('outside_room', received.append)
+        self.event_engine.register_event_handler('outside_room', lambda name: None,
+                                                 batches.append)
+        self.event_engine.queue_event(OtherEvent('outside_room'))
+        self.event_engine.queue_event(OtherEvent('outside_room'))
+        self.event_engine.transmit_event('outside_room')
+        self.assertEqual(len(received), 2)
+        self.assertEqual([len(batch) for batch in batches], [2])
+        self.event_engine.unregister_event_handler('outside_room', received.append)
+        self.event_engine.queue_event(OtherEvent('outside_room'))
+        self.event_engine.transmit_event('outside_room')
+        self.assertEqual(len(received), 2)
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+
+    def test_035discard_instance_events(self):
+        """Test that only the queued events sent to an instance are discarded."""
+        received = []
+        inst_a = object()
+        inst_b = object()
+        self.event_engine.register_event_handler('outside_room', received.append)
+        self.event_engine.queue_event(OtherEvent('outside_room', {'instance': inst_a}))
+        self.event_engine.queue_event(OtherEvent('outside_room', {'instance': inst_b}))
+        self.event_engine.queue_event(OtherEvent('outside_room', {'instance': inst_a}))
+        self.event_engine.queue_event(StepEvent('begin_step', {'instance': inst_a}))
+        self.event_engine.discard_instance_events(inst_a)
+        self.assertTrue('begin_step' not in self.event_engine.event_queues)
+        self.event_engine.transmit_event('outside_room')
+        self.assertEqual([ev['instance'] for ev in received], [inst_b])
+
 unittest.main()
 
@@ -0,0 +1,55 @@
+#!/usr/bin/python -W all
+"""
+Author: Ron Lockwood-Childs
+
+Licensed under LGPL v2.1 (see file COPYING for details)
+
+Unit test the pygame_maker.support.flat_tree module.
+"""
+
+import unittest
+from pygame_maker.support.flat_tree import FlatTree
+
+
+TREE = {
+    "root": ["a", "b"],
+    "a": ["a1", "a2"],
+    "a1": ["a1x"],
+    "a2": [],
+    "a1x": [],
+    "b": ["b1"],
+    "b1": [],
+}
+
+
+class TestFlatTree(unittest.TestCase):
+    """Unit tests for the flat_tree module."""
+
+    def test_005parents_come_before_children(self):
+        """
+        Verify items are flattened depth-first, in child order, with each
+        subtree filling a contiguous range.
+        """
+        tree = FlatTree("root", lambda item: TREE[item])
+        self.assertEqual(tree.items, ["root", "a", "a1", "a1x", "a2", "b", "b1"])
+        self.assertEqual(tree.parents, [-1, 0, 1, 2, 1, 0, 5])
+        self.assertEqual(tree.subtree_ends, [7, 5, 4, 4, 5, 7, 7])
+        self.assertEqual(tree.index("b"), 5)
+        self.assertIsNone(tree.index("c"))
+        self.assertIn("a1x", tree)
+        self.assertEqual(len(tree), 7)
+
+    def test_010subtree_indices(self):
+        """
+        Verify the indices of overlapping subtrees are listed once, in order,
+        and items outside the tree are ignored.
+        """
+        tree = FlatTree("root", lambda item: TREE[item])
+        self.assertEqual(list(tree.get_subtree_indices(["b", "a1", "a", "c"])),
+                         [1, 2, 3, 4, 5, 6])
+        self.assertEqual(list(tree.get_subtree_indices(["a2"])), [4])
+        self.assertEqual(list(tree.get_subtree_indices([])), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
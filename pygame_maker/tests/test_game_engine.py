@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+"""
+Author: Ron Lockwood-Childs
+
+Licensed under LGPL v2.1 (see file COPYING for details)
+
+Unit test the GameEngine class.
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+import pygame
+from pygame_maker.actors import object_type
+import headless_game
+
+
+class TestSimulationSteps(unittest.TestCase):
+    """Unit tests for running the game logic at a fixed simulation rate."""
+
+    def make_game(self, **game_settings):
+        """Create a game engine with one ball moving right 10 pixels per step."""
+        self.game_engine = headless_game.make_game_engine(**game_settings)
+        self.obj_ball = headless_game.add_object_type(self.game_engine, "obj_ball")
+        self.ball = self.obj_ball.create_instance(self.game_engine.draw_surface,
+                                                  position=(100, 100), speed=10, direction=90)
+        self.game_engine.start_simulation()
+
+    def test_005update_every_frame(self):
+        """Test that without a simulation rate, every frame runs one update."""
+        self.make_game()
+        self.assertEqual(self.game_engine.simulate(0), 1)
+        self.assertEqual(self.game_engine.simulate(100), 1)
+        self.assertEqual(self.ball.rect.x, 120)
+        self.assertTrue(self.game_engine.render_fraction is None)
+
+    def test_010steps_per_frame(self):
+        """Test that each frame runs the steps that fit into the time passed."""
+        self.make_game(simulation_rate=50)
+        # the first frame always has one step
+        self.assertEqual(self.game_engine.simulate(0), 1)
+        self.assertEqual(self.game_engine.simulate(10), 0)
+        self.assertEqual(self.game_engine.simulate(10), 1)
+        # 45ms holds two 20ms steps, and the rest is kept for later
+        self.assertEqual(self.game_engine.simulate(45), 2)
+        self.assertEqual(self.game_engine.simulate(15), 1)
+        self.assertEqual(self.ball.rect.x, 150)
+        self.assertTrue(self.game_engine.render_fraction is None)
+
+    def test_015catch_up_limit(self):
+        """Test that a slow frame runs at most max_catch_up_steps steps."""
+        self.make_game(simulation_rate=50, max_catch_up_steps=3)
+        self.game_engine.simulate(0)
+        self.assertEqual(self.game_engine.simulate(1000), 3)
+        # the time that couldn't be caught up with is dropped
+        self.assertEqual(self.game_engine.simulate(0), 0)
+        self.assertEqual(self.game_engine.simulate(20), 1)
+        self.assertEqual(self.ball.rect.x, 150)
+
+    def test_020interpolated_draw(self):
+        """
+        Test that instances are drawn between their previous and latest
+        steps, and are put back where the simulation left them.
+        """
+        self.make_game(simulation_rate=50, interpolate_rendering=True)
+        drawn_positions = []
+        group_draw = self.obj_ball.group.draw
+
+        def recorded_draw(surface):
+            """Record where the ball is drawn, then draw the group."""
+            drawn_positions.append(self.ball.rect.topleft)
+            return group_draw(surface)
+        self.obj_ball.group.draw = recorded_draw
+        self.game_engine.simulate(0)
+        self.assertEqual(self.game_engine.render_fraction, 0.0)
+        self.game_engine.draw_objects()
+        self.game_engine.simulate(10)
+        self.assertEqual(self.game_engine.render_fraction, 0.5)
+        self.game_engine.draw_objects()
+        self.assertEqual(drawn_positions, [(100, 100), (105, 100)])
+        self.assertEqual(self.ball.rect.topleft, (110, 100))
+
+    def test_025failed_draw_restores_positions(self):
+        """Test that instances are put back even if drawing fails."""
+        self.make_game(simulation_rate=50, interpolate_rendering=True)
+
+        def failed_draw(surface):
+            """Fail to draw the group."""
+            raise pygame.error("draw failed")
+        self.obj_ball.group.draw = failed_draw
+        self.game_engine.simulate(0)
+        self.game_engine.simulate(10)
+        self.assertRaises(pygame.error, self.game_engine.draw_objects)
+        self.assertEqual(self.ball.rect.topleft, (110, 100))
+
+
+class TestSpriteMaskCache(unittest.TestCase):
+    """Unit tests for the sprite_mask_cache game setting."""
+
+    SPRITE_YAML = """\
+- spr_ball:
+    filename: ball2.png
+    collision_type: precise
+"""
+
+    def setUp(self):
+        self.game_dir = tempfile.mkdtemp(dir="/tmp")
+        os.mkdir(os.path.join(self.game_dir, "sprites"))
+        shutil.copy(os.path.join(headless_game.UNITTEST_FILES_DIR, "ball2.png"),
+                    os.path.join(self.game_dir, "sprites"))
+        with open(os.path.join(self.game_dir, "sprites", "sprites.yaml"), "w") as sprite_f:
+            sprite_f.write(self.SPRITE_YAML)
+
+    def tearDown(self):
+        shutil.rmtree(self.game_dir)
+
+    def load_sprite(self, **game_settings):
+        """Create a game engine in the game directory, and load its sprite."""
+        game_engine = headless_game.make_game_engine(game_dir=self.game_dir, **game_settings)
+        sprite = game_engine.resources['sprites']['spr_ball']
+        return game_engine, sprite
+
+    def setup_sprite(self, game_engine):
+        """Load the game's sprite images, from the game directory."""
+        topdir = os.getcwd()
+        os.chdir(self.game_dir)
+        try:
+            game_engine.setup_game_resources()
+        finally:
+            os.chdir(topdir)
+
+    def test_030cache_off_by_default(self):
+        """Test that sprites don't use the mask cache unless it's enabled."""
+        game_engine, sprite = self.load_sprite()
+        self.assertFalse(sprite.use_mask_cache)
+        self.setup_sprite(game_engine)
+        self.assertFalse(os.path.exists(os.path.join(self.game_dir,
+                                                     sprite.get_mask_cache_filename())))
+
+    def test_035cached_masks_reloaded(self):
+        """
+        Test that the setting reaches the game's sprites, and that a second
+        game reads back the masks the first one cached.
+        """
+        game_engine, sprite = self.load_sprite(sprite_mask_cache=True)
+        self.assertTrue(sprite.use_mask_cache)
+        self.setup_sprite(game_engine)
+        self.assertTrue(os.path.exists(os.path.join(self.game_dir,
+                                                    sprite.get_mask_cache_filename())))
+        game_engine, cached_sprite = self.load_sprite(sprite_mask_cache=True)
+
+        def no_masks_created():
+            """Fail if the masks aren't read from the cache."""
+            raise AssertionError("masks were created instead of read from the cache")
+        cached_sprite._create_subimage_masks = no_masks_created
+        self.setup_sprite(game_engine)
+        self.assertEqual(cached_sprite.bounding_box_rect, sprite.bounding_box_rect)
+        mask = sprite.subimage_info["masks"][0]
+        cached_mask = cached_sprite.subimage_info["masks"][0]
+        self.assertEqual(cached_mask.get_size(), mask.get_size())
+        self.assertEqual(cached_mask.count(), mask.count())
+        self.assertEqual(cached_mask.overlap_area(mask, (0, 0)), mask.count())
+
+
+class TestInstanceMemory(unittest.TestCase):
+    """Unit tests for measuring the memory used by instances."""
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.obj_ball = headless_game.add_object_type(self.game_engine, "obj_ball")
+        self.obj_wall = headless_game.add_object_type(self.game_engine, "obj_wall")
+        self.balls = [self.obj_ball.create_instance(self.game_engine.draw_surface,
+                                                    position=(40 * idx, 100))
+                      for idx in range(3)]
+
+    def test_040memory_report(self):
+        """
+        Test that the report lists the object types that have instances,
+        with their average instance size.
+        """
+        report = self.game_engine.get_instance_memory_report()
+        self.assertEqual(report.keys(), ["obj_ball"])
+        sizes = [object_type.get_instance_size(ball) for ball in self.balls]
+        self.assertEqual(report["obj_ball"], sum(sizes) // len(sizes))
+        self.assertTrue(report["obj_ball"] > 0)
+
+    def test_045slimmed_instance_smaller(self):
+        """
+        Test that an instance holding only its own state measures fewer
+        bytes than one holding its own copy of the default symbols and
+        action handlers.
+        """
+        slim_ball, full_ball = self.balls[:2]
+        # store every default symbol in the table, and keep bound action
+        #  handlers on the instance, as instances once did
+        for name in full_ball.INSTANCE_SYMBOLS.keys():
+            full_ball.symbols[name] = full_ball.INSTANCE_SYMBOLS[name]
+        full_ball.action_name_to_method_map = dict(
+            (action_name, getattr(full_ball, method_name))
+            for action_name, method_name in full_ball.ACTION_METHODS.items())
+        self.assertTrue(object_type.get_instance_size(slim_ball) <
+                        object_type.get_instance_size(full_ball))
+
+
+class TestFrameEvents(unittest.TestCase):
+    """Unit tests for the events the game engine reuses every frame."""
+
+    def setUp(self):
+        self.game_engine = headless_game.make_game_engine()
+        self.received = []
+
+    def change_event(self, an_event):
+        """Record the event, then try to change its parameters."""
+        self.received.append((an_event, dict(an_event.event_params)))
+        with self.assertRaises(TypeError):
+            an_event["leaked"] = True
+
+    def test_050step_event_unchanged(self):
+        """
+        Test that handlers can't change the step event seen by later
+        handlers and frames.
+        """
+        event_engine = self.game_engine.event_engine
+        event_engine.register_event_handler("normal_step", self.change_event)
+        event_engine.register_event_handler("normal_step", self.change_event)
+        self.game_engine.update()
+        self.game_engine.update()
+        self.assertEqual(len(self.received), 4)
+        # the same event is sent every time, and no handler's change got in
+        self.assertEqual(len(set(id(an_event) for an_event, params in self.received)), 1)
+        self.assertEqual([params for an_event, params in self.received], [{}] * 4)
+
+    def test_055nobutton_event_follows_mouse(self):
+        """
+        Test that the reused nobutton events report the latest mouse
+        position, which handlers can't change.
+        """
+        self.game_engine.event_engine.register_event_handler("mouse_nobutton",
+                                                             self.change_event)
+        self.game_engine.send_mouse_event(None)
+        self.game_engine.send_mouse_event(pygame.event.Event(pygame.MOUSEMOTION,
+                                                             pos=(30, 40)))
+        self.game_engine.send_mouse_event(None)
+        self.assertEqual([params for an_event, params in self.received],
+                         [{"position": (0, 0)}, {"position": (30, 40)}])
+        self.assertEqual(self.game_engine.mouse_pos, [30, 40])
+
+
+# run from the tests directory to find the unittest_files subdirectory
+os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
+
+headless_game.init_display()
+unittest.main()
+pygame.quit()
@@ -344,6 +344,70 @@ sym4 = 42
         expected_changes = [{'sym1': 24}, {'sym3': 25}, {'sym4': 42}]
         self.assertEqual(self.symbol_change_list, expected_changes)
 
+    def test_057shared_symbols(self):
+        """
+        Test that symbol tables read shared defaults until a symbol is set,
+        and never write to the shared defaults.
+        """
+        language_engine = LanguageEngine()
+        language_engine.register_code_block("testA", "speed = speed + 1\nx = 5")
+        defaults = {"speed": 2, "friction": 0.5}
+        table_a = SymbolTable(shared_symbols=defaults)
+        table_b = SymbolTable(shared_symbols=defaults)
+        language_engine.execute_code_block("testA", table_a)
+        self.assertEqual(table_a['speed'], 3)
+        self.assertEqual(table_a['friction'], 0.5)
+        self.assertEqual(table_b['speed'], 2)
+        self.assertEqual(defaults, {"speed": 2, "friction": 0.5})
+        self.assertEqual(table_a.vars, {"speed": 3, "x": 5})
+        self.assertEqual(sorted(table_a.keys()), ["friction", "speed", "x"])
+
+    def test_060region_query_functions(self):
+        """Test that region query functions count instances found by the game engine."""
+        class QueryEngine(object):
+            """Stand-in for the game engine's region queries."""
+            def __init__(self):
+                self.queries = []
+
+            def get_instances_at_point(self, point, object_types=None):
+                self.queries.append(("point", point, object_types))
+                return ["inst1"]
+
+            def get_instances_in_rect(self, rect, object_types=None):
+                self.queries.append(("rect", rect, object_types))
+                return ["inst1", "inst2"]
+
+            def get_instances_in_circle(self, center, radius, object_types=None):
+                self.queries.append(("circle", center, radius, object_types))
+                return ["inst1", "inst2", "inst3"]
+
+        language_engine = LanguageEngine()
+        language_engine.register_code_block("testA", """
+a = instance_count_at(10, 20)
+b = instance_count_in_rect(0, 5, 30, 40)
+c = instance_count_in_circle(50, 60, 8)
+d = object_count_at("obj_wall", 1, 2)
+        """)
+        # without a game engine, nothing is found
+        test_locals = SymbolTable()
+        language_engine.execute_code_block("testA", test_locals)
+        self.assertEqual(test_locals.vars, {"a": 0, "b": 0, "c": 0, "d": 0})
+        query_engine = QueryEngine()
+        language_engine.region_queries = {
+            "get_instances_at_point": query_engine.get_instances_at_point,
+            "get_instances_in_rect": query_engine.get_instances_in_rect,
+            "get_instances_in_circle": query_engine.get_instances_in_circle
+        }
+        test_locals = SymbolTable()
+        language_engine.execute_code_block("testA", test_locals)
+        self.assertEqual(test_locals.vars, {"a": 1, "b": 2, "c": 3, "d": 1})
+        self.assertEqual(query_engine.queries, [
+            ("point", (10, 20), None),
+            ("rect", (0, 5, 30, 40), None),
+            ("circle", (50, 60), 8, None),
+            ("point", (1, 2), ["obj_wall"])
+        ])
+
 # run from the tests directory to find the unittest_files subdirectory
 os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
 
@@ -0,0 +1,73 @@
+#!/usr/bin/python -W all
+"""
+Author: Ron Lockwood-Childs
+
+Licensed under LGPL v2.1 (see file COPYING for details)
+
+Unit test the pygame_maker.support.motion_arrays module.
+"""
+
+import math
+import unittest
+import numpy as np
+from pygame_maker.support.motion_arrays import MotionArrays
+
+
+def motion_values(xpos, ypos, speed, direction, friction=0.0):
+    """Return a row of motion values, with hspeed and vspeed filled in."""
+    hspeed = speed * math.sin(direction / 180.0 * math.pi)
+    vspeed = speed * -1 * math.cos(direction / 180.0 * math.pi)
+    return [xpos, ypos, speed, direction, hspeed, vspeed, friction, 0.0, 0.0]
+
+
+class TestMotionArrays(unittest.TestCase):
+    """Unit tests for the motion_arrays module."""
+
+    def test_005add_remove_keeps_slots_packed(self):
+        """
+        Verify removing an item moves the last item into the freed slot,
+        along with its stored values.
+        """
+        arrays = MotionArrays(capacity=2)
+        for idx, name in enumerate(("a", "b", "c")):
+            arrays.store(name, motion_values(idx * 10.0, 0.0, 0.0, 0.0))
+        self.assertEqual(len(arrays), 3)
+        self.assertEqual(arrays.add("b"), 1)
+        arrays.remove("a")
+        self.assertNotIn("a", arrays)
+        self.assertEqual(arrays.items, ["c", "b"])
+        self.assertEqual(arrays.get_slot("c"), 0)
+        self.assertEqual(arrays.load("c")[0], 20.0)
+        self.assertEqual(list(arrays.column("x")), [20.0, 10.0])
+        arrays.remove("a")
+        self.assertEqual(len(arrays), 2)
+
+    def test_010integrate_matches_instance_update(self):
+        """
+        Verify a vectorised step moves items and rounds their positions the
+        same way an ObjectInstance update() does, and applies friction only
+        to the items that are moving.
+        """
+        arrays = MotionArrays()
+        arrays.store("a", motion_values(0.0, 0.0, 2.5, 90.0, friction=1.0))
+        arrays.store("b", motion_values(5.0, 5.0, 1.0, 45.0))
+        arrays.store("c", motion_values(7.0, 7.0, 0.0, 0.0, friction=1.0))
+        slots = np.array([0, 1])
+        rounded_x, rounded_y = arrays.integrate(slots)
+        self.assertEqual(rounded_x, [3, 6])
+        self.assertEqual(rounded_y, [0, 4])
+        slowed = arrays.apply_friction(np.array([0, 1, 2]))
+        self.assertEqual(list(slowed), [0])
+        xpos, _, speed, _, hspeed, vspeed = arrays.load("a")[:6]
+        self.assertEqual(xpos, 2.5)
+        self.assertEqual(speed, 1.5)
+        self.assertAlmostEqual(hspeed, 1.5)
+        self.assertAlmostEqual(vspeed, 0.0)
+        arrays.apply_friction(slots)
+        arrays.apply_friction(slots)
+        self.assertEqual(arrays.load("a")[2], 0.0)
+        self.assertEqual(arrays.load("c")[:2], [7.0, 7.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
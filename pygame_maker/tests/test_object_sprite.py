@@ -7,12 +7,15 @@ Licensed under LGPL v2.1 (see file COPYING for details)
 Unit test the pygame_maker.actors.object_sprite module.
 """
 
+import math
 import unittest
 import tempfile
+import shutil
 import sys
 import os
 import pygame
 from pygame_maker.actors.object_sprite import ObjectSprite, ObjectSpriteException
+from pygame_maker.actors import object_sprite
 
 
 class DummyGameEngine(object):
@@ -24,6 +27,45 @@ class DummyGameEngine(object):
         print message
 
 
+def pixel_mask_from_surface(surface, threshold=127):
+    """The original pixel-by-pixel mask_from_surface(), for comparison."""
+    mask = pygame.mask.Mask(surface.get_size())
+    key = surface.get_colorkey()
+    if key:
+        for row in range(surface.get_height()):
+            for col in range(surface.get_width()):
+                if surface.get_at((col, row)) != key:
+                    mask.set_at((col, row), 1)
+    else:
+        for row in range(surface.get_height()):
+            for col in range(surface.get_width()):
+                if surface.get_at((col, row))[3] > threshold:
+                    mask.set_at((col, row), 1)
+    return mask
+
+
+def pixel_disk_radius(precise_mask, orig_rect, bound_rect):
+    """The original pixel-by-pixel get_disk_radius(), for comparison."""
+    disk_mask_center = (orig_rect.width/2, orig_rect.height/2)
+    left_center_distance = abs(disk_mask_center[0]-bound_rect.x)
+    right_center_distance = abs(disk_mask_center[0]-bound_rect.right)
+    top_center_distance = abs(disk_mask_center[1]-bound_rect.y)
+    bottom_center_distance = abs(disk_mask_center[1]-bound_rect.bottom)
+    max_bound_radius = math.sqrt(max(left_center_distance, right_center_distance)**2 +
+                                 max(top_center_distance, bottom_center_distance)**2)
+    max_r = 0
+    for row in range(bound_rect.y, bound_rect.height):
+        for col in range(bound_rect.x, bound_rect.width):
+            if precise_mask.get_at((col, row)) > 0:
+                rad = math.sqrt((disk_mask_center[0]-col)**2 + (disk_mask_center[1]-row)**2)
+                if rad > max_r:
+                    max_r = rad
+    bound_radius = max_bound_radius
+    if (max_r > 0) and (max_r < max_bound_radius):
+        bound_radius = max_r
+    return int(math.ceil(bound_radius))
+
+
 class TestSprite(unittest.TestCase):
     """
     Unit tests for the ObjectSprite class.
@@ -200,6 +242,139 @@ class TestSprite(unittest.TestCase):
         os.unlink(tmpf_info[1])
         self.assertEqual(self.good_sprite, new_sprite)
 
+    def test_035masks_match_pixel_masks(self):
+        """
+        Test that masks and disk radii match the ones found by checking each
+        pixel, for the sample images.
+        """
+        def assert_masks_equal(mask_a, mask_b):
+            self.assertEqual(mask_a.get_size(), mask_b.get_size())
+            self.assertEqual(mask_a.count(), mask_b.count())
+            self.assertEqual(mask_a.overlap_area(mask_b, (0, 0)), mask_a.count())
+
+        surfaces = []
+        for image_file in ("Ball.png", "ball2.png", "pokey.png", "solid.png",
+                           "spaceship_strip07.png"):
+            image = pygame.image.load(os.path.join("unittest_files", image_file))
+            surfaces.append(image.convert_alpha())
+            keyed_image = image.convert()
+            keyed_image.set_colorkey(keyed_image.get_at((0, 0)))
+            surfaces.append(keyed_image)
+        strip = ObjectSprite("spr_strip", filename="unittest_files/spaceship_strip07.png")
+        strip.load_graphic()
+        surfaces.extend(strip.subimages)
+        for surface in surfaces:
+            for threshold in (0, 127, 254):
+                assert_masks_equal(object_sprite.mask_from_surface(surface, threshold),
+                                   pixel_mask_from_surface(surface, threshold))
+            precise_mask = pixel_mask_from_surface(surface)
+            orig_rect = surface.get_rect()
+            for bound_rect in (surface.get_bounding_rect(), orig_rect,
+                               pygame.Rect(1, 1, orig_rect.width - 2, orig_rect.height - 2)):
+                radius = pixel_disk_radius(precise_mask, orig_rect, bound_rect)
+                self.assertEqual(object_sprite.get_disk_radius(precise_mask, orig_rect,
+                                                               bound_rect), radius)
+                self.assertEqual(object_sprite.get_disk_radius(
+                    precise_mask, orig_rect, bound_rect,
+                    object_sprite.get_surface_mask_bits(surface)), radius)
+                disk_surface = pygame.Surface(orig_rect.size, depth=8)
+                disk_surface.set_colorkey(pygame.Color("#000000"))
+                disk_surface.fill(pygame.Color("#000000"))
+                pygame.draw.circle(disk_surface, pygame.Color("#ffffff"),
+                                   (orig_rect.width / 2, orig_rect.height / 2), radius)
+                assert_masks_equal(object_sprite.create_disk_mask(orig_rect, radius),
+                                   pixel_mask_from_surface(disk_surface))
+
+    def test_040mask_cache(self):
+        """
+        Test that masks and bounding rects are restored from the mask cache
+        file, and recreated when the image or settings change.
+        """
+        def assert_sprites_match(sprite_a, sprite_b):
+            self.assertEqual(sprite_a.bounding_box_rect, sprite_b.bounding_box_rect)
+            self.assertEqual(sprite_a.subimage_info["bbox_rects"],
+                             sprite_b.subimage_info["bbox_rects"])
+            self.assertEqual(sprite_a.subimage_info["radii"], sprite_b.subimage_info["radii"])
+            for mask_a, mask_b in zip(sprite_a.subimage_info["masks"],
+                                      sprite_b.subimage_info["masks"]):
+                self.assertEqual(mask_a.get_size(), mask_b.get_size())
+                self.assertEqual(mask_a.count(), mask_b.count())
+                self.assertEqual(mask_a.overlap_area(mask_b, (0, 0)), mask_a.count())
+
+        def no_masks_created():
+            raise AssertionError("masks were created instead of read from the cache")
+
+        tmp_dir = tempfile.mkdtemp(dir="/tmp")
+        try:
+            for image_file, collision_type in (("spaceship_strip07.png", "precise"),
+                                               ("Ball.png", "disk")):
+                cached_image = os.path.join(tmp_dir, image_file)
+                shutil.copy(os.path.join("unittest_files", image_file), cached_image)
+                uncached = ObjectSprite("spr_uncached", filename=cached_image,
+                                        collision_type=collision_type)
+                uncached.load_graphic()
+                first = ObjectSprite("spr_first", filename=cached_image,
+                                     collision_type=collision_type)
+                first.use_mask_cache = True
+                first.load_graphic()
+                self.assertTrue(os.path.exists(first.get_mask_cache_filename()))
+                assert_sprites_match(first, uncached)
+                second = ObjectSprite("spr_second", filename=cached_image,
+                                      collision_type=collision_type)
+                second.use_mask_cache = True
+                second._create_subimage_masks = no_masks_created
+                second.load_graphic()
+                assert_sprites_match(second, uncached)
+                # a different collision type needs new masks
+                rect_sprite = ObjectSprite("spr_rect", filename=cached_image,
+                                           collision_type="rectangle")
+                rect_sprite.use_mask_cache = True
+                rect_sprite.load_graphic()
+                rect_uncached = ObjectSprite("spr_rect_uncached", filename=cached_image,
+                                             collision_type="rectangle")
+                rect_uncached.load_graphic()
+                assert_sprites_match(rect_sprite, rect_uncached)
+            # a changed image needs new masks
+            disk_sprite = ObjectSprite("spr_disk", filename=os.path.join(tmp_dir, "Ball.png"),
+                                       collision_type="disk")
+            disk_sprite.use_mask_cache = True
+            disk_sprite.load_graphic()
+            shutil.copy(os.path.join("unittest_files", "ball2.png"),
+                        os.path.join(tmp_dir, "Ball.png"))
+            changed = ObjectSprite("spr_changed", filename=os.path.join(tmp_dir, "Ball.png"),
+                                   collision_type="disk")
+            changed.use_mask_cache = True
+            changed.load_graphic()
+            changed_uncached = ObjectSprite("spr_changed_uncached",
+                                            filename=os.path.join(tmp_dir, "Ball.png"),
+                                            collision_type="disk")
+            changed_uncached.load_graphic()
+            assert_sprites_match(changed, changed_uncached)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_045failed_mask_cache_write(self):
+        """
+        Test that a mask cache file that can't be written leaves no temporary
+        file behind.
+        """
+        tmp_dir = tempfile.mkdtemp(dir="/tmp")
+        try:
+            cached_image = os.path.join(tmp_dir, "Ball.png")
+            shutil.copy(os.path.join("unittest_files", "Ball.png"), cached_image)
+            sprite = ObjectSprite("spr_unwritable", filename=cached_image,
+                                  collision_type="disk")
+            sprite.use_mask_cache = True
+            # a directory in the cache file's place makes the rename fail
+            os.mkdir(sprite.get_mask_cache_filename())
+            sprite.load_graphic()
+            self.assertEqual(sorted(os.listdir(tmp_dir)),
+                             sorted(["Ball.png",
+                                     os.path.basename(sprite.get_mask_cache_filename())]))
+            self.assertEqual(len(sprite.subimage_info["masks"]), 1)
+        finally:
+            shutil.rmtree(tmp_dir)
+
 # run from the tests directory to find the unittest_files subdirectory
 os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
 
@@ -0,0 +1,68 @@
+#!/usr/bin/python -W all
+"""
+Author: Ron Lockwood-Childs
+
+Licensed under LGPL v2.1 (see file COPYING for details)
+
+Unit test the pygame_maker.support.spatial_hash module.
+"""
+
+import unittest
+import pygame
+from pygame_maker.support.spatial_hash import SpatialHash
+
+
+class TestSpatialHash(unittest.TestCase):
+    """Unit tests for the spatial_hash module."""
+
+    def test_005insert_and_query(self):
+        """
+        Verify items are found by queries that share a cell with them, and
+        not by queries in distant cells.
+        """
+        grid = SpatialHash(32)
+        grid.insert("a", pygame.Rect(0, 0, 10, 10))
+        grid.insert("b", pygame.Rect(100, 100, 10, 10))
+        self.assertEqual(len(grid), 2)
+        self.assertIn("a", grid)
+        self.assertEqual(grid.query(pygame.Rect(20, 20, 5, 5)), set(["a"]))
+        self.assertEqual(grid.query(pygame.Rect(96, 96, 1, 1)), set(["b"]))
+        self.assertEqual(grid.query(pygame.Rect(200, 0, 10, 10)), set())
+
+    def test_010items_spanning_cells(self):
+        """
+        Verify an item overlapping several cells is found from each of them,
+        including cells at negative coordinates.
+        """
+        grid = SpatialHash(16)
+        grid.insert("wide", pygame.Rect(-20, 0, 60, 8))
+        for x_pos in (-20, 0, 16, 39):
+            self.assertEqual(grid.query(pygame.Rect(x_pos, 0, 1, 1)), set(["wide"]))
+        # the right edge is exclusive, so cell column 2 (x 32-47) is the last
+        self.assertEqual(grid.query(pygame.Rect(48, 0, 1, 1)), set())
+
+    def test_015update_and_remove(self):
+        """
+        Verify moving an item removes it from its old cells, and removing an
+        item leaves no trace in the grid.
+        """
+        grid = SpatialHash(10)
+        grid.insert("a", pygame.Rect(0, 0, 5, 5))
+        grid.update("a", pygame.Rect(50, 50, 5, 5))
+        self.assertEqual(grid.query(pygame.Rect(0, 0, 5, 5)), set())
+        self.assertEqual(grid.query(pygame.Rect(50, 50, 5, 5)), set(["a"]))
+        grid.remove("a")
+        grid.remove("never_added")
+        self.assertEqual(len(grid), 0)
+        self.assertEqual(grid.cells, {})
+        grid.insert("b", pygame.Rect(0, 0, 5, 5))
+        grid.clear()
+        self.assertNotIn("b", grid)
+
+    def test_020invalid_cell_size(self):
+        """Verify the cell size must be a positive integer."""
+        with self.assertRaises(ValueError):
+            SpatialHash(0)
+
+
+unittest.main()
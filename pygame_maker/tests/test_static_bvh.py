@@ -0,0 +1,65 @@
+#!/usr/bin/python -W all
+"""
+Author: Ron Lockwood-Childs
+
+Licensed under LGPL v2.1 (see file COPYING for details)
+
+Unit test the pygame_maker.support.static_bvh module.
+"""
+
+import unittest
+import pygame
+from pygame_maker.support.static_bvh import StaticBVH
+
+
+class TestStaticBVH(unittest.TestCase):
+    """Unit tests for the static_bvh module."""
+
+    def setUp(self):
+        # a row of 20 tiles, 16 pixels wide with 4 pixel gaps between them
+        self.tiles = [("tile{}".format(idx), pygame.Rect(idx * 20, 100, 16, 16))
+                      for idx in range(20)]
+
+    def test_005query_matches_brute_force(self):
+        """
+        Verify queries find exactly the items whose rects touch or overlap
+        the query rect.
+        """
+        bvh = StaticBVH(self.tiles)
+        self.assertEqual(len(bvh), 20)
+        for query_rect in (pygame.Rect(0, 0, 10, 10), pygame.Rect(30, 90, 25, 20),
+                           pygame.Rect(-50, 50, 1000, 100), pygame.Rect(16, 116, 4, 4)):
+            expected = set([name for name, rect in self.tiles
+                            if (rect.left <= query_rect.right and
+                                rect.right >= query_rect.left and
+                                rect.top <= query_rect.bottom and
+                                rect.bottom >= query_rect.top)])
+            self.assertEqual(bvh.query(query_rect), expected)
+
+    def test_010remove(self):
+        """
+        Verify removed items are no longer found, including after the tree
+        rebuilds itself.
+        """
+        bvh = StaticBVH(self.tiles)
+        bvh.remove("tile1")
+        bvh.remove("not_there")
+        self.assertNotIn("tile1", bvh)
+        self.assertEqual(bvh.query(pygame.Rect(20, 100, 1, 1)), set())
+        for idx in range(2, 15):
+            bvh.remove("tile{}".format(idx))
+        self.assertEqual(len(bvh), 6)
+        self.assertEqual(bvh.query(pygame.Rect(0, 100, 400, 16)),
+                         set(["tile0"] + ["tile{}".format(idx) for idx in range(15, 20)]))
+
+    def test_015get_bounds(self):
+        """Verify the tree keeps a copy of each item's rect."""
+        rect = pygame.Rect(5, 5, 10, 10)
+        bvh = StaticBVH([("box", rect)])
+        rect.x = 50
+        self.assertEqual(bvh.get_bounds("box"), pygame.Rect(5, 5, 10, 10))
+        self.assertIsNone(bvh.get_bounds("missing"))
+        self.assertEqual(StaticBVH().query(rect), set())
+
+
+unittest.main()